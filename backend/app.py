@@ -52,6 +52,8 @@ from services.signal_generator import SignalGenerator
 from services.ai_analytics_service import AIAnalyticsService
 from services.news_service import news_service
 from services.health_monitor import HealthMonitor
+from services.ticker_snapshot import ticker_snapshots
+from services.candle_store import candle_store
 print("[DEBUG] SignalGenerator imported OK", flush=True)
 
 # Initialize Flask app
@@ -220,6 +222,12 @@ def delayed_init():
             retry_count += 1
             time.sleep(3)
 
+    # Warm start: the kline cache reloads closed candles from disk and only fetches the gap
+    if candle_store:
+        print(f"[INIT] Candle store: {candle_store.get_stats()['series']} series on disk ({candle_store.directory})", flush=True)
+    else:
+        print("[INIT] Candle store disabled (set CANDLE_STORE_DIR to a persistent volume to enable warm restarts)", flush=True)
+
     if not pairs_loaded:
         print("[INIT] [CRITICAL] All API attempts failed. Using extended fallback pair list...", flush=True)
         # Fallback to Top 10 Major Pairs as requested
@@ -663,6 +671,23 @@ def stop_scanner():
     return jsonify({"message": "Scanner stopped", "status": "stopped"})
 
 
+@app.route("/api/scanner/mode", methods=["GET", "POST"])
+def scanner_mode():
+    """Get or switch the pair analysis mode (sequential / parallel / staged)"""
+    if request.method == "POST":
+        data = request.get_json(silent=True) or {}
+        try:
+            generator.set_scan_mode(data.get("mode", generator.scan_mode), data.get("workers"))
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+    return jsonify({
+        "mode": generator.scan_mode,
+        "workers": generator.scan_workers,
+        "last_scan": generator.scan_stats,
+        "pipeline": generator.get_pipeline_stats()
+    })
+
+
 @app.route("/api/signal/<symbol>/clear", methods=["POST"])
 def clear_signal(symbol):
     """Clear a specific signal"""
@@ -1182,8 +1207,7 @@ def get_bankroll_trades():
         open_trades = [t for t in trades if t["status"] == "OPEN"]
         if open_trades:
             print(f"[DEBUG] /api/bankroll/trades: Fetching tickers for {len(open_trades)} open trades", flush=True)
-            tickers = generator.client.get_all_tickers()
-            ticker_map = {t["symbol"]: float(t["lastPrice"]) for t in tickers if "symbol" in t and "lastPrice" in t}
+            ticker_map = ticker_snapshots.get_snapshot(client=generator.client).prices
             
             for trade in open_trades:
                 symbol = trade["symbol"]
@@ -0,0 +1,442 @@
+"""
+10D - Indicator Benchmark & Parity Harness
+Times every public function of indicator_calculator, sr_detector and
+btc_regime_tracker under every indicator backend (python / numpy / numba
+kernels), plus the cross-sectional alternatives (batch prefilter, price panel,
+streaming state, batched S/R proximity), and checks each result against the
+pure-Python reference within tolerance. Results are written as JSON so runs
+can be diffed between releases.
+
+Run from backend/:
+    python -m benchmarks.bench_indicators --output bench.json
+    python -m benchmarks.bench_indicators --full --recorded /path/to/recordings --output bench.json
+"""
+
+import argparse
+import inspect
+import json
+import math
+import platform
+import subprocess
+import sys
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import EMA_FAST_PERIOD, RS_LOOKBACK
+from services import btc_regime_tracker, indicator_calculator as ic, jit_kernels, sr_detector
+from services.batch_indicators import compute_batch
+from services.btc_regime_tracker import BTCRegimeTracker
+from services.price_panel import PricePanel
+from services.streaming_indicators import StreamingIndicatorRegistry
+from benchmarks.datasets import DAY, recorded_universe, synthetic_universe
+
+MODULES = (ic, sr_detector, btc_regime_tracker)
+
+# (name, indicator backend, numba kernels); the first one is the parity reference
+BACKENDS = (
+    ("python", "python", False),
+    ("numpy", "numpy", False),
+    ("jit", "numpy", True),
+)
+
+QUICK_GRID = {"bars": (100, 1000), "symbols": (1, 50)}
+FULL_GRID = {"bars": (100, 1000, 10_000), "symbols": (1, 50, 500)}
+
+# Above this many candles a universe reuses its series cyclically (memory bound)
+MAX_DISTINCT_CANDLES = 500_000
+
+REL_TOL = 1e-9
+ABS_TOL = 1e-9
+
+# Public API deliberately not timed, with the reason
+SKIPPED = {
+    "indicator_calculator.set_indicator_backend": "backend switch, applied around every case",
+    "indicator_calculator.get_indicator_backend": "backend switch, applied around every case",
+    "sr_detector.utc_day": "constant-time helper",
+    "sr_detector.SRLevelCache.clear": "constant-time accessor",
+    "sr_detector.SRLevelCache.get_stats": "constant-time accessor",
+    "btc_regime_tracker.BTCRegimeTracker.get_dynamic_targets": "constant-time accessor",
+    "btc_regime_tracker.BTCRegimeTracker.get_regime_info": "constant-time accessor",
+}
+SKIPPED.update({
+    f"indicator_calculator.FeatureContext.{name}": "memoized view over the calculate_*/detect_* functions timed directly"
+    for name in ("column", "closes", "ema", "macd", "rsi", "bollinger", "atr", "sfp", "ranges", "cvd",
+                 "returns", "drop_mask", "aligned_with", "return_stats")
+})
+
+
+class Alternative:
+    """Universe-wide implementation of a case: run(u) -> {symbol: value}, compared to project(reference)"""
+
+    def __init__(self, run: Callable, project: Callable = lambda r: r, tolerance: float = ABS_TOL):
+        self.run = run
+        self.project = project
+        self.tolerance = tolerance
+
+
+class Case:
+    """One public function: call(u, symbol) -> result, timed over every symbol of a universe"""
+
+    def __init__(self, name: str, call: Callable, alternatives: Optional[Dict[str, Alternative]] = None):
+        self.name = name
+        self.call = call
+        self.alternatives = alternatives or {}
+
+
+class _DailyClient:
+    """get_klines stand-in serving a universe's synthetic daily candles"""
+
+    def __init__(self, u: Dict):
+        self.u = u
+
+    def get_klines(self, symbol, interval, limit):
+        return self.u["daily"][symbol][-limit:]
+
+
+def _streaming_analysis(u: Dict) -> Dict:
+    registry = StreamingIndicatorRegistry(max_series=len(u["symbols"]) + 1)
+    out = {}
+    for s in u["symbols"]:
+        snapshot = registry.update(s, "30", u["candles"][s])
+        out[s] = ic.analyze_candles(u["candles"][s], indicators=snapshot)
+    return out
+
+
+def _streaming_regime(u: Dict) -> Dict:
+    registry = StreamingIndicatorRegistry(max_series=len(u["symbols"]) + 1)
+    return {s: BTCRegimeTracker().detect_regime(u["candles"][s], u["candles_4h"][s],
+                                                indicators=registry.update(s, "30", u["candles"][s]))
+            for s in u["symbols"]}
+
+
+def _batch_signals(u: Dict) -> Dict:
+    results = compute_batch(u["candles"], u["btc"])
+    return {s: {k: r.get(k) for k in ("ema_signal", "pullback_signal", "rsi_bb_signal", "pivot_trend",
+                                      "volume_confirmed", "judas_signal", "rsi_crossover_btc")}
+            for s, r in results.items()}
+
+
+def _analysis_signals(a: Dict) -> Dict:
+    return {
+        "ema_signal": a["ema"]["signal"],
+        "pullback_signal": a["pullback"]["signal"],
+        "rsi_bb_signal": a["rsi_bb"]["signal"],
+        "pivot_trend": a["pivot_trend"]["direction"],
+        "volume_confirmed": a["volume"]["confirmed"],
+        "judas_signal": a["institutional"]["judas_signal"],
+        "rsi_crossover_btc": a["institutional"]["rsi_crossover_btc"]["signal"]
+    }
+
+
+def _panel(u: Dict) -> PricePanel:
+    return PricePanel.build({**u["candles"], "BTCUSDT": u["btc"]}, bars=min(u["bars"], 100))
+
+
+def _pick(*keys):
+    return lambda result: {k: result[k] for k in keys}
+
+
+CASES = [
+    Case("indicator_calculator.calculate_sma", lambda u, s: ic.calculate_sma(u["closes"][s], EMA_FAST_PERIOD)),
+    Case("indicator_calculator.calculate_ema", lambda u, s: ic.calculate_ema(u["closes"][s], EMA_FAST_PERIOD)),
+    Case("indicator_calculator.calculate_macd", lambda u, s: ic.calculate_macd(u["closes"][s])),
+    Case("indicator_calculator.calculate_bollinger_bands", lambda u, s: ic.calculate_bollinger_bands(u["closes"][s])),
+    Case("indicator_calculator.calculate_rsi", lambda u, s: ic.calculate_rsi(u["closes"][s])),
+    Case("indicator_calculator.calculate_atr", lambda u, s: ic.calculate_atr(u["candles"][s])),
+    Case("indicator_calculator.calculate_cvd", lambda u, s: ic.calculate_cvd(u["trades"][s])),
+    Case("indicator_calculator.detect_ema_crossover", lambda u, s: ic.detect_ema_crossover(u["candles"][s])),
+    Case("indicator_calculator.detect_trend_4h", lambda u, s: ic.detect_trend_4h(u["candles_4h"][s])),
+    Case("indicator_calculator.detect_trend_direction", lambda u, s: ic.detect_trend_direction(u["candles"][s])),
+    Case("indicator_calculator.detect_pullback", lambda u, s: ic.detect_pullback(u["candles"][s])),
+    Case("indicator_calculator.detect_rsi_bb_reversal", lambda u, s: ic.detect_rsi_bb_reversal(u["candles"][s])),
+    Case("indicator_calculator.calculate_relative_strength",
+         lambda u, s: ic.calculate_relative_strength(u["candles"][s], u["btc"], RS_LOOKBACK),
+         {"price_panel": Alternative(lambda u: _panel(u).relative_strength())}),
+    Case("indicator_calculator.detect_rsi_crossover_vs_btc",
+         lambda u, s: ic.detect_rsi_crossover_vs_btc(u["candles"][s], u["btc"])),
+    Case("indicator_calculator.detect_liquidity_hunt_target",
+         lambda u, s: ic.detect_liquidity_hunt_target(u["lsr"][s], u["oi"][s])),
+    Case("indicator_calculator.find_ranges_30m", lambda u, s: ic.find_ranges_30m(u["candles"][s])),
+    Case("indicator_calculator.detect_absorption", lambda u, s: ic.detect_absorption(u["candles"][s], u["trades"][s])),
+    Case("indicator_calculator.analyze_order_flow",
+         lambda u, s: ic.analyze_order_flow(u["candles"][s], u["trades"][s], u["oi"][s], u["lsr"][s])),
+    Case("indicator_calculator.detect_sfp", lambda u, s: ic.detect_sfp(u["candles"][s])),
+    Case("indicator_calculator.detect_judas_swing",
+         lambda u, s: ic.detect_judas_swing(u["candles"][s], u["ranges"][s], u["atr"][s])),
+    Case("indicator_calculator.calculate_fibonacci_levels", lambda u, s: ic.calculate_fibonacci_levels(u["candles"][s])),
+    Case("indicator_calculator.detect_candlestick_patterns",
+         lambda u, s: ic.detect_candlestick_patterns(u["candles"][s])),
+    Case("indicator_calculator.calculate_pivot_trend", lambda u, s: ic.calculate_pivot_trend(u["candles"][s])),
+    Case("indicator_calculator.check_volume_confirmation",
+         lambda u, s: ic.check_volume_confirmation(u["candles"][s])),
+    Case("indicator_calculator.analyze_candles",
+         lambda u, s: ic.analyze_candles(u["candles"][s], u["candles_4h"][s], u["trades"][s],
+                                         u["oi"][s], u["lsr"][s], u["btc"]),
+         {"batch_prefilter": Alternative(_batch_signals, _analysis_signals)}),
+    Case("indicator_calculator.analyze_candles[no_btc]", lambda u, s: ic.analyze_candles(u["candles"][s]),
+         {"streaming": Alternative(lambda u: {s: _pick("ema", "pullback", "rsi_bb", "pivot_trend", "macd")(a)
+                                              for s, a in _streaming_analysis(u).items()},
+                                   _pick("ema", "pullback", "rsi_bb", "pivot_trend", "macd"))}),
+    Case("indicator_calculator.FeatureContext", lambda u, s: _feature_context(u, s)),
+
+    Case("sr_detector.calculate_pivot_points", lambda u, s: sr_detector.calculate_pivot_points(u["daily"][s])),
+    Case("sr_detector.get_high_low_levels", lambda u, s: sr_detector.get_high_low_levels(u["daily"][s])),
+    Case("sr_detector.get_all_sr_levels", lambda u, s: sr_detector.get_all_sr_levels(u["daily"][s])),
+    Case("sr_detector.check_sr_proximity",
+         lambda u, s: sr_detector.check_sr_proximity(u["prices"][s], u["sr_levels"][s]),
+         {"sr_detector.check_sr_proximity_batch":
+              Alternative(lambda u: sr_detector.check_sr_proximity_batch(u["prices"], u["sr_levels"])),
+          "sr_detector.SRLevelCache.proximity":
+              Alternative(lambda u: u["sr_cache"].proximity(u["prices"]))}),
+    Case("sr_detector.get_sr_alignment",
+         lambda u, s: sr_detector.get_sr_alignment("LONG", u["proximity"][s], "JUDAS_SWING")),
+    Case("sr_detector.SRLevelCache",
+         lambda u, s: sr_detector.SRLevelCache().get_levels(s, u["daily_client"], now_ms=u["now_ms"])),
+    Case("sr_detector.SRLevelCache.get_levels",
+         lambda u, s: u["sr_cache"].get_levels(s, u["daily_client"], now_ms=u["now_ms"])),
+
+    Case("btc_regime_tracker.BTCRegimeTracker",
+         lambda u, s: BTCRegimeTracker().detect_regime(u["candles"][s], u["candles_4h"][s]),
+         {"streaming": Alternative(_streaming_regime)}),
+    Case("btc_regime_tracker.BTCRegimeTracker.detect_regime",
+         lambda u, s: u["tracker"].detect_regime(u["candles"][s])),
+    Case("btc_regime_tracker.BTCRegimeTracker.calculate_decoupling_score",
+         lambda u, s: u["tracker"].calculate_decoupling_score(u["candles"][s], u["btc"]),
+         # Scores are rounded to 3 decimals, so a last-bit difference can move one step
+         {"price_panel": Alternative(lambda u: _panel(u).decoupling(), tolerance=1.5e-3)}),
+]
+
+
+def _feature_context(u: Dict, symbol: str) -> Dict:
+    """Every FeatureContext feature for one window (the per-pair memo analyze_candles builds)"""
+    ctx = ic.FeatureContext(u["candles"][symbol], u["trades"][symbol])
+    return {
+        "ema": ctx.ema(EMA_FAST_PERIOD), "macd": ctx.macd(), "rsi": ctx.rsi(), "bb": ctx.bollinger(),
+        "atr": ctx.atr(), "sfp": ctx.sfp(), "ranges": ctx.ranges(), "cvd": ctx.cvd()
+    }
+
+
+def public_api() -> List[str]:
+    """Qualified names of the public functions, classes and methods of the benchmarked modules"""
+    names = []
+    for module in MODULES:
+        prefix = module.__name__.split(".")[-1]
+        for name, obj in vars(module).items():
+            if name.startswith("_") or getattr(obj, "__module__", None) != module.__name__:
+                continue
+            if inspect.isfunction(obj):
+                names.append(f"{prefix}.{name}")
+            elif inspect.isclass(obj):
+                names.append(f"{prefix}.{name}")
+                names.extend(f"{prefix}.{name}.{m}" for m, attr in vars(obj).items()
+                             if not m.startswith("_") and (inspect.isfunction(attr) or isinstance(attr, property)))
+    return names
+
+
+def coverage() -> Dict[str, List[str]]:
+    """Public API names with no case, alternative or skip reason (should be empty)"""
+    covered = {c.name.split("[")[0] for c in CASES} | set(SKIPPED)
+    covered |= {name for c in CASES for name in c.alternatives if "." in name}
+    return {"missing": sorted(set(public_api()) - covered)}
+
+
+def compare(a, b, tolerance: float = ABS_TOL, path: str = "") -> Optional[str]:
+    """First difference between two results (None when equal within tolerance)"""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a, b = np.asarray(a).tolist(), np.asarray(b).tolist()
+    if isinstance(a, dict) and isinstance(b, dict):
+        if a.keys() != b.keys():
+            return f"{path}: keys {sorted(map(str, a.keys() ^ b.keys()))}"
+        for k in a:
+            diff = compare(a[k], b[k], tolerance, f"{path}.{k}")
+            if diff:
+                return diff
+        return None
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        if len(a) != len(b):
+            return f"{path}: length {len(a)} != {len(b)}"
+        for i, (x, y) in enumerate(zip(a, b)):
+            diff = compare(x, y, tolerance, f"{path}[{i}]")
+            if diff:
+                return diff
+        return None
+    if isinstance(a, (int, float, np.number)) and isinstance(b, (int, float, np.number)) \
+            and not isinstance(a, bool) and not isinstance(b, bool):
+        a, b = float(a), float(b)
+        if (math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=REL_TOL, abs_tol=tolerance):
+            return None
+        return f"{path}: {a!r} != {b!r}"
+    return None if a == b else f"{path}: {a!r} != {b!r}"
+
+
+@contextmanager
+def backend(indicator_backend: str, kernels: bool):
+    previous = (ic.get_indicator_backend(), jit_kernels.ENABLED)
+    ic.set_indicator_backend(indicator_backend)
+    jit_kernels.ENABLED = kernels
+    try:
+        yield
+    finally:
+        ic.set_indicator_backend(previous[0])
+        jit_kernels.ENABLED = previous[1]
+
+
+def timed(fn: Callable, repeat: int):
+    """(best wall time in ms, last result); slow calls are not repeated"""
+    best, result = float("inf"), None
+    for i in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = min(best, elapsed)
+        if elapsed > 1000:
+            break
+    return best, result
+
+
+def prepare(u: Dict):
+    """Derived inputs shared by the cases, computed once with the reference backend"""
+    with backend(BACKENDS[0][1], BACKENDS[0][2]):
+        u["closes"] = {s: [c["close"] for c in u["candles"][s]] for s in u["symbols"]}
+        u["atr"] = {s: ic.calculate_atr(u["candles"][s]) for s in u["symbols"]}
+        u["ranges"] = {s: ic.find_ranges_30m(u["candles"][s]) for s in u["symbols"]}
+        u["prices"] = {s: u["closes"][s][-1] for s in u["symbols"]}
+        u["daily_client"] = _DailyClient(u)
+        u["now_ms"] = u["daily"][u["symbols"][0]][-1]["timestamp"] + DAY // 2
+        u["sr_cache"] = sr_detector.SRLevelCache()
+        u["sr_levels"] = {s: u["sr_cache"].get_levels(s, u["daily_client"], now_ms=u["now_ms"]) for s in u["symbols"]}
+        u["proximity"] = {s: sr_detector.check_sr_proximity(u["prices"][s], u["sr_levels"][s]) for s in u["symbols"]}
+        u["tracker"] = BTCRegimeTracker()
+
+
+def run_universe(u: Dict, repeat: int = 3, cases: Optional[List[Case]] = None) -> List[Dict]:
+    """Time every case under every backend and alternative; each row records parity vs the reference"""
+    prepare(u)
+    symbols = u["symbols"]
+    rows = []
+    for case in cases or CASES:
+        reference, reference_ms = None, None
+        for name, indicator_backend, kernels in BACKENDS:
+            if kernels and not jit_kernels.NUMBA_AVAILABLE:
+                rows.append(_row(u, case.name, name, None, None, skipped="numba not installed"))
+                continue
+            with backend(indicator_backend, kernels):
+                ms, outputs = timed(lambda: {s: case.call(u, s) for s in symbols}, repeat)
+            if reference is None:
+                reference, reference_ms = outputs, ms
+            mismatch = next(filter(None, (compare(outputs[s], reference[s], path=s) for s in symbols)), None)
+            rows.append(_row(u, case.name, name, ms, reference_ms, mismatch=mismatch))
+
+        for name, alt in case.alternatives.items():
+            ms, outputs = timed(lambda: alt.run(u), repeat)
+            mismatch = next(filter(None, (compare(outputs.get(s), alt.project(reference[s]), alt.tolerance, s)
+                                          for s in symbols)), None)
+            rows.append(_row(u, case.name, name, ms, reference_ms, mismatch=mismatch))
+    return rows
+
+
+def _row(u: Dict, function: str, backend_name: str, ms: Optional[float], reference_ms: Optional[float],
+         mismatch: Optional[str] = None, skipped: Optional[str] = None) -> Dict:
+    row = {
+        "function": function,
+        "backend": backend_name,
+        "dataset": u["name"],
+        "bars": u["bars"],
+        "symbols": len(u["symbols"]),
+    }
+    if skipped:
+        row["skipped"] = skipped
+        return row
+    row.update({
+        "ms": round(ms, 4),
+        "us_per_symbol": round(ms * 1000 / len(u["symbols"]), 3),
+        "speedup": round(reference_ms / ms, 2) if ms and reference_ms else None,
+        "parity": mismatch is None,
+    })
+    if mismatch:
+        row["mismatch"] = mismatch
+    return row
+
+
+def universes(grid: Dict, recorded: Optional[str] = None, seed: int = 0):
+    for bars in grid["bars"]:
+        for count in grid["symbols"]:
+            distinct = max(1, min(count, MAX_DISTINCT_CANDLES // bars))
+            u = synthetic_universe(bars, distinct, seed)
+            if distinct < count:
+                # Same series under more names: same per-symbol work, bounded memory
+                for key in ("candles", "candles_4h", "daily", "trades", "oi", "lsr"):
+                    base = list(u[key].values())
+                    u[key] = {f"SYN{i}USDT": base[i % distinct] for i in range(count)}
+                u["symbols"] = list(u["candles"])
+            yield u
+            if recorded:
+                r = recorded_universe(recorded, bars, count)
+                if r is not None:
+                    yield r
+
+
+def metadata() -> Dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": jit_kernels.NUMBA_AVAILABLE,
+        "platform": platform.platform(),
+        "rel_tol": REL_TOL,
+        "abs_tol": ABS_TOL,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark and parity-check the indicator modules")
+    parser.add_argument("--bars", type=int, nargs="+", help="Candle counts (default 100 1000, --full adds 10000)")
+    parser.add_argument("--symbols", type=int, nargs="+", help="Universe sizes (default 1 50, --full adds 500)")
+    parser.add_argument("--full", action="store_true", help="100/1k/10k bars x 1/50/500 symbols")
+    parser.add_argument("--recorded", help="MarketRecorder directory to add recorded universes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    grid = dict(FULL_GRID if args.full else QUICK_GRID)
+    if args.bars:
+        grid["bars"] = tuple(args.bars)
+    if args.symbols:
+        grid["symbols"] = tuple(args.symbols)
+
+    rows = []
+    for u in universes(grid, args.recorded, args.seed):
+        print(f"[BENCH] {u['name']} {u['bars']} bars x {len(u['symbols'])} symbols", file=sys.stderr, flush=True)
+        rows.extend(run_universe(u, args.repeat))
+
+    failures = [r for r in rows if r.get("parity") is False]
+    report = {"meta": metadata(), "coverage": coverage(), "skipped": SKIPPED,
+              "parity_failures": len(failures), "results": rows}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text)
+    else:
+        print(text)
+
+    for r in failures:
+        print(f"[BENCH] [PARITY] {r['function']} ({r['backend']}, {r['bars']}x{r['symbols']}): {r['mismatch']}",
+              file=sys.stderr, flush=True)
+    return 1 if failures or report["coverage"]["missing"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
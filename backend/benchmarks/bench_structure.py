@@ -0,0 +1,53 @@
+"""
+10D - Structure Detector Benchmark
+S/R clustering and Judas false-break checks vs the first-fit loops they replaced.
+
+Run from backend/: python -m benchmarks.bench_structure
+"""
+
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.structure_detector import cluster_levels, find_false_break
+from tests.helpers import first_fit_levels, loop_false_break, make_candles
+
+LOOKBACKS = (50, 200, 1000, 5000)
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def run():
+    rows = []
+    for lookback in LOOKBACKS:
+        candles = make_candles(lookback)
+        lows = [c["low"] for c in candles]
+        assert cluster_levels(lows) == first_fit_levels(lows)
+        levels = sorted(first_fit_levels(lows))
+        assert (find_false_break(candles, levels, 0.3, long=True) is not None) == \
+            (loop_false_break(candles, levels, 0.3) is not None)
+
+        rows.append({
+            "lookback": lookback,
+            "levels": len(levels),
+            "cluster_loop_ms": best_of(lambda: first_fit_levels(lows)),
+            "cluster_sorted_ms": best_of(lambda: cluster_levels(lows)),
+            "judas_loop_ms": best_of(lambda: loop_false_break(candles, levels, 0.3)),
+            "judas_mask_ms": best_of(lambda: find_false_break(candles, levels, 0.3, long=True)),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"{'lookback':>8} {'levels':>6} {'cluster loop':>13} {'sorted':>9} {'speedup':>8} {'judas loop':>11} {'mask':>8}")
+    for r in run():
+        print(f"{r['lookback']:>8} {r['levels']:>6} {r['cluster_loop_ms']:>11.3f}ms {r['cluster_sorted_ms']:>7.3f}ms "
+              f"{r['cluster_loop_ms'] / r['cluster_sorted_ms']:>7.1f}x {r['judas_loop_ms']:>9.3f}ms {r['judas_mask_ms']:>6.3f}ms")
@@ -0,0 +1,115 @@
+"""
+10D - Benchmark Datasets
+Synthetic and recorded candle universes for the indicator benchmarks.
+
+A universe is a dict with the inputs every benchmarked function needs:
+30M candles per symbol plus BTC, 4H and daily candles, recent trades, open
+interest and long/short ratio series. Synthetic universes are deterministic
+for a given (bars, symbols, seed); recorded ones come from MarketRecorder
+segments (BYBIT_RECORD_DIR), with synthetic fill-ins for anything the
+recording does not contain.
+"""
+
+import random
+from typing import Dict, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.candle_frame import CandleFrame
+from services.kline_cache import INTERVAL_MS
+from services.market_recorder import load_recordings
+
+STEP = INTERVAL_MS["30"]
+DAY = INTERVAL_MS["D"]
+START = 1_700_000_000_000 - 1_700_000_000_000 % DAY
+
+
+def synthetic_candles(bars: int, seed: int, step: int = STEP, price: float = 100.0) -> List[Dict]:
+    """Random-walk OHLCV bars with wicks, regime shifts and volume spikes"""
+    rng = random.Random(seed)
+    vol = 0.002 + 0.002 * (seed % 5)
+    candles = []
+    for i in range(bars):
+        if i % 200 == 0:
+            drift = rng.gauss(0, vol / 4)
+        o = price
+        c = o * (1 + drift + rng.gauss(0, vol))
+        wick = abs(rng.gauss(0, vol)) * o
+        volume = rng.uniform(1, 10) * (4 if rng.random() < 0.05 else 1)
+        candles.append({
+            "timestamp": START + i * step,
+            "open": o,
+            "high": max(o, c) + wick * rng.random() * 3,
+            "low": min(o, c) - wick * rng.random() * 3,
+            "close": c,
+            "volume": volume,
+            "turnover": volume * c
+        })
+        price = c
+    return candles
+
+
+def synthetic_trades(seed: int, count: int = 100) -> List[Dict]:
+    rng = random.Random(seed)
+    return [{"side": "Buy" if rng.random() < 0.5 else "Sell", "size": rng.uniform(0.1, 50)} for _ in range(count)]
+
+
+def synthetic_oi(seed: int, count: int = 10) -> List[Dict]:
+    rng = random.Random(seed)
+    base = rng.uniform(1e5, 1e6)
+    return [{"openInterest": base * rng.uniform(0.8, 1.5)} for _ in range(count)]
+
+
+def synthetic_lsr(seed: int, count: int = 10) -> List[Dict]:
+    rng = random.Random(seed)
+    return [{"ratio": rng.uniform(0.4, 2.2)} for _ in range(count)]
+
+
+def _universe(candles: Dict[str, List[Dict]], btc: List[Dict], name: str) -> Dict:
+    symbols = list(candles)
+    seeds = {s: i + 1 for i, s in enumerate(symbols)}
+    return {
+        "name": name,
+        "bars": min(len(c) for c in candles.values()),
+        "symbols": symbols,
+        "candles": candles,
+        "btc": btc,
+        "candles_4h": {s: synthetic_candles(60, seeds[s] + 10_000, INTERVAL_MS["240"]) for s in symbols},
+        "daily": {s: synthetic_candles(30, seeds[s] + 20_000, DAY) for s in symbols},
+        "trades": {s: synthetic_trades(seeds[s]) for s in symbols},
+        "oi": {s: synthetic_oi(seeds[s]) for s in symbols},
+        "lsr": {s: synthetic_lsr(seeds[s]) for s in symbols}
+    }
+
+
+def synthetic_universe(bars: int, symbols: int, seed: int = 0) -> Dict:
+    candles = {f"SYN{i}USDT": synthetic_candles(bars, seed * 100_000 + i + 1) for i in range(symbols)}
+    return _universe(candles, synthetic_candles(bars, seed * 100_000), "synthetic")
+
+
+def recorded_universe(directory: str, bars: int, symbols: int, interval: str = "30") -> Optional[Dict]:
+    """
+    Latest `bars` candles of up to `symbols` recorded pairs (kline responses
+    merged per symbol by open time). None when fewer than one pair has enough
+    history; BTC falls back to synthetic when it was not recorded.
+    """
+    rows: Dict[str, Dict[float, List[str]]] = {}
+    for record in load_recordings(directory):
+        if record.get("endpoint") != "/v5/market/kline" or record["params"].get("interval") != interval:
+            continue
+        symbol = record["params"].get("symbol")
+        for row in (record.get("response", {}).get("result", {}) or {}).get("list", []) or []:
+            rows.setdefault(symbol, {})[float(row[0])] = row
+
+    series = {}
+    for symbol, by_time in rows.items():
+        if len(by_time) >= bars:
+            newest_first = [by_time[t] for t in sorted(by_time, reverse=True)[:bars]]
+            series[symbol] = CandleFrame.from_raw(newest_first).to_dicts()
+
+    btc = series.pop("BTCUSDT", None)
+    picked = dict(list(series.items())[:symbols])
+    if not picked:
+        return None
+    return _universe(picked, btc or synthetic_candles(bars, 0), "recorded")
@@ -39,6 +39,9 @@ RSI_PERIOD = 14
 RSI_OVERSOLD = 30       # Back to standard 30
 RSI_OVERBOUGHT = 70     # Back to standard 70
 
+# Indicator backend: "numpy" (vectorized, services/indicator_numpy.py) or "python" (reference loops)
+INDICATOR_BACKEND = os.environ.get("INDICATOR_BACKEND", "numpy")
+
 # Pullback Settings
 PULLBACK_THRESHOLD = 0.005  # 0.5% - price within this distance from EMA
 
@@ -130,8 +133,103 @@ MIN_SCORE_TO_SAVE = 60          # Minimum score to save signal (Lowered for visi
 # API SETTINGS
 # =============================================================================
 
-BYBIT_BASE_URL = "https://api-testnet.bybit.com"
+BYBIT_BASE_URL = os.environ.get("BYBIT_BASE_URL", "https://api-testnet.bybit.com")  # Point at market_replay_server for offline runs
 UPDATE_INTERVAL_SECONDS = 5  # Scan every 5 seconds for real-time updates
+TICKER_SNAPSHOT_MAX_AGE = 5.0  # Seconds a shared ticker table is served before readers refresh it
+
+# Market Recorder (capture every Bybit response for offline replay/benchmarks)
+MARKET_RECORD_DIR = os.environ.get("BYBIT_RECORD_DIR", "")  # Empty = recording disabled
+MARKET_RECORD_SEGMENT_RECORDS = 5000  # Responses per gzip segment before rotating
+
+# HTTP Engine (shared connection pool for all Bybit REST calls)
+BYBIT_MAX_IN_FLIGHT = 8      # Max concurrent REST requests across the whole process
+BYBIT_POOL_CONNECTIONS = 4   # Number of hosts with cached keep-alive pools
+BYBIT_POOL_MAXSIZE = 16      # Keep-alive connections per host
+BYBIT_HTTP_TIMEOUT = 10      # Seconds
+BYBIT_ASYNC_MAX_CONCURRENCY = 20  # Concurrent requests for AsyncBybitClient universe fan-out
+
+# Kline Cache (incremental candle refresh per symbol/interval)
+KLINE_CACHE_ENABLED = True
+KLINE_CACHE_CAPACITY = 1000  # Max candles kept per symbol/interval (Bybit max per request)
+
+# Candle Store (memory-mapped closed candles on disk for warm restarts).
+# Opt-in: only useful on storage that outlives the instance. On Cloud Run the image
+# filesystem starts empty on every cold start, so point CANDLE_STORE_DIR at a mounted
+# volume (e.g. a GCS FUSE or Filestore mount); unset, the store is disabled.
+CANDLE_STORE_DIR = os.environ.get("CANDLE_STORE_DIR", "")
+CANDLE_STORE_ENABLED = bool(CANDLE_STORE_DIR)
+CANDLE_STORE_MAX_ROWS = 5000  # File size (rows) that triggers compaction back to KLINE_CACHE_CAPACITY
+
+# Multi-timeframe resampling (derive 1h/2h/4h from the cached 30m series instead of extra REST calls)
+MTF_RESAMPLE_ENABLED = True
+MTF_BASE_INTERVAL = "30"
+
+# Streaming indicators (EMA/MACD/RSI/ATR/BB state per symbol, updated once per closed bar).
+# Off by default: state seeded from the full history differs slightly from a
+# recomputation seeded at the start of each 100-candle window.
+STREAMING_INDICATORS_ENABLED = False
+STREAMING_INDICATORS_MAX_SERIES = 500  # (symbol, interval) states kept; least recently used evicted
+
+# Ticker prefilter: from one get_all_tickers snapshot, skip the per-pair kline fetch for pairs
+# that cannot produce a signal this cycle (see services/ticker_prefilter.py)
+TICKER_PREFILTER_ENABLED = True
+# Opt-in liquidity floor (USDT of 24h turnover), applied before the skip rules: thinner
+# pairs are dropped from the scan even when they could signal. 0 = off (most testnet pairs
+# trade well under $1M a day)
+TICKER_MIN_TURNOVER_24H = float(os.environ.get("TICKER_MIN_TURNOVER_24H", "0"))
+TICKER_FORCE_CHANGE_24H = 0.10       # |24h change| that always gets a full fetch
+
+# Batch indicator prefilter: one vectorized pass over all pairs per scan; only pairs
+# where an entry detector can fire go through the full analyze_pair path
+SCAN_BATCH_INDICATORS = True
+
+# Pair analysis mode: "sequential" (one pair after another), "parallel" (analyze_pair on a
+# bounded thread pool) or "staged" (scan pipeline below). In every mode results are merged
+# into active_signals in monitored_pairs order. Sequential unless opted into with the
+# SCAN_MODE env var or at runtime via SignalGenerator.set_scan_mode / POST /api/scanner/mode
+SCAN_MODE = os.environ.get("SCAN_MODE", "sequential").lower()
+SCAN_WORKERS = int(os.environ.get("SCAN_WORKERS", "8"))
+
+# Staged scan: fetch -> analyze -> score (ML) -> gate (LLM) stages connected by bounded
+# queues, each with its own worker threads; accepted signals go to a separate persist stage.
+# With the batch prefilter on, every pair's 30M candles first go through a "klines" stage,
+# and the prefilter runs once all of them are in (a barrier) before candidates enter fetch
+# One persist worker keeps DB writes in the order the scan merges signals
+SCAN_PIPELINE_WORKERS = {"klines": 8, "fetch": 8, "analyze": 2, "score": 2, "gate": 4, "persist": 1}
+SCAN_PIPELINE_QUEUE_SIZE = 32  # Max items waiting in front of each stage
+
+# Process pool for analyze_candles + calculate_signal_score (services/analysis_pool.py).
+# Candle windows reach the workers through shared memory; keeps scan CPU work off the
+# GIL used by the API threads. Off by default (worker start-up cost, one process per core)
+ANALYSIS_POOL_ENABLED = os.environ.get("ANALYSIS_POOL_ENABLED", "false").lower() == "true"
+ANALYSIS_POOL_WORKERS = int(os.environ.get("ANALYSIS_POOL_WORKERS", "2"))
+
+# Numba-compiled kernels (services/jit_kernels.py) for RSI smoothing, Judas reclaim,
+# candlestick patterns and Fibonacci swings; ignored when numba is not installed
+JIT_KERNELS_ENABLED = os.environ.get("JIT_KERNELS_ENABLED", "true").lower() == "true"
+
+# Rate Limiter (token bucket per endpoint group, shared by every Bybit caller)
+# Bybit allows 600 public requests / 5s per IP; keep the sum below 120/s.
+BYBIT_RATE_LIMIT_ENABLED = True
+BYBIT_RATE_LIMITS = {          # group: (requests per second, burst)
+    "kline": (50, 50),
+    "tickers": (10, 10),
+    "trades": (20, 20),
+    "derivatives": (20, 20),   # open-interest + account-ratio
+    "market": (10, 10)         # instruments, server time, anything else
+}
+BYBIT_RATE_LIMIT_RESERVE = 0.3  # Bucket fraction LOW priority (scanning) leaves for monitoring
+
+# Single Flight (identical requests share one round trip and one result)
+BYBIT_SINGLE_FLIGHT_ENABLED = True
+BYBIT_SINGLE_FLIGHT_TTL = {    # endpoint: seconds a completed response is reused (default 0 = in-flight only)
+    "/v5/market/kline": 2.0,
+    "/v5/market/tickers": 1.0,
+    "/v5/market/recent-trade": 1.0,
+    "/v5/market/open-interest": 15.0,
+    "/v5/market/account-ratio": 15.0,
+    "/v5/market/instruments-info": 300.0
+}
 
 # Timeframes
 TIMEFRAME_SIGNAL = "30"      # 30 minutes
@@ -0,0 +1,186 @@
+"""
+10D - Analysis Pool
+Optional process pool for the CPU-bound part of a pair's analysis
+(analyze_candles and calculate_signal_score), so the indicator math of a scan
+does not hold the GIL that the Flask request threads share.
+
+Candle windows are not pickled as dicts: the parent packs the 30M, 4H and BTC
+frames into one SharedMemory block of float64 (7, n) columns and sends only
+the block name and layout. The worker copies the columns out, closes the
+block, and sends back the result dict; the parent unlinks the block.
+Workers keep the BTC FeatureContext of the current window, so BTC features
+are still computed once per scan cycle (per worker).
+
+Off by default (ANALYSIS_POOL_ENABLED). If the pool breaks, the call runs
+in-process and the pool is rebuilt on the next call. Worker processes
+re-import the parent's __main__ script, so the pool stays off when the
+service was started as `python app.py` (app.py boots the scanner at import);
+use an import-safe entry point such as gunicorn (see Dockerfile).
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ANALYSIS_POOL_ENABLED, ANALYSIS_POOL_WORKERS
+from services.candle_frame import CandleFrame, FIELDS
+from services.indicator_calculator import analyze_candles, FeatureContext
+from services.signal_scorer import calculate_signal_score
+
+# (slot, offset in float64 items, candle count)
+Layout = List[Tuple[str, int, int]]
+
+# Worker-side BTC context, keyed by the window it was built from
+_btc_cache: Dict = {"key": None, "ctx": None}
+
+
+def pack_frames(frames: Dict[str, Optional[Sequence]]) -> Tuple[Optional[shared_memory.SharedMemory], Layout]:
+    """Copy candle windows into one shared memory block; None when every window is empty"""
+    arrays = {slot: CandleFrame.from_dicts(c).values for slot, c in frames.items() if c}
+    total = sum(a.size for a in arrays.values())
+    if not total:
+        return None, []
+
+    shm = shared_memory.SharedMemory(create=True, size=total * 8)
+    buf = np.ndarray((total,), dtype=np.float64, buffer=shm.buf)
+    layout, offset = [], 0
+    for slot, arr in arrays.items():
+        buf[offset:offset + arr.size] = arr.ravel()
+        layout.append((slot, offset, arr.shape[1]))
+        offset += arr.size
+    del buf
+    return shm, layout
+
+
+def unpack_frames(name: Optional[str], layout: Layout) -> Dict[str, CandleFrame]:
+    """Worker side of pack_frames: private CandleFrames (the block is closed before returning)"""
+    if name is None:
+        return {}
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray((shm.size // 8,), dtype=np.float64, buffer=shm.buf)
+        frames = {
+            slot: CandleFrame(view[offset:offset + n * len(FIELDS)].reshape(len(FIELDS), n).copy())
+            for slot, offset, n in layout
+        }
+        del view
+    finally:
+        shm.close()
+    return frames
+
+
+def main_is_import_safe() -> bool:
+    """False when __main__ is the Flask app script, which must not run again in each worker"""
+    main = sys.modules.get("__main__")
+    return os.path.basename(getattr(main, "__file__", None) or "") != "app.py"
+
+
+def _btc_context(btc: CandleFrame) -> FeatureContext:
+    key = (len(btc), btc.timestamp[0], btc.timestamp[-1], btc.close[-1])
+    if _btc_cache["key"] != key:
+        _btc_cache["key"], _btc_cache["ctx"] = key, FeatureContext(btc)
+    return _btc_cache["ctx"]
+
+
+def _analyze_job(name: Optional[str], layout: Layout, kwargs: Dict) -> Dict:
+    frames = unpack_frames(name, layout)
+    btc = frames.get("btc_candles")
+    return analyze_candles(
+        frames.get("candles", CandleFrame.empty()),
+        frames.get("candles_4h"),
+        btc_candles=btc,
+        btc_ctx=_btc_context(btc) if btc else None,
+        **kwargs
+    )
+
+
+def _score_job(calls: List[Dict]) -> List[Dict]:
+    return [calculate_signal_score(**kwargs) for kwargs in calls]
+
+
+class AnalysisPool:
+    """ProcessPoolExecutor wrapper; workers are started on first use"""
+
+    def __init__(self, workers: int = ANALYSIS_POOL_WORKERS, enabled: bool = ANALYSIS_POOL_ENABLED):
+        self.workers = workers
+        self.enabled = enabled
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {"analyze_jobs": 0, "score_jobs": 0, "fallbacks": 0, "shm_bytes": 0}
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._executor is None:
+                if not main_is_import_safe():
+                    print("[ANALYSIS POOL] [WARN] Started via app.py; running analysis in-process", flush=True)
+                    self.enabled = False
+                    return None
+                # forkserver children fork from a clean server process with this module
+                # preloaded, instead of inheriting the API process's threads and locks
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    ctx = multiprocessing.get_context("forkserver")
+                    ctx.set_forkserver_preload([__name__])
+                else:
+                    ctx = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx)
+                print(f"[ANALYSIS POOL] Started {self.workers} worker processes", flush=True)
+            return self._executor
+
+    def _run(self, stat: str, fn, *args):
+        executor = self._get_executor()
+        if executor is None:
+            return fn(*args)
+        try:
+            result = executor.submit(fn, *args).result()
+        except BrokenProcessPool as e:
+            print(f"[ANALYSIS POOL] Pool broken ({e}); running in-process", flush=True)
+            with self._lock:
+                self._executor = None
+                self._stats["fallbacks"] += 1
+            result = fn(*args)
+        with self._lock:
+            self._stats[stat] += 1
+        return result
+
+    def analyze(self, candles, candles_4h=None, btc_candles=None, **kwargs) -> Dict:
+        """analyze_candles in a worker process (btc_ctx is rebuilt worker-side)"""
+        kwargs.pop("btc_ctx", None)
+        shm, layout = pack_frames({"candles": candles, "candles_4h": candles_4h, "btc_candles": btc_candles})
+        try:
+            if shm is not None:
+                with self._lock:
+                    self._stats["shm_bytes"] += shm.size
+            return self._run("analyze_jobs", _analyze_job, shm.name if shm else None, layout, kwargs)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def score(self, calls: List[Dict]) -> List[Dict]:
+        """calculate_signal_score(**kwargs) for each call, in one round trip"""
+        if not calls:
+            return []
+        return self._run("score_jobs", _score_job, calls)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {"enabled": self.enabled, "workers": self.workers,
+                    "running": self._executor is not None, **self._stats}
+
+
+# Global instance
+analysis_pool = AnalysisPool()
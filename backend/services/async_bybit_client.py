@@ -0,0 +1,227 @@
+"""
+10D - Async Bybit Client
+Awaitable market-data API mirroring BybitClient, driven by one asyncio event loop.
+Used to fan out a whole pair universe concurrently instead of hundreds of
+sequential blocking calls.
+"""
+
+import asyncio
+from typing import List, Dict, Optional, Iterable
+import sys
+import os
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    print("[ASYNC BYBIT] [WARN] aiohttp not available. AsyncBybitClient disabled.", flush=True)
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BYBIT_BASE_URL, BYBIT_HTTP_TIMEOUT, BYBIT_ASYNC_MAX_CONCURRENCY, BYBIT_RATE_LIMIT_ENABLED
+from services.bybit_client import (
+    BYBIT_API_KEY, BYBIT_API_SECRET,
+    parse_instruments, parse_klines, parse_klines_columnar, parse_open_interest,
+    parse_long_short_ratio, parse_recent_trades, build_auth_headers
+)
+from services.http_pool import DEFAULT_HEADERS
+from services.rate_limiter import RateLimiter, bybit_rate_limiter, RATE_LIMIT_RET_CODE
+from services.market_recorder import market_recorder
+
+
+class AsyncBybitClient:
+    """
+    Async client for Bybit API v5 (market data only).
+
+    Return shapes match the sync BybitClient exactly (same parsers).
+    Use as an async context manager so the aiohttp session is closed:
+
+        async with AsyncBybitClient() as client:
+            klines = await client.gather_klines(symbols, "30", 100)
+    """
+
+    def __init__(self, max_concurrency: int = BYBIT_ASYNC_MAX_CONCURRENCY, session=None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is required for AsyncBybitClient")
+        self.base_url = BYBIT_BASE_URL
+        self.api_key = BYBIT_API_KEY
+        self.api_secret = BYBIT_API_SECRET
+        self.recv_window = "5000"
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Same buckets as the sync client, so fan-out cannot starve TP/SL monitoring
+        self.rate_limiter = (rate_limiter or bybit_rate_limiter) if BYBIT_RATE_LIMIT_ENABLED else None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Create the aiohttp session (keep-alive pool sized to the concurrency)"""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=BYBIT_HTTP_TIMEOUT),
+                headers=DEFAULT_HEADERS
+            )
+
+    async def close(self):
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    async def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """GET request bounded by the client semaphore. Returns `result` or None."""
+        if self._session is None:
+            await self.open()
+
+        url = f"{self.base_url}{endpoint}"
+        # aiohttp only accepts str/int/float query values
+        query = {k: str(v) for k, v in (params or {}).items()}
+        try:
+            async with self._semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(endpoint)
+                # Signed after the queue waits, so the timestamp is fresh within recv_window
+                headers = {}
+                if self.api_key and self.api_secret:
+                    headers.update(build_auth_headers(self.api_key, self.api_secret, self.recv_window, params))
+                async with self._session.get(url, params=query, headers=headers) as response:
+                    if self.rate_limiter:
+                        self.rate_limiter.observe(endpoint, response.headers)
+                        if response.status == 429:
+                            self.rate_limiter.penalize(endpoint)
+                    if response.status == 403:
+                        print(f"[ASYNC API] 403 FORBIDDEN - Bybit is blocking this IP. Try with API Keys.", flush=True)
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+
+            if market_recorder:
+                market_recorder.record(endpoint, params, data)
+
+            if data.get("retCode") == 0:
+                return data.get("result", {})
+            print(f"[ASYNC API] ERROR {data.get('retCode')}: {data.get('retMsg')}", flush=True)
+            if self.rate_limiter and data.get("retCode") == RATE_LIMIT_RET_CODE:
+                self.rate_limiter.penalize(endpoint)
+            return None
+        except Exception as e:
+            print(f"[ASYNC API ERROR] _make_request failed for {endpoint}: {e}", flush=True)
+            return None
+
+    # ------------------------------------------------------------------
+    # Single-symbol endpoints (same signatures as BybitClient)
+    # ------------------------------------------------------------------
+
+    async def get_all_tickers(self, category: str = "linear") -> List[Dict]:
+        result = await self._make_request("/v5/market/tickers", {"category": category})
+        if not result or not result.get("list"):
+            return []
+        return result["list"]
+
+    async def get_instruments(self, category: str = "linear") -> List[Dict]:
+        result = await self._make_request("/v5/market/instruments-info", {
+            "category": category,
+            "limit": 1000
+        })
+        return parse_instruments(result)
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 100, columnar: bool = False):
+        result = await self._make_request("/v5/market/kline", {
+            "category": "linear",
+            "symbol": symbol,
+            "interval": interval,
+            "limit": limit
+        })
+        return parse_klines_columnar(result) if columnar else parse_klines(result)
+
+    async def get_open_interest(self, symbol: str, interval: str, limit: int = 50) -> List[Dict]:
+        result = await self._make_request("/v5/market/open-interest", {
+            "category": "linear",
+            "symbol": symbol,
+            "intervalTime": interval,
+            "limit": limit
+        })
+        return parse_open_interest(result)
+
+    async def get_long_short_ratio(self, symbol: str, period: str, limit: int = 50) -> List[Dict]:
+        result = await self._make_request("/v5/market/account-ratio", {
+            "category": "linear",
+            "symbol": symbol,
+            "period": period,
+            "limit": limit
+        })
+        return parse_long_short_ratio(result)
+
+    async def get_recent_trades(self, symbol: str, limit: int = 100) -> List[Dict]:
+        result = await self._make_request("/v5/market/recent-trade", {
+            "category": "linear",
+            "symbol": symbol,
+            "limit": limit
+        })
+        return parse_recent_trades(result)
+
+    # ------------------------------------------------------------------
+    # Universe fan-out
+    # ------------------------------------------------------------------
+
+    async def gather_klines(self, symbols: Iterable[str], interval: str, limit: int = 100) -> Dict[str, List[Dict]]:
+        """Klines for many symbols in one asyncio.gather batch"""
+        symbols = list(symbols)
+        results = await asyncio.gather(*(self.get_klines(s, interval, limit) for s in symbols))
+        return dict(zip(symbols, results))
+
+    async def fetch_pair_data(self, symbol: str) -> Dict:
+        """Everything analyze_pair needs for one symbol, fetched concurrently"""
+        candles_30m, candles_4h, trades, oi_data, lsr_data = await asyncio.gather(
+            self.get_klines(symbol, "30", 100),
+            self.get_klines(symbol, "240", 60),
+            self.get_recent_trades(symbol, 100),
+            self.get_open_interest(symbol, "30min", 10),
+            self.get_long_short_ratio(symbol, "30min", 10)
+        )
+        return {
+            "symbol": symbol,
+            "candles_30m": candles_30m,
+            "candles_4h": candles_4h,
+            "trades": trades,
+            "oi_data": oi_data,
+            "lsr_data": lsr_data
+        }
+
+    async def fetch_universe(self, symbols: Iterable[str]) -> Dict[str, Dict]:
+        """fetch_pair_data for a full pair universe; concurrency is capped by the semaphore"""
+        symbols = list(symbols)
+        results = await asyncio.gather(*(self.fetch_pair_data(s) for s in symbols))
+        return dict(zip(symbols, results))
+
+
+def fetch_universe(symbols: Iterable[str], max_concurrency: int = BYBIT_ASYNC_MAX_CONCURRENCY) -> Dict[str, Dict]:
+    """Blocking helper for sync callers: runs one event loop for the whole universe"""
+    async def _run():
+        async with AsyncBybitClient(max_concurrency=max_concurrency) as client:
+            return await client.fetch_universe(symbols)
+    return asyncio.run(_run())
+
+
+# Quick test
+if __name__ == "__main__":
+    import time
+
+    async def main():
+        async with AsyncBybitClient() as client:
+            instruments = await client.get_instruments()
+            symbols = [i["symbol"] for i in instruments[:20]]
+            start = time.time()
+            data = await client.fetch_universe(symbols)
+            print(f"Fetched {len(data)} pairs in {time.time() - start:.2f}s")
+
+    asyncio.run(main())
@@ -5,6 +5,7 @@ import time
 from typing import List, Dict, Tuple, Optional
 from services.llm_agents.elite_manager_agent import EliteManagerAgent
 from services.bybit_executor import place_test_order
+from services.ticker_snapshot import ticker_snapshots
 
 class BankrollManager:
     """
@@ -403,11 +404,9 @@ class BankrollManager:
                 current_price = current_prices.get(symbol)
                 
                 if not current_price:
-                    # Fetch from API if not provided in batch
+                    # Not in the batch: read the shared ticker snapshot (no per-symbol call)
                     try:
-                        ticker = self.client.get_tickers(category="linear", symbol=symbol)
-                        if ticker and 'list' in ticker and ticker['list']:
-                            current_price = float(ticker['list'][0]['lastPrice'])
+                        current_price = ticker_snapshots.get_price(symbol, client=self.client)
                     except:
                         pass
                 
@@ -0,0 +1,345 @@
+"""
+10D - Batch Indicators
+Cross-sectional indicator pass over the whole pair universe.
+
+All monitored pairs are stacked into (pairs x bars) matrices and EMA, MACD,
+RSI, ATR, Bollinger Bands, volume ratio, pivot trend and the RSI-vs-BTC
+crossover are computed for every pair at once. The per-pair detectors that can
+open a signal (EMA crossover, pullback, RSI+BB reversal, Judas Swing) are
+evaluated on the same matrices, so the scan only runs the full analyze_pair path
+(trades, OI, LSR, scoring) for pairs where one of them can fire.
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    EMA_FAST_PERIOD, EMA_SLOW_PERIOD,
+    MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+    BB_PERIOD, BB_STD_DEV,
+    ATR_FACTOR, ATR_PERIOD,
+    VOLUME_THRESHOLD, VOLUME_LOOKBACK,
+    RSI_PERIOD, RSI_OVERSOLD, RSI_OVERBOUGHT,
+    PULLBACK_THRESHOLD, SFP_WICK_PERCENT,
+    JUDAS_RECLAIM_CANDLES, JUDAS_WICK_PERCENT
+)
+from services.candle_frame import candle_array
+from services.structure_detector import JUDAS_DEVIATION, JUDAS_BREAK_BARS, RANGES_LOOKBACK
+
+# detect_sfp lookback
+SFP_LOOKBACK = 20
+
+
+def stack_candles(candles_by_symbol: Dict[str, object], fields=("open", "high", "low", "close", "volume")) -> Dict:
+    """
+    Stack equal-length series into (pairs x bars) float64 matrices.
+
+    Pairs whose length differs from the most common one are returned in
+    "unbatched" so the caller can fall back to the per-pair path for them.
+    """
+    lengths = {s: len(c) for s, c in candles_by_symbol.items() if c is not None and len(c) > 0}
+    if not lengths:
+        return {"symbols": [], "unbatched": list(candles_by_symbol), "bars": 0}
+
+    bars = Counter(lengths.values()).most_common(1)[0][0]
+    symbols = [s for s, n in lengths.items() if n == bars]
+    stacked = {
+        field: np.vstack([candle_array(candles_by_symbol[s], field) for s in symbols])
+        for field in fields
+    }
+    stacked["symbols"] = symbols
+    stacked["unbatched"] = [s for s in candles_by_symbol if s not in symbols]
+    stacked["bars"] = bars
+    return stacked
+
+
+def _column_sum(matrix: np.ndarray) -> np.ndarray:
+    """Row sums accumulated left to right, like Python's sum() over each row"""
+    total = matrix[:, 0].copy()
+    for k in range(1, matrix.shape[1]):
+        total += matrix[:, k]
+    return total
+
+
+def ema_matrix(x: np.ndarray, period: int) -> np.ndarray:
+    """EMA along the bar axis (NaN during warm-up), same recurrence as calculate_ema"""
+    out = np.full(x.shape, np.nan)
+    if x.shape[1] < period:
+        return out
+    multiplier = 2 / (period + 1)
+    prev = _column_sum(x[:, :period]) / period
+    out[:, period - 1] = prev
+    for k in range(period, x.shape[1]):
+        prev = (x[:, k] - prev) * multiplier + prev
+        out[:, k] = prev
+    return out
+
+
+def macd_histogram(closes: np.ndarray) -> np.ndarray:
+    """Histogram of the last bar per pair (NaN when not yet defined)"""
+    macd = ema_matrix(closes, MACD_FAST) - ema_matrix(closes, MACD_SLOW)
+    valid = macd[:, MACD_SLOW - 1:]
+    if valid.shape[1] < MACD_SIGNAL:
+        return np.full(len(closes), np.nan)
+    return valid[:, -1] - ema_matrix(valid, MACD_SIGNAL)[:, -1]
+
+
+def rsi_last(closes: np.ndarray, period: int = RSI_PERIOD, count: int = 2) -> np.ndarray:
+    """(pairs x count) RSI of the last `count` bars, rounded like calculate_rsi"""
+    out = np.full((len(closes), count), np.nan)
+    if closes.shape[1] < period + 1:
+        return out
+
+    change = np.diff(closes, axis=1)
+    gains = np.maximum(change, 0.0)
+    losses = np.maximum(-change, 0.0)
+    avg_gain = _column_sum(gains[:, :period]) / period
+    avg_loss = _column_sum(losses[:, :period]) / period
+
+    raw = np.full(closes.shape, np.nan)
+    first_tail = closes.shape[1] - count
+    if period >= first_tail:
+        raw[:, period] = _rsi(avg_gain, avg_loss)
+    for k in range(period, change.shape[1]):
+        avg_gain = (avg_gain * (period - 1) + gains[:, k]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[:, k]) / period
+        if k + 1 >= first_tail:
+            raw[:, k + 1] = _rsi(avg_gain, avg_loss)
+
+    # Python round() (not np.round) so thresholds compare exactly as in the detectors
+    tail = raw[:, -count:]
+    return np.array([[v if v != v else round(v, 2) for v in row] for row in tail.tolist()]).reshape(tail.shape)
+
+
+def _rsi(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    return np.where(avg_loss == 0, 100.0, rsi)
+
+
+def atr_last(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = ATR_PERIOD) -> np.ndarray:
+    """ATR of the last bar per pair (mean of the last `period` true ranges)"""
+    if closes.shape[1] < period + 1:
+        return np.full(len(closes), np.nan)
+    h, l, pc = highs[:, 1:], lows[:, 1:], closes[:, :-1]
+    tr = np.maximum(np.maximum(h - l, np.abs(h - pc)), np.abs(l - pc))
+    return _column_sum(tr[:, -period:]) / period
+
+
+def bollinger_last(closes: np.ndarray, period: int = BB_PERIOD, std_dev: int = BB_STD_DEV) -> Dict[str, np.ndarray]:
+    if closes.shape[1] < period:
+        nan = np.full(len(closes), np.nan)
+        return {"upper": nan, "middle": nan, "lower": nan}
+    window = closes[:, -period:]
+    sma = _column_sum(window) / period
+    sq = (window[:, 0] - sma) ** 2
+    for k in range(1, period):
+        sq += (window[:, k] - sma) ** 2
+    stdev = (sq / period) ** 0.5
+    return {"upper": sma + std_dev * stdev, "middle": sma, "lower": sma - std_dev * stdev}
+
+
+def _direction(long_mask: np.ndarray, short_mask: np.ndarray) -> List[Optional[str]]:
+    return ["LONG" if lo else "SHORT" if sh else None for lo, sh in zip(long_mask.tolist(), short_mask.tolist())]
+
+
+def compute_batch(candles_by_symbol: Dict[str, object], btc_candles=None) -> Dict[str, Dict]:
+    """
+    Indicator values and detector outcomes for every pair.
+
+    Each result has "candidate": True when one of the entry detectors analyze_pair
+    turns into signals fires for the pair. Pairs that could not be stacked are
+    always candidates.
+    """
+    m = stack_candles(candles_by_symbol)
+    results = {s: {"batched": False, "candidate": True} for s in m["unbatched"]}
+    if not m["symbols"]:
+        return results
+
+    o, h, l, c, v = m["open"], m["high"], m["low"], m["close"], m["volume"]
+    n = m["bars"]
+    nan = np.full(len(c), np.nan)
+
+    # --- Trend: EMA 20/50 + MACD ---
+    if n >= EMA_SLOW_PERIOD:
+        ema_fast = ema_matrix(c, EMA_FAST_PERIOD)[:, -2:]
+        ema_slow = ema_matrix(c, EMA_SLOW_PERIOD)[:, -2:]
+    else:
+        ema_fast = ema_slow = np.full((len(c), 2), np.nan)
+    hist = macd_histogram(c)
+    fast, slow, prev_fast, prev_slow = ema_fast[:, 1], ema_slow[:, 1], ema_fast[:, 0], ema_slow[:, 0]
+
+    ready = ~(np.isnan(fast) | np.isnan(slow) | np.isnan(prev_fast) | np.isnan(prev_slow) | np.isnan(hist))
+    ready &= n >= max(EMA_SLOW_PERIOD, MACD_SLOW + MACD_SIGNAL) + 2
+    ema_long = ready & (prev_fast <= prev_slow) & (fast > slow)
+    ema_short = ready & ~ema_long & (prev_fast >= prev_slow) & (fast < slow)
+
+    # --- Pullback to EMA fast ---
+    close, prev_close = c[:, -1], c[:, -2] if n >= 2 else nan
+    pb_ready = ~(np.isnan(fast) | np.isnan(slow)) & (n >= EMA_SLOW_PERIOD + 3)
+    pb_long = pb_ready & (fast > slow) & (close <= fast * (1 + PULLBACK_THRESHOLD)) & (close > prev_close)
+    pb_short = pb_ready & (fast < slow) & (close >= fast * (1 - PULLBACK_THRESHOLD)) & (close < prev_close)
+
+    # --- RSI + Bollinger reversal ---
+    rsi = rsi_last(c)
+    bands = bollinger_last(c)
+    rb_ready = ~(np.isnan(rsi[:, 1]) | np.isnan(bands["upper"])) & (n >= max(RSI_PERIOD, BB_PERIOD) + 3)
+    rb_long = rb_ready & (rsi[:, 1] <= RSI_OVERSOLD) & (l[:, -1] <= bands["lower"]) & (close > o[:, -1])
+    rb_short = rb_ready & ~rb_long & (rsi[:, 1] >= RSI_OVERBOUGHT) & (h[:, -1] >= bands["upper"]) & (close < o[:, -1])
+
+    # --- Volume confirmation ---
+    if n >= VOLUME_LOOKBACK + 1:
+        avg_volume = _column_sum(v[:, -(VOLUME_LOOKBACK + 1):-1]) / VOLUME_LOOKBACK
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volume_ratio = np.where(avg_volume > 0, v[:, -1] / avg_volume, 0.0)
+    else:
+        volume_ratio = nan
+
+    # --- Pivot trend ---
+    atr = atr_last(h, l, c)
+    pivot = (h[:, -1] + l[:, -1]) / 2
+    upper, lower = pivot + (ATR_FACTOR * atr), pivot - (ATR_FACTOR * atr)
+    pv_ready = ~np.isnan(atr) & (n >= ATR_PERIOD + 2)
+    pv_up = pv_ready & ((close > upper) | ((close >= lower) & (close <= upper) & (close > prev_close)))
+    pv_down = pv_ready & ((close < lower) | ((close >= lower) & (close <= upper) & (close < prev_close)))
+
+    # --- RSI crossover vs BTC ---
+    rsi_cross = [None] * len(c)
+    if btc_candles is not None and len(btc_candles) >= RSI_PERIOD + 2 and n >= RSI_PERIOD + 2:
+        btc_rsi = rsi_last(candle_array(btc_candles, "close")[None, :])[0]
+        if not np.isnan(btc_rsi).any():
+            cur, prev = rsi[:, 1], rsi[:, 0]
+            ok = ~(np.isnan(cur) | np.isnan(prev))
+            rsi_cross = _direction(ok & (cur > btc_rsi[1]) & (prev <= btc_rsi[0]),
+                                   ok & (cur < btc_rsi[1]) & (prev >= btc_rsi[0]))
+
+    # --- Judas Swing ---
+    judas = _judas_signal(o, h, l, c, atr)
+
+    ema_sig = _direction(ema_long, ema_short)
+    pb_sig = _direction(pb_long, pb_short)
+    rb_sig = _direction(rb_long, rb_short)
+    pivot_dir = ["UP" if u else "DOWN" if d else None for u, d in zip(pv_up.tolist(), pv_down.tolist())]
+
+    for i, symbol in enumerate(m["symbols"]):
+        results[symbol] = {
+            "batched": True,
+            "ema_fast": float(fast[i]),
+            "ema_slow": float(slow[i]),
+            "macd_hist": float(hist[i]),
+            "rsi": float(rsi[i, 1]),
+            "atr": float(atr[i]),
+            "bb_upper": float(bands["upper"][i]),
+            "bb_lower": float(bands["lower"][i]),
+            "volume_ratio": float(volume_ratio[i]),
+            "volume_confirmed": bool(volume_ratio[i] >= VOLUME_THRESHOLD),
+            "pivot_trend": pivot_dir[i],
+            "rsi_crossover_btc": rsi_cross[i],
+            "ema_signal": ema_sig[i],
+            "pullback_signal": pb_sig[i],
+            "rsi_bb_signal": rb_sig[i],
+            "judas_signal": judas[i],
+            "candidate": bool(ema_sig[i] or pb_sig[i] or rb_sig[i] or judas[i])
+        }
+    return results
+
+
+def ranges_matrix(values: np.ndarray, tolerance: float = 0.001) -> np.ndarray:
+    """
+    find_ranges_30m clustering for every row at once: each value joins the first
+    cluster whose running mean is within `tolerance`, else opens a new one.
+    Returns (pairs x clusters) cluster means, NaN where fewer than 2 touches.
+    """
+    pairs, count = values.shape
+    rows = np.arange(pairs)
+    sums = np.zeros((pairs, count))
+    touches = np.zeros((pairs, count), dtype=np.int64)
+    opened = np.zeros(pairs, dtype=np.int64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k in range(count):
+            val = values[:, k]
+            width = int(opened.max()) + 1  # only clusters opened so far
+            avg = sums[:, :width] / touches[:, :width]
+            match = (touches[:, :width] > 0) & (np.abs(val[:, None] - avg) / avg <= tolerance)
+            found = match.any(axis=1)
+            slot = np.where(found, match.argmax(axis=1), opened)
+            sums[rows, slot] += val
+            touches[rows, slot] += 1
+            opened += ~found
+        return np.where(touches >= 2, sums / touches, np.nan)
+
+
+def _judas_signal(o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray, atr: np.ndarray) -> List[Optional[str]]:
+    """detect_judas_swing for every row: SFP first, then false breaks of 30M S/R"""
+    pairs, n = c.shape
+    none = np.zeros(pairs, dtype=bool)
+    if n < 5:
+        return [None] * pairs
+    atr_ok = ~np.isnan(atr) & (atr != 0)
+
+    # SFP on the last bar (detect_sfp)
+    sfp_long = sfp_short = none
+    if n >= SFP_LOOKBACK + 1:
+        highest = h[:, -(SFP_LOOKBACK + 1):-1].max(axis=1)
+        lowest = l[:, -(SFP_LOOKBACK + 1):-1].min(axis=1)
+        body = np.abs(c[:, -1] - o[:, -1])
+        total = h[:, -1] - l[:, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wick_ok = (total != 0) & ((((total - body) / total) * 100) >= SFP_WICK_PERCENT)
+        sfp_long = wick_ok & (l[:, -1] < lowest) & (c[:, -1] > lowest)
+        sfp_short = wick_ok & ~sfp_long & (h[:, -1] > highest) & (c[:, -1] < highest)
+
+    long_hit = short_hit = none
+    if n >= RANGES_LOOKBACK:
+        supports = ranges_matrix(l[:, -RANGES_LOOKBACK:])
+        resistances = ranges_matrix(h[:, -RANGES_LOOKBACK:])
+        long_hit = _false_break(o, h, l, c, atr, supports, long=True)
+        short_hit = _false_break(o, h, l, c, atr, resistances, long=False)
+
+    judas = []
+    for ok, sl, ss, lh, sh in zip(atr_ok.tolist(), sfp_long.tolist(), sfp_short.tolist(),
+                                  long_hit.tolist(), short_hit.tolist()):
+        judas.append(None if not ok else "LONG" if sl else "SHORT" if ss else
+                     "LONG" if lh else "SHORT" if sh else None)
+    return judas
+
+
+def _false_break(o, h, l, c, atr, levels, long: bool) -> np.ndarray:
+    """Any (level, break bar) pair meeting the deviation, reclaim and wick rules"""
+    hit = np.zeros(len(c), dtype=bool)
+    scale = np.where(atr > 0, atr, 1)[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i in JUDAS_BREAK_BARS:
+            if long:
+                broke = l[:, i][:, None] < levels
+                deviation = (levels - l[:, i][:, None]) / scale
+            else:
+                broke = h[:, i][:, None] > levels
+                deviation = (h[:, i][:, None] - levels) / scale
+            ok = broke & (JUDAS_DEVIATION[0] <= deviation) & (deviation <= JUDAS_DEVIATION[1])
+
+            # First reclaiming close after the break, which must come quickly and show a wick
+            pending = ok.copy()
+            passed = np.zeros_like(ok)
+            for j in range(i + 1, 0):
+                reclaim = pending & ((c[:, j][:, None] > levels) if long else (c[:, j][:, None] < levels))
+                if j - i <= JUDAS_RECLAIM_CANDLES:
+                    body = np.abs(c[:, j] - o[:, j])
+                    total = h[:, j] - l[:, j]
+                    wick_ok = (total > 0) & (((total - body) / total) >= (JUDAS_WICK_PERCENT / 100))
+                    passed |= reclaim & wick_ok[:, None]
+                pending &= ~reclaim
+            hit |= passed.any(axis=1)
+    return hit
+
+
+def select_candidates(results: Dict[str, Dict], order: Optional[List[str]] = None) -> List[str]:
+    """Candidate symbols, in `order` when given (scan order)"""
+    symbols = order if order is not None else list(results)
+    return [s for s in symbols if results.get(s, {"candidate": True})["candidate"]]
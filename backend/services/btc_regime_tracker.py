@@ -16,8 +16,10 @@ from config import (
     EMA_FAST_PERIOD, EMA_SLOW_PERIOD, BB_PERIOD, BB_STD_DEV, ATR_PERIOD
 )
 from services.indicator_calculator import (
-    calculate_ema, calculate_atr, calculate_bollinger_bands, calculate_rsi
+    calculate_ema, calculate_atr, calculate_bollinger_bands, calculate_rsi, FeatureContext
 )
+from services.candle_frame import candle_column
+from services.price_panel import PricePanel
 
 
 class BTCRegimeTracker:
@@ -67,7 +69,8 @@ class BTCRegimeTracker:
     def detect_regime(
         self, 
         btc_candles_30m: List[Dict], 
-        btc_candles_4h: Optional[List[Dict]] = None
+        btc_candles_4h: Optional[List[Dict]] = None,
+        indicators: Optional[Dict] = None
     ) -> Tuple[str, Dict]:
         """
         Detect current BTC market regime.
@@ -75,6 +78,7 @@ class BTCRegimeTracker:
         Args:
             btc_candles_30m: 30-minute BTC candles (at least 50)
             btc_candles_4h: 4-hour BTC candles (optional, for confirmation)
+            indicators: Streaming snapshot for btc_candles_30m (optional, skips recomputation)
             
         Returns:
             Tuple of (regime_name, details_dict)
@@ -82,17 +86,23 @@ class BTCRegimeTracker:
         if not btc_candles_30m or len(btc_candles_30m) < 50:
             return self.current_regime, {"error": "Not enough BTC data"}
         
-        closes = [c["close"] for c in btc_candles_30m]
-        highs = [c["high"] for c in btc_candles_30m]
-        lows = [c["low"] for c in btc_candles_30m]
-        volumes = [c["volume"] for c in btc_candles_30m]
+        closes = candle_column(btc_candles_30m, "close")
+        highs = candle_column(btc_candles_30m, "high")
+        lows = candle_column(btc_candles_30m, "low")
+        volumes = candle_column(btc_candles_30m, "volume")
         current_price = closes[-1]
         
         # Calculate indicators
-        ema_fast = calculate_ema(closes, EMA_FAST_PERIOD)
-        ema_slow = calculate_ema(closes, EMA_SLOW_PERIOD)
-        atr_values = calculate_atr(btc_candles_30m, ATR_PERIOD)
-        bb_data = calculate_bollinger_bands(closes, BB_PERIOD, BB_STD_DEV)
+        if indicators is not None:
+            ema_fast = [indicators["ema_fast"]]
+            ema_slow = [indicators["ema_slow"]]
+            atr_values = indicators["atr_recent"] or [None]
+            bb_data = {"upper": [indicators["bb_upper"]], "lower": [indicators["bb_lower"]]}
+        else:
+            ema_fast = calculate_ema(closes, EMA_FAST_PERIOD)
+            ema_slow = calculate_ema(closes, EMA_SLOW_PERIOD)
+            atr_values = calculate_atr(btc_candles_30m, ATR_PERIOD)
+            bb_data = calculate_bollinger_bands(closes, BB_PERIOD, BB_STD_DEV)
         
         current_ema_fast = ema_fast[-1] if ema_fast[-1] else current_price
         current_ema_slow = ema_slow[-1] if ema_slow[-1] else current_price
@@ -178,7 +188,8 @@ class BTCRegimeTracker:
         self, 
         alt_candles: List[Dict], 
         btc_candles: List[Dict],
-        lookback: int = 20
+        lookback: int = 20,
+        btc_ref: Optional[FeatureContext] = None
     ) -> float:
         """
         Calculate how much an altcoin is moving independently from BTC.
@@ -190,38 +201,37 @@ class BTCRegimeTracker:
             alt_candles: Altcoin candles
             btc_candles: BTC candles
             lookback: Number of candles to analyze
+            btc_ref: FeatureContext of btc_candles shared across pairs (optional)
             
         Returns:
             Decoupling score between 0.0 and 1.0
         """
         if not alt_candles or not btc_candles:
             return 0.0
-        if len(alt_candles) < lookback or len(btc_candles) < lookback:
+        if len(alt_candles) < lookback + 1 or len(btc_candles) < lookback + 1:
             return 0.0
         
         try:
-            alt_changes = []
-            btc_changes = []
-            
-            for i in range(-lookback, 0):
-                alt_change = (alt_candles[i]["close"] - alt_candles[i-1]["close"]) / alt_candles[i-1]["close"]
-                btc_change = (btc_candles[i]["close"] - btc_candles[i-1]["close"]) / btc_candles[i-1]["close"]
-                alt_changes.append(alt_change)
-                btc_changes.append(btc_change)
+            alt = FeatureContext(alt_candles)
+            btc = btc_ref or FeatureContext(btc_candles)
+            if not alt.aligned_with(btc, lookback + 1):
+                # Missing bars on either side: correlate by bar time, not position
+                panel = PricePanel.build({"ALT": alt_candles, "BTC": btc_candles}, bars=lookback + 1)
+                return panel.decoupling("BTC", lookback)["ALT"]
+            alt_changes = alt.returns(lookback).tolist()
+            btc_changes = btc.returns(lookback).tolist()
             
             # Calculate correlation
             n = len(alt_changes)
             if n == 0:
                 return 0.0
                 
-            # Mean
-            alt_mean = sum(alt_changes) / n
-            btc_mean = sum(btc_changes) / n
+            # Mean and standard deviations (BTC side comes precomputed with btc_ref)
+            alt_mean, alt_std, alt_total_change = alt.return_stats(lookback)
+            btc_mean, btc_std, btc_total_change = btc.return_stats(lookback)
             
-            # Covariance and standard deviations
+            # Covariance
             covariance = sum((a - alt_mean) * (b - btc_mean) for a, b in zip(alt_changes, btc_changes)) / n
-            alt_std = (sum((a - alt_mean) ** 2 for a in alt_changes) / n) ** 0.5
-            btc_std = (sum((b - btc_mean) ** 2 for b in btc_changes) / n) ** 0.5
             
             if alt_std == 0 or btc_std == 0:
                 return 0.5  # Neutral if no movement
@@ -236,9 +246,6 @@ class BTCRegimeTracker:
             decoupling_score = (1 - correlation) / 2
             
             # Also consider if alt is outperforming
-            alt_total_change = sum(alt_changes)
-            btc_total_change = sum(btc_changes)
-            
             # Bonus if alt is gaining while BTC is flat/down
             if btc_total_change < 0.01 and alt_total_change > 0.02:  # BTC flat, alt up
                 decoupling_score = min(1.0, decoupling_score + 0.2)
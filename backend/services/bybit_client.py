@@ -11,7 +11,6 @@ from typing import List, Dict, Optional
 import sys
 import os
 import io
-import threading
 
 # FORCE UTF-8 STDOUT/STDERR FOR WINDOWS
 try:
@@ -22,81 +21,237 @@ except (AttributeError, io.UnsupportedOperation):
     pass
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import BYBIT_BASE_URL, MIN_LEVERAGE, EXCLUDED_PAIRS
+from config import (
+    BYBIT_BASE_URL, MIN_LEVERAGE, EXCLUDED_PAIRS, BYBIT_HTTP_TIMEOUT,
+    KLINE_CACHE_ENABLED, BYBIT_RATE_LIMIT_ENABLED, BYBIT_SINGLE_FLIGHT_ENABLED,
+    MTF_RESAMPLE_ENABLED, MTF_BASE_INTERVAL
+)
+from services.http_pool import HttpPool, bybit_http_pool
+from services.candle_frame import CandleFrame
+from services.kline_cache import KlineCache, shared_kline_cache, MAX_FETCH
+from services.candle_resampler import CandleResampler, candle_resampler, resample_ratio
+from services.rate_limiter import RateLimiter, bybit_rate_limiter, RATE_LIMIT_RET_CODE
+from services.single_flight import SingleFlight, bybit_single_flight, request_key, ttl_for
+from services.market_recorder import MarketRecorder, market_recorder
 
 # API Keys from environment (optional for public endpoints)
 BYBIT_API_KEY = os.environ.get("BYBIT_API_KEY", "")
 BYBIT_API_SECRET = os.environ.get("BYBIT_API_SECRET", "")
 
 
+# =============================================================================
+# RESPONSE PARSERS (shared by BybitClient and AsyncBybitClient)
+# =============================================================================
+
+def parse_instruments(result: Optional[Dict]) -> List[Dict]:
+    """Filter raw instruments-info for USDT perpetuals with leverage >= MIN_LEVERAGE"""
+    if not result:
+        return []
+    
+    instruments = result.get("list", [])
+    
+    # Filter for USDT perpetuals with sufficient leverage
+    filtered = []
+    for inst in instruments:
+        symbol = inst.get("symbol", "")
+        
+        # Only USDT perpetuals
+        if not symbol.endswith("USDT"):
+            continue
+        
+        # Check leverage
+        leverage_filter = inst.get("leverageFilter", {})
+        max_leverage = float(leverage_filter.get("maxLeverage", "0"))
+        
+        if max_leverage >= MIN_LEVERAGE:
+            filtered.append({
+                "symbol": symbol,
+                "baseCoin": inst.get("baseCoin", ""),
+                "quoteCoin": inst.get("quoteCoin", ""),
+                "maxLeverage": max_leverage,
+                "minPrice": inst.get("priceFilter", {}).get("minPrice", "0"),
+                "tickSize": inst.get("priceFilter", {}).get("tickSize", "0.01")
+            })
+    
+    # Sort by symbol
+    filtered.sort(key=lambda x: x["symbol"])
+    return filtered
+
+
+def parse_klines(result: Optional[Dict]) -> List[Dict]:
+    """Convert raw kline list to chronological OHLCV dicts"""
+    if not result:
+        return []
+    
+    raw_klines = result.get("list", [])
+    
+    # Convert to structured format
+    # Bybit returns: [timestamp, open, high, low, close, volume, turnover]
+    candles = []
+    for kline in reversed(raw_klines):  # Reverse to get chronological order
+        candles.append({
+            "timestamp": int(kline[0]),
+            "open": float(kline[1]),
+            "high": float(kline[2]),
+            "low": float(kline[3]),
+            "close": float(kline[4]),
+            "volume": float(kline[5]),
+            "turnover": float(kline[6])
+        })
+    
+    return candles
+
+
+def parse_klines_columnar(result: Optional[Dict]) -> CandleFrame:
+    """Raw kline list straight into a chronological CandleFrame (no per-candle dicts)"""
+    if not result:
+        return CandleFrame.empty()
+    return CandleFrame.from_raw(result.get("list", []))
+
+
+def parse_open_interest(result: Optional[Dict]) -> List[Dict]:
+    """Open Interest history (newest first, as returned by Bybit)"""
+    if not result or not result.get("list"):
+        return []
+        
+    return [{
+        "openInterest": float(item["openInterest"]),
+        "timestamp": int(item["timestamp"])
+    } for item in result["list"]]
+
+
+def parse_long_short_ratio(result: Optional[Dict]) -> List[Dict]:
+    """Long/Short ratio history (newest first, as returned by Bybit)"""
+    if not result or not result.get("list"):
+        return []
+        
+    return [{
+        "ratio": float(item["buyRatio"]), # Bybit v5 uses buyRatio
+        "timestamp": int(item["timestamp"])
+    } for item in result["list"]]
+
+
+def parse_recent_trades(result: Optional[Dict]) -> List[Dict]:
+    """Recent public trades for CVD calculation"""
+    if not result or not result.get("list"):
+        return []
+        
+    return [{
+        "price": float(item["price"]),
+        "size": float(item["size"]),
+        "side": item["side"], # Buy or Sell
+        "timestamp": int(item["time"])
+    } for item in result["list"]]
+
+
+def build_auth_headers(api_key: str, api_secret: str, recv_window: str, params: Optional[Dict]) -> Dict:
+    """Bybit v5 signed headers for a GET request"""
+    timestamp = str(int(time.time() * 1000))
+    
+    # Format query string for signature
+    if params:
+        # Sort params to ensure consistent signature
+        import urllib.parse
+        sorted_params = sorted(params.items())
+        query_string = urllib.parse.urlencode(sorted_params)
+    else:
+        query_string = ""
+    
+    param_str = timestamp + api_key + recv_window + query_string
+    signature = hmac.new(
+        bytes(api_secret, "utf-8"),
+        param_str.encode("utf-8"),
+        hashlib.sha256
+    ).hexdigest()
+    
+    return {
+        "X-BAPI-API-KEY": api_key,
+        "X-BAPI-TIMESTAMP": timestamp,
+        "X-BAPI-RECV-WINDOW": recv_window,
+        "X-BAPI-SIGN": signature
+    }
+
+
 class BybitClient:
     """Client for Bybit API v5"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        http_pool: Optional[HttpPool] = None,
+        kline_cache: Optional[KlineCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        recorder: Optional[MarketRecorder] = None,
+        resampler: Optional[CandleResampler] = None
+    ):
         self.base_url = BYBIT_BASE_URL
         self.api_key = BYBIT_API_KEY
         self.api_secret = BYBIT_API_SECRET
         self.recv_window = "5000"
-        self.session = requests.Session()
-        self.lock = threading.Lock()
         
-        # Real browser User-Agent to avoid 403
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        })
+        # Shared keep-alive pool (bounded in-flight requests instead of a global lock).
+        # The pool session already carries the real browser User-Agent to avoid 403.
+        self.http_pool = http_pool or bybit_http_pool
+        self.session = self.http_pool.session
+        
+        # Candle ring buffers shared process-wide: a warm cache only downloads new bars
+        self.kline_cache = (kline_cache or shared_kline_cache) if KLINE_CACHE_ENABLED else None
+        
+        # Token buckets shared by every caller in the process (scanner, bankroll, routes...)
+        self.rate_limiter = (rate_limiter or bybit_rate_limiter) if BYBIT_RATE_LIMIT_ENABLED else None
+        
+        # Identical concurrent/near-simultaneous requests share one round trip
+        self.single_flight = (single_flight or bybit_single_flight) if BYBIT_SINGLE_FLIGHT_ENABLED else None
+        
+        # Response capture for offline replay (BYBIT_RECORD_DIR)
+        self.recorder = recorder or market_recorder
+        
+        # Higher timeframes derived locally from the base series
+        self.resampler = resampler or candle_resampler
         
         if self.api_key:
             print(f"[BYBIT] Auth enabled: {self.api_key[:8]}...", flush=True)
         else:
             print("[BYBIT] Auth disabled - using public mode", flush=True)
             
-    def _generate_signature(self, timestamp: str, query_string: str) -> str:
-        """Generate Bybit v5 API signature"""
-        param_str = timestamp + self.api_key + self.recv_window + query_string
-        hash = hmac.new(
-            bytes(self.api_secret, "utf-8"),
-            param_str.encode("utf-8"),
-            hashlib.sha256
+    def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """GET `result` from Bybit, coalescing identical requests (single flight)"""
+        if self.single_flight is None:
+            return self._send_request(endpoint, params)
+        return self.single_flight.do(
+            request_key(endpoint, params),
+            lambda: self._send_request(endpoint, params),
+            ttl=ttl_for(endpoint)
         )
-        return hash.hexdigest()
 
-    def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+    def _send_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make a GET request to Bybit API with optional authentication"""
         try:
             url = f"{self.base_url}{endpoint}"
             
-            # Prepare headers
-            headers = {}
+            # Prepare headers. Signed headers are built by the pool once this request
+            # holds its rate-limit token and connection slot: a timestamp signed before
+            # queueing could fall outside recv_window by the time the request is sent.
+            headers = None
             if self.api_key and self.api_secret:
-                timestamp = str(int(time.time() * 1000))
-                
-                # Format query string for signature
-                if params:
-                    # Sort params to ensure consistent signature
-                    import urllib.parse
-                    sorted_params = sorted(params.items())
-                    query_string = urllib.parse.urlencode(sorted_params)
-                else:
-                    query_string = ""
-                
-                signature = self._generate_signature(timestamp, query_string)
-                
-                headers.update({
-                    "X-BAPI-API-KEY": self.api_key,
-                    "X-BAPI-TIMESTAMP": timestamp,
-                    "X-BAPI-RECV-WINDOW": self.recv_window,
-                    "X-BAPI-SIGN": signature
-                })
+                headers = lambda: build_auth_headers(self.api_key, self.api_secret, self.recv_window, params)
                 print(f"[API] Auth GET {endpoint}", flush=True)
             else:
                 print(f"[API] Public GET {endpoint} params={params}", flush=True)
 
-            print(f"[DEBUG] _make_request: About to call session.get for {url} (with lock)", flush=True)
-            with self.lock:
-                response = self.session.get(url, params=params, headers=headers, timeout=10)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(endpoint)
+
+            started = time.time()
+            response = self.http_pool.get(url, params=params, headers=headers, timeout=BYBIT_HTTP_TIMEOUT)
+            latency_ms = (time.time() - started) * 1000
             print(f"[API] {endpoint} -> HTTP {response.status_code}", flush=True)
             
+            if self.rate_limiter:
+                self.rate_limiter.observe(endpoint, response.headers)
+                if response.status_code == 429:
+                    self.rate_limiter.penalize(endpoint)
+            
             # If 403, log extra info
             if response.status_code == 403:
                 print(f"[API] 403 FORBIDDEN - Bybit is blocking this IP. Try with API Keys.", flush=True)
@@ -104,6 +259,9 @@ class BybitClient:
             response.raise_for_status()
             data = response.json()
             
+            if self.recorder:
+                self.recorder.record(endpoint, params, data, latency_ms)
+            
             if data.get("retCode") == 0:
                 result = data.get("result", {})
                 list_count = len(result.get("list", [])) if isinstance(result, dict) else 0
@@ -111,6 +269,8 @@ class BybitClient:
                 return result
             else:
                 print(f"[API] ERROR {data.get('retCode')}: {data.get('retMsg')}", flush=True)
+                if self.rate_limiter and data.get("retCode") == RATE_LIMIT_RET_CODE:
+                    self.rate_limiter.penalize(endpoint)
                 return None
                 
         except Exception as e:
@@ -119,6 +279,33 @@ class BybitClient:
             traceback.print_exc()
             return None
     
+    def get_pool_stats(self) -> Dict:
+        """In-flight / queued request counts of the shared HTTP pool"""
+        return self.http_pool.get_stats()
+
+    def get_rate_limit_stats(self) -> Dict:
+        """Token bucket levels per endpoint group (empty when the limiter is disabled)"""
+        return self.rate_limiter.get_stats() if self.rate_limiter else {}
+
+    def get_server_time(self) -> Optional[int]:
+        """Bybit server time in ms (used as a latency ping by HealthMonitor)"""
+        result = self._make_request("/v5/market/time")
+        if not result:
+            return None
+        return int(result.get("timeNano", 0)) // 1_000_000 or int(result.get("timeSecond", 0)) * 1000
+
+    def get_single_flight_stats(self) -> Dict:
+        """Executed vs shared request counts (empty when single flight is disabled)"""
+        return self.single_flight.get_stats() if self.single_flight else {}
+
+    def get_resampler_stats(self) -> Dict:
+        """Full vs incremental multi-timeframe rebuilds"""
+        return self.resampler.get_stats()
+
+    def get_kline_cache_stats(self) -> Dict:
+        """Full vs incremental kline fetch counts (empty when the cache is disabled)"""
+        return self.kline_cache.get_stats() if self.kline_cache else {}
+
     def get_all_tickers(self, category: str = "linear") -> List[Dict]:
         """ Get all tickers for a category """
         result = self._make_request("/v5/market/tickers", {
@@ -128,7 +315,8 @@ class BybitClient:
         if not result or not result.get("list"):
             return []
             
-        return result["list"]
+        # Copy: the raw result may be shared with other callers (single flight)
+        return list(result["list"])
 
     def get_instruments(self, category: str = "linear") -> List[Dict]:
         """
@@ -140,36 +328,7 @@ class BybitClient:
             "limit": 1000
         })
         
-        if not result:
-            return []
-        
-        instruments = result.get("list", [])
-        
-        # Filter for USDT perpetuals with sufficient leverage
-        filtered = []
-        for inst in instruments:
-            symbol = inst.get("symbol", "")
-            
-            # Only USDT perpetuals
-            if not symbol.endswith("USDT"):
-                continue
-            
-            # Check leverage
-            leverage_filter = inst.get("leverageFilter", {})
-            max_leverage = float(leverage_filter.get("maxLeverage", "0"))
-            
-            if max_leverage >= MIN_LEVERAGE:
-                filtered.append({
-                    "symbol": symbol,
-                    "baseCoin": inst.get("baseCoin", ""),
-                    "quoteCoin": inst.get("quoteCoin", ""),
-                    "maxLeverage": max_leverage,
-                    "minPrice": inst.get("priceFilter", {}).get("minPrice", "0"),
-                    "tickSize": inst.get("priceFilter", {}).get("tickSize", "0.01")
-                })
-        
-        # Sort by symbol
-        filtered.sort(key=lambda x: x["symbol"])
+        filtered = parse_instruments(result)
         
         print(f"[INSTRUMENTS] Found {len(filtered)} valid instruments (min leverage {MIN_LEVERAGE}x)", flush=True)
         return filtered
@@ -224,7 +383,8 @@ class BybitClient:
             print(f"[GET_TOP_PAIRS] First 5: {', '.join(top_symbols[:5])}", flush=True)
         return top_symbols
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 100) -> List[Dict]:
+    def get_klines(self, symbol: str, interval: str, limit: int = 100, use_cache: bool = True,
+                   columnar: bool = False):
         """
         Get kline/candlestick data
         
@@ -232,10 +392,36 @@ class BybitClient:
             symbol: Trading pair (e.g., "BTCUSDT")
             interval: Timeframe ("1", "5", "15", "30", "60", "240", "D", "W")
             limit: Number of candles to fetch
+            use_cache: Serve from the kline cache (only new candles are downloaded)
+            columnar: Return a CandleFrame (NumPy columns) instead of a list of dicts
         
         Returns:
-            List of candles with OHLCV data
+            List of candles with OHLCV data (or a CandleFrame when columnar=True)
+        """
+        if use_cache and self.kline_cache is not None:
+            # Cached as columns parsed straight from the raw rows; dict callers share row dicts
+            return self.kline_cache.get(symbol, interval, limit,
+                                        lambda n: self._fetch_klines(symbol, interval, n, columnar=True),
+                                        as_dicts=not columnar)
+        return self._fetch_klines(symbol, interval, limit, columnar)
+
+    def get_resampled_klines(self, symbol: str, interval: str, limit: int = 100,
+                             base_interval: str = MTF_BASE_INTERVAL, columnar: bool = False):
         """
+        Higher-timeframe klines built from the base series (default 30m) instead
+        of a separate REST call. Same shape as get_klines; falls back to it when
+        resampling is disabled or `interval` cannot be derived from the base.
+        """
+        ratio = resample_ratio(base_interval, interval)
+        if not MTF_RESAMPLE_ENABLED or ratio is None or limit * ratio > MAX_FETCH:
+            return self.get_klines(symbol, interval, limit, columnar=columnar)
+
+        base = self.get_klines(symbol, base_interval, limit * ratio, columnar=True)
+        candles = self.resampler.update(symbol, base_interval, interval, base, limit)
+        return CandleFrame.from_dicts(candles) if columnar else candles
+
+    def _fetch_klines(self, symbol: str, interval: str, limit: int, columnar: bool = False):
+        """Uncached kline download (latest `limit` candles, chronological)"""
         result = self._make_request("/v5/market/kline", {
             "category": "linear",
             "symbol": symbol,
@@ -243,26 +429,7 @@ class BybitClient:
             "limit": limit
         })
         
-        if not result:
-            return []
-        
-        raw_klines = result.get("list", [])
-        
-        # Convert to structured format
-        # Bybit returns: [timestamp, open, high, low, close, volume, turnover]
-        candles = []
-        for kline in reversed(raw_klines):  # Reverse to get chronological order
-            candles.append({
-                "timestamp": int(kline[0]),
-                "open": float(kline[1]),
-                "high": float(kline[2]),
-                "low": float(kline[3]),
-                "close": float(kline[4]),
-                "volume": float(kline[5]),
-                "turnover": float(kline[6])
-            })
-        
-        return candles
+        return parse_klines_columnar(result) if columnar else parse_klines(result)
     
     def get_ticker(self, symbol: str) -> Optional[Dict]:
         """Get current ticker for a symbol"""
@@ -297,13 +464,7 @@ class BybitClient:
             "limit": limit
         })
         
-        if not result or not result.get("list"):
-            return []
-            
-        return [{
-            "openInterest": float(item["openInterest"]),
-            "timestamp": int(item["timestamp"])
-        } for item in result["list"]]
+        return parse_open_interest(result)
 
     def get_long_short_ratio(self, symbol: str, period: str, limit: int = 50) -> List[Dict]:
         """
@@ -317,13 +478,7 @@ class BybitClient:
             "limit": limit
         })
         
-        if not result or not result.get("list"):
-            return []
-            
-        return [{
-            "ratio": float(item["buyRatio"]), # Bybit v5 uses buyRatio
-            "timestamp": int(item["timestamp"])
-        } for item in result["list"]]
+        return parse_long_short_ratio(result)
 
     def get_recent_trades(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get recent public trades for CVD calculation"""
@@ -333,15 +488,7 @@ class BybitClient:
             "limit": limit
         })
         
-        if not result or not result.get("list"):
-            return []
-            
-        return [{
-            "price": float(item["price"]),
-            "size": float(item["size"]),
-            "side": item["side"], # Buy or Sell
-            "timestamp": int(item["time"])
-        } for item in result["list"]]
+        return parse_recent_trades(result)
 
 
 # Test the client
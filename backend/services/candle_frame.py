@@ -0,0 +1,170 @@
+"""
+10D - Candle Frame
+Columnar candle container: one contiguous float64 array per field
+(timestamp, open, high, low, close, volume, turnover), built straight from the
+raw Bybit kline list. Behaves like the old list of candle dicts (len, indexing,
+slicing, iteration) so existing callers keep working, while hot paths read the
+columns as zero-copy NumPy views.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+FIELDS = ("timestamp", "open", "high", "low", "close", "volume", "turnover")
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+
+class CandleFrame:
+    """
+    Chronological candles stored as a (7, n) float64 array.
+
+    Each field row is C-contiguous, so `frame.close` (or frame.column("close"))
+    is a view, and slicing a frame (`frame[-50:]`) slices every column without
+    copying. Integer indexing and iteration yield candle dicts, materialized once
+    and reused.
+    """
+
+    __slots__ = ("_data", "_rows")
+
+    def __init__(self, data: np.ndarray, rows: Optional[List[Dict]] = None):
+        self._data = data
+        self._rows = rows
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls) -> "CandleFrame":
+        return cls(np.empty((len(FIELDS), 0), dtype=np.float64), [])
+
+    @classmethod
+    def from_raw(cls, raw_klines: Sequence[Sequence[str]]) -> "CandleFrame":
+        """From Bybit's newest-first [ts, o, h, l, c, v, turnover] string rows"""
+        if not raw_klines:
+            return cls.empty()
+        arr = np.array(raw_klines, dtype=np.float64)
+        return cls(np.ascontiguousarray(arr[::-1].T))
+
+    @classmethod
+    def from_dicts(cls, candles: Iterable[Dict]) -> "CandleFrame":
+        """From chronological candle dicts (the dicts are kept as the row cache)"""
+        if isinstance(candles, CandleFrame):
+            return candles
+        candles = list(candles)
+        if not candles:
+            return cls.empty()
+        data = np.array([[c[f] for f in FIELDS] for c in candles], dtype=np.float64)
+        return cls(np.ascontiguousarray(data.T), candles)
+
+    @classmethod
+    def concat(cls, head: "CandleFrame", tail: "CandleFrame", maxlen: Optional[int] = None) -> "CandleFrame":
+        """
+        New frame with `tail` after `head`, keeping the newest `maxlen` bars.
+        Row dicts already materialized on `head` are carried over (only the
+        tail's rows are built), so list-of-dicts readers of a growing series
+        do not rebuild every candle on each update.
+        """
+        data = np.concatenate([head._data, tail._data], axis=1)
+        rows = head._rows + tail.to_dicts() if head._rows is not None else None
+        if maxlen is not None and data.shape[1] > maxlen:
+            data = data[:, -maxlen:]
+            rows = rows[-maxlen:] if rows is not None else None
+        return cls(np.ascontiguousarray(data), rows)
+
+    # ------------------------------------------------------------------
+    # Columnar access (zero-copy)
+    # ------------------------------------------------------------------
+
+    def column(self, field: str) -> np.ndarray:
+        return self._data[FIELD_INDEX[field]]
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self._data[0]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._data[1]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._data[2]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._data[3]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._data[4]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._data[5]
+
+    @property
+    def turnover(self) -> np.ndarray:
+        return self._data[6]
+
+    @property
+    def values(self) -> np.ndarray:
+        """The underlying (7, n) array"""
+        return self._data
+
+    # ------------------------------------------------------------------
+    # List-of-dicts adapter
+    # ------------------------------------------------------------------
+
+    def to_dicts(self) -> List[Dict]:
+        if self._rows is None:
+            self._rows = [{
+                "timestamp": int(r[0]),
+                "open": r[1],
+                "high": r[2],
+                "low": r[3],
+                "close": r[4],
+                "volume": r[5],
+                "turnover": r[6]
+            } for r in self._data.T.tolist()]
+        return self._rows
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def __bool__(self) -> bool:
+        return self._data.shape[1] > 0
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            rows = self._rows[key] if self._rows is not None else None
+            return CandleFrame(self._data[:, key], rows)
+        return self.to_dicts()[key]
+
+    def __iter__(self):
+        return iter(self.to_dicts())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CandleFrame):
+            return np.array_equal(self._data, other._data)
+        if isinstance(other, list):
+            return self.to_dicts() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CandleFrame(n={len(self)})"
+
+
+def candle_column(candles: Union[CandleFrame, Sequence[Dict]], field: str) -> List[float]:
+    """Python list of one field, for list- or frame-based candles"""
+    if isinstance(candles, CandleFrame):
+        return candles.column(field).tolist()
+    return [c[field] for c in candles]
+
+
+def candle_array(candles: Union[CandleFrame, Sequence[Dict]], field: str) -> np.ndarray:
+    """float64 array of one field (a view when `candles` is a CandleFrame)"""
+    if isinstance(candles, CandleFrame):
+        return candles.column(field)
+    return np.fromiter((c[field] for c in candles), dtype=np.float64, count=len(candles))
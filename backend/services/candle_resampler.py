@@ -0,0 +1,121 @@
+"""
+10D - Candle Resampler
+Derives higher timeframes (1h/2h/4h/...) from a base series (30m by default),
+aligned to Bybit's UTC epoch bar boundaries. Replaces separate 60/120/240 REST
+calls with the already-cached 30m history and keeps all timeframes consistent.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.kline_cache import INTERVAL_MS
+from services.candle_frame import candle_array
+
+# Targets whose bars start on epoch multiples of their length (weekly/monthly do not)
+RESAMPLE_INTERVALS = ("5", "15", "30", "60", "120", "240", "360", "720", "D")
+
+
+def resample_ratio(base_interval: str, target_interval: str) -> Optional[int]:
+    """Base bars per target bar, or None if the target cannot be built from the base"""
+    if target_interval not in RESAMPLE_INTERVALS or base_interval not in INTERVAL_MS:
+        return None
+    base_ms, target_ms = INTERVAL_MS[base_interval], INTERVAL_MS[target_interval]
+    if target_ms <= base_ms or target_ms % base_ms:
+        return None
+    return target_ms // base_ms
+
+
+def resample(candles, target_interval: str) -> List[Dict]:
+    """
+    Aggregate chronological base candles into target-interval bars.
+
+    open = first open, high = max, low = min, close = last close,
+    volume/turnover = sums. A leading bucket that the base series does not cover
+    from its start is dropped; the trailing bucket is the still-forming bar.
+    """
+    if not candles or len(candles) == 0:
+        return []
+    step = INTERVAL_MS[target_interval]
+
+    ts = candle_array(candles, "timestamp").astype(np.int64)
+    buckets = ts - ts % step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ts)]
+
+    opens = candle_array(candles, "open")[starts]
+    closes = candle_array(candles, "close")[ends - 1]
+    highs = np.maximum.reduceat(candle_array(candles, "high"), starts)
+    lows = np.minimum.reduceat(candle_array(candles, "low"), starts)
+    volumes = np.add.reduceat(candle_array(candles, "volume"), starts)
+    turnovers = np.add.reduceat(candle_array(candles, "turnover"), starts)
+
+    first = 1 if ts[0] != buckets[0] else 0
+    return [{
+        "timestamp": t,
+        "open": o,
+        "high": h,
+        "low": l,
+        "close": c,
+        "volume": v,
+        "turnover": tv
+    } for t, o, h, l, c, v, tv in zip(
+        buckets[starts][first:].tolist(), opens[first:].tolist(), highs[first:].tolist(),
+        lows[first:].tolist(), closes[first:].tolist(), volumes[first:].tolist(), turnovers[first:].tolist()
+    )]
+
+
+class CandleResampler:
+    """
+    Incremental resampler keyed by (symbol, base_interval, target_interval).
+
+    Finished target bars are kept; each update only re-aggregates the base bars
+    from the last kept bar (the one that may still be forming) onward.
+    """
+
+    def __init__(self):
+        self._bars: Dict[Tuple[str, str, str], Deque[Dict]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"full": 0, "incremental": 0}
+
+    def update(self, symbol: str, base_interval: str, target_interval: str, base_candles, limit: int) -> List[Dict]:
+        """Latest `limit` target bars for the given base series"""
+        if not base_candles or len(base_candles) == 0:
+            return []
+        key = (symbol, base_interval, target_interval)
+
+        with self._lock:
+            bars = self._bars.get(key)
+            base_ts = candle_array(base_candles, "timestamp")
+            i = None
+            if bars and len(bars) >= limit:
+                resume_from = bars[-1]["timestamp"]
+                i = int(np.searchsorted(base_ts, resume_from))
+                if i >= len(base_ts) or base_ts[i] != resume_from:
+                    i = None  # base window no longer covers the last bar -> rebuild
+
+            if i is None:
+                bars = self._bars[key] = deque(resample(base_candles, target_interval), maxlen=max(limit, 1))
+                self._stats["full"] += 1
+            else:
+                # Re-aggregate from the (possibly forming) last bar onward
+                bars.pop()
+                bars.extend(resample(base_candles[i:], target_interval))
+                self._stats["incremental"] += 1
+
+            return list(bars)[-limit:]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["series"] = len(self._bars)
+        return stats
+
+
+# Process-wide resampler shared by all BybitClient instances
+candle_resampler = CandleResampler()
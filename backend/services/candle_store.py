@@ -0,0 +1,168 @@
+"""
+10D - Candle Store
+Persistent on-disk candles for warm restarts: one append-only file of closed
+bars per symbol/interval, read back through numpy.memmap. The kline cache
+persists into it and reloads from it, so after a restart only the gap since
+shutdown is downloaded.
+"""
+
+import threading
+from typing import Dict, List, Optional, Union
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CANDLE_STORE_ENABLED, CANDLE_STORE_DIR, CANDLE_STORE_MAX_ROWS, KLINE_CACHE_CAPACITY
+from services.candle_frame import CandleFrame
+
+# Row layout (float64): timestamp, open, high, low, close, volume, turnover
+ROW_FIELDS = ("timestamp", "open", "high", "low", "close", "volume", "turnover")
+ROW_WIDTH = len(ROW_FIELDS)
+ROW_BYTES = ROW_WIDTH * 8
+
+
+def _to_rows(candles: Union[CandleFrame, List[Dict]]) -> np.ndarray:
+    """(n, 7) float64 rows from a CandleFrame (column transpose) or candle dicts"""
+    if isinstance(candles, CandleFrame):
+        return np.ascontiguousarray(candles.values.T, dtype="<f8")
+    return np.array([[c[f] for f in ROW_FIELDS] for c in candles], dtype="<f8").reshape(-1, ROW_WIDTH)
+
+
+class CandleStore:
+    """
+    File per (symbol, interval): raw little-endian float64 rows, oldest first.
+
+    append() only adds candles newer than the last stored one, so a file stays
+    sorted; callers rewrite it with replace() when new bars do not continue it.
+    A torn trailing row (crash mid-write) is ignored on read.
+    Files beyond `max_rows` are compacted to the newest `keep_rows`.
+    """
+
+    def __init__(self, directory: str = CANDLE_STORE_DIR, max_rows: int = CANDLE_STORE_MAX_ROWS,
+                 keep_rows: int = KLINE_CACHE_CAPACITY):
+        self.directory = directory
+        self.max_rows = max(int(max_rows), int(keep_rows))
+        self.keep_rows = int(keep_rows)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._last_ts: Dict[str, Optional[int]] = {}
+        self._rows_written = 0
+
+    def path_for(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.directory, f"{symbol}_{interval}.f64")
+
+    def _row_count(self, path: str) -> int:
+        try:
+            return os.path.getsize(path) // ROW_BYTES
+        except OSError:
+            return 0
+
+    def load_array(self, symbol: str, interval: str, limit: Optional[int] = None) -> np.ndarray:
+        """(n, 7) float64 rows (newest `limit`), copied out of a read-only memmap"""
+        path = self.path_for(symbol, interval)
+        rows = self._row_count(path)
+        if rows == 0:
+            return np.empty((0, ROW_WIDTH), dtype="<f8")
+
+        mm = np.memmap(path, dtype="<f8", mode="r", shape=(rows, ROW_WIDTH))
+        start = max(0, rows - limit) if limit else 0
+        data = np.array(mm[start:])
+        del mm
+        return data
+
+    def load_frame(self, symbol: str, interval: str, limit: Optional[int] = None) -> CandleFrame:
+        """Chronological CandleFrame of the newest `limit` stored bars"""
+        return CandleFrame(np.ascontiguousarray(self.load_array(symbol, interval, limit).T))
+
+    def load(self, symbol: str, interval: str, limit: Optional[int] = None) -> List[Dict]:
+        """Chronological candle dicts (same shape as parse_klines)"""
+        return [{
+            "timestamp": int(r[0]),
+            "open": r[1],
+            "high": r[2],
+            "low": r[3],
+            "close": r[4],
+            "volume": r[5],
+            "turnover": r[6]
+        } for r in self.load_array(symbol, interval, limit).tolist()]
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        path = self.path_for(symbol, interval)
+        with self._lock:
+            if path not in self._last_ts:
+                tail = self.load_array(symbol, interval, 1)
+                self._last_ts[path] = int(tail[-1, 0]) if len(tail) else None
+            return self._last_ts[path]
+
+    def append(self, symbol: str, interval: str, candles: Union[CandleFrame, List[Dict]]) -> int:
+        """Append closed candles newer than the last stored one. Returns rows written."""
+        last_ts = self.last_timestamp(symbol, interval)
+        rows = _to_rows(candles)
+        if last_ts is not None:
+            rows = rows[rows[:, 0] > last_ts]
+        if not len(rows):
+            return 0
+
+        path = self.path_for(symbol, interval)
+        with self._lock:
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(path, "ab") as fh:
+                if size % ROW_BYTES:
+                    # Drop a torn row left by a crash before appending
+                    fh.truncate(size - size % ROW_BYTES)
+                fh.write(rows.tobytes())
+            self._last_ts[path] = int(rows[-1, 0])
+            self._rows_written += len(rows)
+
+        if self._row_count(path) > self.max_rows:
+            self._compact(symbol, interval)
+        return len(rows)
+
+    def replace(self, symbol: str, interval: str, candles: Union[CandleFrame, List[Dict]]) -> int:
+        """Rewrite a series from scratch (used when new data does not continue the file)"""
+        path = self.path_for(symbol, interval)
+        rows = _to_rows(candles)
+        tmp = path + ".tmp"
+        with self._lock:
+            with open(tmp, "wb") as fh:
+                fh.write(rows.tobytes())
+            os.replace(tmp, path)
+            self._last_ts[path] = int(rows[-1, 0]) if len(rows) else None
+            self._rows_written += len(rows)
+        return len(rows)
+
+    def _compact(self, symbol: str, interval: str):
+        path = self.path_for(symbol, interval)
+        keep = self.load_array(symbol, interval, self.keep_rows)
+        tmp = path + ".tmp"
+        with self._lock:
+            with open(tmp, "wb") as fh:
+                fh.write(keep.astype("<f8").tobytes())
+            os.replace(tmp, path)
+
+    def series(self) -> List[str]:
+        return sorted(n[:-4] for n in os.listdir(self.directory) if n.endswith(".f64"))
+
+    def get_stats(self) -> Dict:
+        names = self.series()
+        return {
+            "directory": self.directory,
+            "series": len(names),
+            "rows_written": self._rows_written
+        }
+
+
+def _open_default_store() -> Optional[CandleStore]:
+    if not CANDLE_STORE_ENABLED:
+        return None
+    try:
+        return CandleStore()
+    except OSError as e:
+        print(f"[CANDLE STORE] [WARN] Disabled, cannot use {CANDLE_STORE_DIR}: {e}", flush=True)
+        return None
+
+
+# Process-wide store (None when disabled or the directory is not writable)
+candle_store = _open_default_store()
@@ -54,8 +54,10 @@ class HealthMonitor:
             if self.generator and self.generator.client:
                 start = time.time()
                 try:
-                    self.generator.client.get_server_time()
-                    api_latency = int((time.time() - start) * 1000)
+                    if self.generator.client.get_server_time() is None:
+                        api_latency = -1
+                    else:
+                        api_latency = int((time.time() - start) * 1000)
                 except:
                     api_latency = -1 # Error
             
@@ -0,0 +1,127 @@
+"""
+10D - HTTP Pool
+Connection-pooled request engine shared by every Bybit REST caller.
+Replaces the old global session lock with a bounded number of in-flight requests
+and per-host keep-alive connections.
+"""
+
+import time
+import threading
+from typing import Callable, Dict, Optional, Union
+import sys
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BYBIT_MAX_IN_FLIGHT, BYBIT_POOL_CONNECTIONS, BYBIT_POOL_MAXSIZE, BYBIT_HTTP_TIMEOUT
+
+# Sent on every pooled request; Bybit answers 403 to requests without a browser User-Agent
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+
+class HttpPool:
+    """
+    Thread-safe HTTP engine.
+
+    - At most `max_in_flight` requests hit the network at the same time; extra callers
+      wait in a queue instead of serializing behind a single lock.
+    - Connections are kept alive per host (`pool_connections` hosts, `pool_maxsize`
+      sockets each), so a scan cycle does not pay TCP/TLS setup on every call.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = BYBIT_MAX_IN_FLIGHT,
+        pool_connections: int = BYBIT_POOL_CONNECTIONS,
+        pool_maxsize: int = BYBIT_POOL_MAXSIZE,
+        headers: Optional[Dict] = None
+    ):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.session = requests.Session()
+
+        # pool_block=True: never open more sockets per host than pool_maxsize
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=max(pool_maxsize, self.max_in_flight),
+            pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Caller headers are merged over the defaults, never instead of them
+        self.session.headers.update({**DEFAULT_HEADERS, **(headers or {})})
+
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+        self._peak_in_flight = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._total_latency = 0.0
+
+    def get(self, url: str, params: Dict = None, headers: Union[Dict, Callable[[], Dict], None] = None,
+            timeout: float = BYBIT_HTTP_TIMEOUT) -> requests.Response:
+        """
+        GET through the pool. Blocks while all in-flight slots are taken.
+        
+        `headers` may be a callable, evaluated only once a slot is held, so
+        signed (timestamped) headers do not age while the request is queued.
+        """
+        wait_start = time.time()
+        with self._stats_lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        self._slots.acquire()
+        started = time.time()
+        with self._stats_lock:
+            self._queued -= 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._total_wait += started - wait_start
+
+        failed = False
+        try:
+            if callable(headers):
+                headers = headers()
+            return self.session.get(url, params=params, headers=headers, timeout=timeout)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+                self._total_latency += time.time() - started
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+            self._slots.release()
+
+    def get_stats(self) -> Dict:
+        """Snapshot of pool usage (for sizing BYBIT_MAX_IN_FLIGHT)"""
+        with self._stats_lock:
+            done = self._completed + self._failed
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "peak_in_flight": self._peak_in_flight,
+                "peak_queued": self._peak_queued,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._total_wait / done * 1000, 2) if done else 0.0,
+                "avg_latency_ms": round(self._total_latency / done * 1000, 2) if done else 0.0
+            }
+
+
+# Process-wide pool shared by all BybitClient instances
+bybit_http_pool = HttpPool()
@@ -7,6 +7,8 @@ from typing import List, Dict, Tuple, Optional
 import sys
 import os
 
+import numpy as np
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     EMA_FAST_PERIOD, EMA_SLOW_PERIOD,
@@ -18,12 +20,42 @@ from config import (
     PULLBACK_THRESHOLD, RS_LOOKBACK, RS_MIN_THRESHOLD,
     ABSORPTION_LOOKBACK, ABSORPTION_CVD_RATIO, SFP_WICK_PERCENT,
     JUDAS_RECLAIM_CANDLES, JUDAS_WICK_PERCENT,
-    LSR_LONG_HEAVY, LSR_SHORT_HEAVY, OI_HIGH_MULTIPLIER
+    LSR_LONG_HEAVY, LSR_SHORT_HEAVY, OI_HIGH_MULTIPLIER,
+    INDICATOR_BACKEND
 )
+from services.candle_frame import candle_column, candle_array
+from services import jit_kernels
+from services.price_panel import PricePanel, same_tail
+from services.structure_detector import find_ranges, find_false_break
+
+# Vectorized implementations of the core indicators (None = the Python loops below)
+_backend = None
+
+
+def set_indicator_backend(name: str) -> str:
+    """Select "numpy" or "python" for SMA/EMA/MACD/BB/RSI/ATR. Returns the active backend."""
+    global _backend
+    if name == "numpy":
+        from services import indicator_numpy
+        _backend = indicator_numpy
+    elif name == "python":
+        _backend = None
+    else:
+        raise ValueError(f"Unknown indicator backend: {name}")
+    return name
+
+
+def get_indicator_backend() -> str:
+    return "python" if _backend is None else "numpy"
+
+
+set_indicator_backend(INDICATOR_BACKEND)
 
 
 def calculate_sma(closes: List[float], period: int) -> List[Optional[float]]:
     """Calculate Simple Moving Average"""
+    if _backend is not None:
+        return _backend.calculate_sma(closes, period)
     if len(closes) < period:
         return [None] * len(closes)
         
@@ -41,6 +73,8 @@ def calculate_sma(closes: List[float], period: int) -> List[Optional[float]]:
 
 def calculate_ema(closes: List[float], period: int) -> List[Optional[float]]:
     """Calculate Exponential Moving Average"""
+    if _backend is not None:
+        return _backend.calculate_ema(closes, period)
     if len(closes) < period:
         return [None] * len(closes)
     
@@ -59,6 +93,8 @@ def calculate_ema(closes: List[float], period: int) -> List[Optional[float]]:
 
 def calculate_macd(closes: List[float]) -> Dict[str, List[Optional[float]]]:
     """Calculate MACD Line, Signal Line, and Histogram"""
+    if _backend is not None:
+        return _backend.calculate_macd(closes)
     ema_fast = calculate_ema(closes, MACD_FAST)
     ema_slow = calculate_ema(closes, MACD_SLOW)
     
@@ -101,6 +137,8 @@ def calculate_macd(closes: List[float]) -> Dict[str, List[Optional[float]]]:
 
 def calculate_bollinger_bands(closes: List[float], period: int = BB_PERIOD, std_dev: int = BB_STD_DEV) -> Dict[str, List[Optional[float]]]:
     """Calculate Bollinger Bands"""
+    if _backend is not None:
+        return _backend.calculate_bollinger_bands(closes, period, std_dev)
     sma = calculate_sma(closes, period)
     upper_band = []
     lower_band = []
@@ -130,6 +168,8 @@ def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> List[Optiona
     Returns:
         List of RSI values (0-100)
     """
+    if _backend is not None:
+        return _backend.calculate_rsi(closes, period)
     if len(closes) < period + 1:
         return [None] * len(closes)
     
@@ -164,28 +204,116 @@ def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> List[Optiona
     return rsi_values
 
 
-def detect_ema_crossover(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
+class FeatureContext:
+    """
+    Lazily evaluated, memoized features of one candle window.
+    
+    analyze_candles builds one per pair per cycle and passes it to every
+    detector, so columns, EMA/MACD/RSI/BB/ATR series, SFP and the 30M ranges
+    are each computed once no matter how many detectors read them.
+    """
+    
+    def __init__(self, candles: List[Dict], recent_trades: Optional[List[Dict]] = None):
+        self.candles = candles
+        self.recent_trades = recent_trades
+        self._memo: Dict = {}
+    
+    def _get(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+    
+    def column(self, field: str) -> List[float]:
+        return self._get(("column", field), lambda: candle_column(self.candles, field))
+    
+    @property
+    def closes(self) -> List[float]:
+        return self.column("close")
+    
+    def ema(self, period: int) -> List[Optional[float]]:
+        return self._get(("ema", period), lambda: calculate_ema(self.closes, period))
+    
+    def macd(self) -> Dict[str, List[Optional[float]]]:
+        return self._get(("macd",), lambda: calculate_macd(self.closes))
+    
+    def rsi(self, period: int = RSI_PERIOD) -> List[Optional[float]]:
+        return self._get(("rsi", period), lambda: calculate_rsi(self.closes, period))
+    
+    def bollinger(self, period: int = BB_PERIOD, std_dev: int = BB_STD_DEV) -> Dict[str, List[Optional[float]]]:
+        return self._get(("bb", period, std_dev), lambda: calculate_bollinger_bands(self.closes, period, std_dev))
+    
+    def atr(self, period: int = ATR_PERIOD) -> List[Optional[float]]:
+        return self._get(("atr", period), lambda: calculate_atr(self.candles, period))
+    
+    def sfp(self, lookback: int = 20) -> Tuple[Optional[str], Dict]:
+        return self._get(("sfp", lookback), lambda: detect_sfp(self.candles, lookback))
+    
+    def ranges(self, lookback: int = 50) -> Dict[str, List[float]]:
+        return self._get(("ranges", lookback), lambda: find_ranges_30m(self.candles, lookback))
+    
+    def cvd(self) -> float:
+        return self._get(("cvd",), lambda: calculate_cvd(self.recent_trades) if self.recent_trades else 0.0)
+    
+    def returns(self, lookback: int) -> np.ndarray:
+        """Bar-over-bar % change of the last `lookback` closes (needs lookback + 1 bars)"""
+        def compute():
+            closes = np.asarray(self.closes[-(lookback + 1):], dtype=np.float64)
+            return (closes[1:] - closes[:-1]) / closes[:-1]
+        return self._get(("returns", lookback), compute)
+    
+    def drop_mask(self, lookback: int) -> np.ndarray:
+        """Bars among the last `lookback` that closed lower"""
+        return self._get(("drops", lookback), lambda: self.returns(lookback) < 0)
+    
+    def aligned_with(self, other: "FeatureContext", bars: int) -> bool:
+        """True when the last `bars` bars of both windows have the same open times"""
+        try:
+            return same_tail(self.column("timestamp"), other.column("timestamp"), bars)
+        except KeyError:
+            return True  # untimed candles can only be paired by position
+    
+    def return_stats(self, lookback: int) -> Tuple[float, float, float]:
+        """(mean, population stdev, sum) of returns(lookback), summed in bar order like the loops that use them"""
+        def compute():
+            changes = self.returns(lookback).tolist()
+            n = len(changes)
+            mean = sum(changes) / n
+            return mean, (sum((c - mean) ** 2 for c in changes) / n) ** 0.5, sum(changes)
+        return self._get(("return_stats", lookback), compute)
+
+
+def detect_ema_crossover(candles: List[Dict], indicators: Optional[Dict] = None,
+                         ctx: Optional[FeatureContext] = None) -> Tuple[Optional[str], Dict]:
     """
     Detect EMA crossover with MACD confirmation
     
+    Args:
+        indicators: Optional streaming snapshot (services/streaming_indicators.py)
+                    used instead of recomputing EMA/MACD over the window
+    
     Returns:
         Tuple of (signal_direction, details)
     """
     if len(candles) < max(EMA_SLOW_PERIOD, MACD_SLOW + MACD_SIGNAL) + 2:
         return None, {"error": "Not enough data"}
     
-    closes = [c["close"] for c in candles]
-    
-    ema_fast = calculate_ema(closes, EMA_FAST_PERIOD)
-    ema_slow = calculate_ema(closes, EMA_SLOW_PERIOD)
-    macd_data = calculate_macd(closes)
-    
-    current_fast = ema_fast[-1]
-    current_slow = ema_slow[-1]
-    prev_fast = ema_fast[-2]
-    prev_slow = ema_slow[-2]
-    
-    current_hist = macd_data["histogram"][-1]
+    if indicators is not None:
+        current_fast, prev_fast = indicators["ema_fast"], indicators["ema_fast_prev"]
+        current_slow, prev_slow = indicators["ema_slow"], indicators["ema_slow_prev"]
+        current_hist = indicators["macd_hist"]
+    else:
+        ctx = ctx or FeatureContext(candles)
+        
+        ema_fast = ctx.ema(EMA_FAST_PERIOD)
+        ema_slow = ctx.ema(EMA_SLOW_PERIOD)
+        macd_data = ctx.macd()
+        
+        current_fast = ema_fast[-1]
+        current_slow = ema_slow[-1]
+        prev_fast = ema_fast[-2]
+        prev_slow = ema_slow[-2]
+        
+        current_hist = macd_data["histogram"][-1]
     
     if any(v is None for v in [current_fast, current_slow, prev_fast, prev_slow, current_hist]):
         return None, {"error": "EMA or MACD not yet calculated"}
@@ -216,7 +344,7 @@ def detect_trend_4h(candles_4h: List[Dict]) -> Tuple[Optional[str], Dict]:
     if len(candles_4h) < EMA_SLOW_PERIOD + 1:
         return None, {"error": "Not enough 4H data"}
         
-    closes = [c["close"] for c in candles_4h]
+    closes = candle_column(candles_4h, "close")
     ema_50 = calculate_ema(closes, EMA_SLOW_PERIOD)
     
     current_price = closes[-1]
@@ -233,7 +361,7 @@ def detect_trend_4h(candles_4h: List[Dict]) -> Tuple[Optional[str], Dict]:
     }
 
 
-def detect_trend_direction(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
+def detect_trend_direction(candles: List[Dict], ctx: Optional[FeatureContext] = None) -> Tuple[Optional[str], Dict]:
     """
     Detect current trend direction based on EMA position
     
@@ -244,10 +372,10 @@ def detect_trend_direction(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
     if len(candles) < max(EMA_FAST_PERIOD, EMA_SLOW_PERIOD) + 1:
         return None, {"error": "Not enough data"}
     
-    closes = [c["close"] for c in candles]
+    ctx = ctx or FeatureContext(candles)
     
-    ema_fast = calculate_ema(closes, EMA_FAST_PERIOD)
-    ema_slow = calculate_ema(closes, EMA_SLOW_PERIOD)
+    ema_fast = ctx.ema(EMA_FAST_PERIOD)
+    ema_slow = ctx.ema(EMA_SLOW_PERIOD)
     
     current_fast = ema_fast[-1]
     current_slow = ema_slow[-1]
@@ -274,22 +402,27 @@ def detect_trend_direction(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
     return None, details
 
 
-def detect_pullback(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
+def detect_pullback(candles: List[Dict], indicators: Optional[Dict] = None,
+                    ctx: Optional[FeatureContext] = None) -> Tuple[Optional[str], Dict]:
     """
     Detect pullback to EMA during established trend
     """
     if len(candles) < max(EMA_FAST_PERIOD, EMA_SLOW_PERIOD) + 3:
         return None, {"error": "Not enough data"}
     
-    closes = [c["close"] for c in candles]
+    ctx = ctx or FeatureContext(candles)
+    closes = ctx.closes
     current_close = closes[-1]
     prev_close = closes[-2]
     
-    ema_fast = calculate_ema(closes, EMA_FAST_PERIOD)
-    ema_slow = calculate_ema(closes, EMA_SLOW_PERIOD)
-    
-    current_fast = ema_fast[-1]
-    current_slow = ema_slow[-1]
+    if indicators is not None:
+        current_fast, current_slow = indicators["ema_fast"], indicators["ema_slow"]
+    else:
+        ema_fast = ctx.ema(EMA_FAST_PERIOD)
+        ema_slow = ctx.ema(EMA_SLOW_PERIOD)
+        
+        current_fast = ema_fast[-1]
+        current_slow = ema_slow[-1]
     
     if current_fast is None or current_slow is None:
         return None, {"error": "EMA not calculated"}
@@ -319,24 +452,28 @@ def detect_pullback(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
     return None, details
 
 
-def detect_rsi_bb_reversal(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
+def detect_rsi_bb_reversal(candles: List[Dict], indicators: Optional[Dict] = None,
+                           ctx: Optional[FeatureContext] = None) -> Tuple[Optional[str], Dict]:
     """
     Detect RSI + Bollinger Bands extreme reversal
     """
     if len(candles) < max(RSI_PERIOD, BB_PERIOD) + 3:
         return None, {"error": "Not enough data"}
     
-    closes = [c["close"] for c in candles]
-    highs = [c["high"] for c in candles]
-    lows = [c["low"] for c in candles]
+    ctx = ctx or FeatureContext(candles)
+    closes = ctx.closes
     
-    rsi_values = calculate_rsi(closes, RSI_PERIOD)
-    bb_data = calculate_bollinger_bands(closes, BB_PERIOD, BB_STD_DEV)
-    
-    current_rsi = rsi_values[-1]
+    if indicators is not None:
+        current_rsi = indicators["rsi"]
+        current_upper, current_lower = indicators["bb_upper"], indicators["bb_lower"]
+    else:
+        rsi_values = ctx.rsi(RSI_PERIOD)
+        bb_data = ctx.bollinger(BB_PERIOD, BB_STD_DEV)
+        
+        current_rsi = rsi_values[-1]
+        current_upper = bb_data["upper"][-1]
+        current_lower = bb_data["lower"][-1]
     current_close = closes[-1]
-    current_upper = bb_data["upper"][-1]
-    current_lower = bb_data["lower"][-1]
     
     if any(v is None for v in [current_rsi, current_upper, current_lower]):
         return None, {"error": "RSI or BB not calculated"}
@@ -367,15 +504,20 @@ def detect_rsi_bb_reversal(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
 
 def calculate_atr(candles: List[Dict], period: int = ATR_PERIOD) -> List[Optional[float]]:
     """Calculate Average True Range (ATR)"""
+    if _backend is not None:
+        return _backend.calculate_atr(candles, period)
     if len(candles) < 2:
         return [None] * len(candles)
     
+    highs = candle_column(candles, "high")
+    lows = candle_column(candles, "low")
+    closes = candle_column(candles, "close")
     true_ranges = [None]
     
     for i in range(1, len(candles)):
-        high = candles[i]["high"]
-        low = candles[i]["low"]
-        prev_close = candles[i - 1]["close"]
+        high = highs[i]
+        low = lows[i]
+        prev_close = closes[i - 1]
         
         tr = max(
             high - low,
@@ -416,38 +558,37 @@ def calculate_cvd(recent_trades: List[Dict]) -> float:
     return delta
 
 
-def calculate_relative_strength(alt_candles: List[Dict], btc_candles: List[Dict], lookback: int = 14) -> float:
+def calculate_relative_strength(alt_candles: List[Dict], btc_candles: List[Dict], lookback: int = 14,
+                                ctx: Optional[FeatureContext] = None,
+                                btc_ctx: Optional[FeatureContext] = None) -> float:
     """
     Calculate Relative Strength (RS) of Alt vs BTC
     Returns average ratio of % change during drop candles
+    
+    btc_ctx can be the scan-wide BTC reference, so BTC returns and the
+    drop-bar mask are computed once per cycle instead of once per pair.
     """
-    if len(alt_candles) < lookback or len(btc_candles) < lookback:
+    if len(alt_candles) < lookback + 1 or len(btc_candles) < lookback + 1:
         return 0.0
         
-    alt_changes = []
-    btc_changes = []
+    ctx = ctx or FeatureContext(alt_candles)
+    btc_ctx = btc_ctx or FeatureContext(btc_candles)
+    if not ctx.aligned_with(btc_ctx, lookback + 1):
+        # Missing bars on either side: pair returns by bar time, not position
+        panel = PricePanel.build({"ALT": alt_candles, "BTC": btc_candles}, bars=lookback + 1)
+        return panel.relative_strength("BTC", lookback)["ALT"]
+    alt_changes = ctx.returns(lookback)
     
-    # Analyze the last N candles
-    for i in range(-lookback, 0):
-        alt_change = (alt_candles[i]["close"] - alt_candles[i-1]["close"]) / alt_candles[i-1]["close"]
-        btc_change = (btc_candles[i]["close"] - btc_candles[i-1]["close"]) / btc_candles[i-1]["close"]
-        
-        alt_changes.append(alt_change)
-        btc_changes.append(btc_change)
-        
     # During BTC drop, how did Alt perform?
-    rs_score = 0
-    count = 0
-    for a, b in zip(alt_changes, btc_changes):
-        if b < 0: # BTC dropped
-            # If alt dropped less than btc (a > b since both are negative), it's strong
-            rs_score += (a - b)
-            count += 1
-            
-    return rs_score / count if count > 0 else 0.0
+    # If alt dropped less than btc (a > b since both are negative), it's strong
+    diffs = (alt_changes - btc_ctx.returns(lookback))[btc_ctx.drop_mask(lookback)].tolist()
+    
+    return sum(diffs) / len(diffs) if diffs else 0.0
 
 
-def detect_rsi_crossover_vs_btc(alt_candles: List[Dict], btc_candles: List[Dict]) -> Tuple[Optional[str], Dict]:
+def detect_rsi_crossover_vs_btc(alt_candles: List[Dict], btc_candles: List[Dict],
+                                ctx: Optional[FeatureContext] = None,
+                                btc_ctx: Optional[FeatureContext] = None) -> Tuple[Optional[str], Dict]:
     """
     Detect RSI crossover between ALT and BTC
     When ALT RSI crosses ABOVE BTC RSI = altcoin gaining independent momentum (LONG)
@@ -456,11 +597,19 @@ def detect_rsi_crossover_vs_btc(alt_candles: List[Dict], btc_candles: List[Dict]
     if len(alt_candles) < RSI_PERIOD + 2 or len(btc_candles) < RSI_PERIOD + 2:
         return None, {}
     
-    alt_closes = [c["close"] for c in alt_candles]
-    btc_closes = [c["close"] for c in btc_candles]
+    ctx = ctx or FeatureContext(alt_candles)
+    btc_ctx = btc_ctx or FeatureContext(btc_candles)
+    rsi_alt = ctx.rsi()
+    rsi_btc = btc_ctx.rsi()
     
-    rsi_alt = calculate_rsi(alt_closes)
-    rsi_btc = calculate_rsi(btc_closes)
+    if not ctx.aligned_with(btc_ctx, 2):
+        # Compare both RSIs at the last two bar times they share
+        position = {t: i for i, t in enumerate(btc_ctx.column("timestamp"))}
+        common = [(i, position[t]) for i, t in enumerate(ctx.column("timestamp")) if t in position][-2:]
+        if len(common) < 2:
+            return None, {}
+        rsi_alt = [rsi_alt[i] for i, _ in common]
+        rsi_btc = [rsi_btc[j] for _, j in common]
     
     # Need at least 2 valid RSI values to detect crossover
     if rsi_alt[-1] is None or rsi_alt[-2] is None:
@@ -569,41 +718,12 @@ def find_ranges_30m(candles: List[Dict], lookback: int = 50) -> Dict[str, List[f
     Identify horizontal support and resistance levels in the 30M timeframe
     A level is defined where price touched at least 2 times (within a tolerance)
     """
-    if len(candles) < lookback:
-        return {"supports": [], "resistances": []}
-        
-    recent_candles = candles[-lookback:]
-    
-    # Extract highs and lows
-    highs = [c["high"] for c in recent_candles]
-    lows = [c["low"] for c in recent_candles]
-    
-    # Parameters for grouping
-    tolerance = 0.001 # 0.1% tolerance
-    
-    def get_clusters(values):
-        clusters = []
-        for val in values:
-            found = False
-            for group in clusters:
-                avg = sum(group) / len(group)
-                if abs(val - avg) / avg <= tolerance:
-                    group.append(val)
-                    found = True
-                    break
-            if not found:
-                clusters.append([val])
-        
-        # Filter for clusters with at least 2 touches
-        return [sum(c) / len(c) for c in clusters if len(c) >= 2]
-
-    return {
-        "supports": sorted(get_clusters(lows)),
-        "resistances": sorted(get_clusters(highs), reverse=True)
-    }
+    # Sorted-mean clustering (services/structure_detector.py), same levels as a first-fit scan
+    return find_ranges(candles, lookback)
 
 
-def detect_absorption(candles: List[Dict], recent_trades: List[Dict]) -> Tuple[bool, Dict]:
+def detect_absorption(candles: List[Dict], recent_trades: List[Dict],
+                      ctx: Optional[FeatureContext] = None) -> Tuple[bool, Dict]:
     """
     Detect Institutional Absorption
     Logic: Price is tightening (small bodies) but CVD is increasing/decreasing significantly
@@ -619,16 +739,16 @@ def detect_absorption(candles: List[Dict], recent_trades: List[Dict]) -> Tuple[b
     avg_body = sum(bodies) / len(bodies)
     
     # Calculate price volatility
-    highs = [c["high"] for c in recent_candles]
-    lows = [c["low"] for c in recent_candles]
+    highs = candle_column(recent_candles, "high")
+    lows = candle_column(recent_candles, "low")
     price_range = max(highs) - min(lows)
     
     # Calculate CVD for the same period
     # Note: calculate_cvd already takes a list of trades
-    cvd_total = calculate_cvd(recent_trades)
+    cvd_total = ctx.cvd() if ctx is not None else calculate_cvd(recent_trades)
     
     # Total volume in the lookback period
-    total_volume = sum(c["volume"] for c in recent_candles)
+    total_volume = sum(candle_column(recent_candles, "volume"))
     
     if total_volume == 0:
         return False, {}
@@ -659,8 +779,8 @@ def detect_sfp(candles: List[Dict], lookback: int = 20) -> Tuple[Optional[str],
     current = candles[-1]
     prev_candles = candles[-(lookback+1):-1]
     
-    highest_prev = max(c["high"] for c in prev_candles)
-    lowest_prev = min(c["low"] for c in prev_candles)
+    highest_prev = max(candle_column(prev_candles, "high"))
+    lowest_prev = min(candle_column(prev_candles, "low"))
     
     body = abs(current["close"] - current["open"])
     total = current["high"] - current["low"]
@@ -684,7 +804,8 @@ def detect_sfp(candles: List[Dict], lookback: int = 20) -> Tuple[Optional[str],
 def detect_judas_swing(
     candles: List[Dict], 
     ranges: Dict[str, List[float]], 
-    atr_values: List[Optional[float]]
+    atr_values: List[Optional[float]],
+    ctx: Optional[FeatureContext] = None
 ) -> Tuple[Optional[str], Dict]:
     """
     Detect Judas Swing (Institutional Stop Hunt)
@@ -702,7 +823,7 @@ def detect_judas_swing(
     atr = atr_values[-1]
     
     # Check for SFP first as it's a stronger pre-pump signal
-    sfp_direction, sfp_details = detect_sfp(candles)
+    sfp_direction, sfp_details = ctx.sfp() if ctx is not None else detect_sfp(candles)
     if sfp_direction:
         return sfp_direction, {
             "type": "SFP",
@@ -711,67 +832,11 @@ def detect_judas_swing(
             "deviation_atr": 0.0 # SFP doesn't care about ATR deviation the same way
         }
 
-    # Check for Long: False Break of Support
-    for support in ranges["supports"]:
-        for i in range(-4, -1):
-            low_candle = candles[i]
-            if low_candle["low"] < support:
-                desvio = (support - low_candle["low"]) / (atr if atr > 0 else 1)
-                
-                if 0.5 <= desvio <= 1.5:
-                    reclaimed = False
-                    reclaim_index = -1
-                    for j in range(i + 1, 0):
-                        if candles[j]["close"] > support:
-                            reclaimed = True
-                            reclaim_index = j
-                            break
-                    
-                    if reclaimed and (reclaim_index - i) <= JUDAS_RECLAIM_CANDLES:
-                        target_candle = candles[reclaim_index]
-                        body = abs(target_candle["close"] - target_candle["open"])
-                        total = target_candle["high"] - target_candle["low"]
-                        wick = total - body
-                        
-                        if total > 0 and (wick / total) >= (JUDAS_WICK_PERCENT / 100):
-                            return "LONG", {
-                                "type": "JUDAS_SWING",
-                                "level": round(support, 6),
-                                "deviation_atr": round(desvio, 2),
-                                "reclaim_candles": reclaim_index - i,
-                                "wick_percent": round((wick/total)*100, 2)
-                            }
-
-    # Check for Short: False Break of Resistance
-    for resistance in ranges["resistances"]:
-        for i in range(-4, -1):
-            high_candle = candles[i]
-            if high_candle["high"] > resistance:
-                desvio = (high_candle["high"] - resistance) / (atr if atr > 0 else 1)
-                
-                if 0.5 <= desvio <= 1.5:
-                    reclaimed = False
-                    reclaim_index = -1
-                    for j in range(i + 1, 0):
-                        if candles[j]["close"] < resistance:
-                            reclaimed = True
-                            reclaim_index = j
-                            break
-                    
-                    if reclaimed and (reclaim_index - i) <= JUDAS_RECLAIM_CANDLES:
-                        target_candle = candles[reclaim_index]
-                        body = abs(target_candle["close"] - target_candle["open"])
-                        total = target_candle["high"] - target_candle["low"]
-                        wick = total - body
-                        
-                        if total > 0 and (wick / total) >= (JUDAS_WICK_PERCENT / 100):
-                            return "SHORT", {
-                                "type": "JUDAS_SWING",
-                                "level": round(resistance, 6),
-                                "deviation_atr": round(desvio, 2),
-                                "reclaim_candles": reclaim_index - i,
-                                "wick_percent": round((wick/total)*100, 2)
-                            }
+    # False break of support (LONG) first, then of resistance (SHORT)
+    for direction, levels in (("LONG", ranges["supports"]), ("SHORT", ranges["resistances"])):
+        details = find_false_break(candles, levels, atr, long=direction == "LONG")
+        if details:
+            return direction, details
     return None, {}
 
 
@@ -785,11 +850,12 @@ def calculate_fibonacci_levels(candles: List[Dict], period: int = 144) -> Dict[s
         
     recent_candles = candles[-period:] if len(candles) > period else candles
     
-    highs = [c["high"] for c in recent_candles]
-    lows = [c["low"] for c in recent_candles]
-    
-    swing_high = max(highs)
-    swing_low = min(lows)
+    if jit_kernels.ENABLED:
+        swing_high, swing_low = (float(v) for v in jit_kernels.swing_range(
+            candle_array(recent_candles, "high"), candle_array(recent_candles, "low")))
+    else:
+        swing_high = max(candle_column(recent_candles, "high"))
+        swing_low = min(candle_column(recent_candles, "low"))
     diff = swing_high - swing_low
     
     if diff == 0:
@@ -820,6 +886,13 @@ def detect_candlestick_patterns(candles: List[Dict]) -> Dict[str, bool]:
     """
     if len(candles) < 2:
         return {}
+    
+    if jit_kernels.ENABLED:
+        last = candles[-2:]
+        flags = jit_kernels.candlestick_flags(*(candle_array(last, f) for f in ("open", "high", "low", "close")))[-1]
+        if flags[-1]:
+            return {"doji": True}
+        return {name: bool(flag) for name, flag in zip(jit_kernels.PATTERN_FLAGS[:-1], flags[:-1].tolist())}
         
     curr = candles[-1]
     prev = candles[-2]
@@ -865,14 +938,16 @@ def detect_candlestick_patterns(candles: List[Dict]) -> Dict[str, bool]:
     return patterns
 
 
-def calculate_pivot_trend(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
+def calculate_pivot_trend(candles: List[Dict], atr_values: Optional[List[Optional[float]]] = None,
+                          ctx: Optional[FeatureContext] = None) -> Tuple[Optional[str], Dict]:
     """Calculate Pivot Point Standard Trend"""
     if len(candles) < ATR_PERIOD + 2:
         return None, {"error": "Not enough data for Pivot Trend"}
     
-    atr_values = calculate_atr(candles, ATR_PERIOD)
+    if atr_values is None:
+        atr_values = (ctx or FeatureContext(candles)).atr(ATR_PERIOD)
     
-    current_atr = atr_values[-1]
+    current_atr = atr_values[-1] if atr_values else None
     if current_atr is None:
         return None, {"error": "ATR not calculated"}
     
@@ -908,12 +983,12 @@ def calculate_pivot_trend(candles: List[Dict]) -> Tuple[Optional[str], Dict]:
             return None, details
 
 
-def check_volume_confirmation(candles: List[Dict]) -> Tuple[bool, Dict]:
+def check_volume_confirmation(candles: List[Dict], ctx: Optional[FeatureContext] = None) -> Tuple[bool, Dict]:
     """Check if current volume is above threshold"""
     if len(candles) < VOLUME_LOOKBACK + 1:
         return False, {"error": "Not enough data for volume analysis"}
     
-    volumes = [c["volume"] for c in candles[-(VOLUME_LOOKBACK + 1):-1]]
+    volumes = (ctx or FeatureContext(candles)).column("volume")[-(VOLUME_LOOKBACK + 1):-1]
     current_volume = candles[-1]["volume"]
     
     avg_volume = sum(volumes) / len(volumes)
@@ -931,72 +1006,123 @@ def check_volume_confirmation(candles: List[Dict]) -> Tuple[bool, Dict]:
     return is_confirmed, details
 
 
+def analyze_order_flow(
+    candles: List[Dict],
+    recent_trades: Optional[List[Dict]] = None,
+    oi_data: Optional[List[Dict]] = None,
+    lsr_data: Optional[List[Dict]] = None,
+    ctx: Optional[FeatureContext] = None
+) -> Dict:
+    """
+    The part of analyze_candles' "institutional" block that reads trades, OI
+    and LSR (CVD, absorption, liquidity hunt, latest OI/LSR). None of the
+    entry detectors depend on it, so callers can run analyze_candles without
+    that data and merge this in once a pair has a candidate.
+    """
+    if ctx is None or ctx.recent_trades is not recent_trades:
+        ctx = FeatureContext(candles, recent_trades)
+    absorption_confirmed, absorption_details = detect_absorption(candles, recent_trades, ctx)
+    liquidity_hunt, liquidity_details = detect_liquidity_hunt_target(lsr_data, oi_data)
+    return {
+        "cvd": ctx.cvd(),
+        "oi_latest": oi_data[0]["openInterest"] if oi_data else None,
+        "lsr_latest": lsr_data[0]["ratio"] if lsr_data else None,
+        "absorption": {
+            "confirmed": absorption_confirmed,
+            "details": absorption_details
+        },
+        "liquidity_hunt": {
+            "target": liquidity_hunt,
+            "details": liquidity_details
+        }
+    }
+
+
 def analyze_candles(
     candles: List[Dict], 
     candles_4h: Optional[List[Dict]] = None,
     recent_trades: Optional[List[Dict]] = None,
     oi_data: Optional[List[Dict]] = None,
     lsr_data: Optional[List[Dict]] = None,
-    btc_candles: Optional[List[Dict]] = None
+    btc_candles: Optional[List[Dict]] = None,
+    indicators: Optional[Dict] = None,
+    btc_ctx: Optional[FeatureContext] = None,
+    cross_asset: Optional[Dict] = None
 ) -> Dict:
     """
     Run all indicator analysis on candles including Institutional metrics
+    
+    `indicators` is an optional streaming snapshot for these candles
+    (streaming_indicators.update); when given, EMA/MACD/RSI/BB/ATR are read
+    from it instead of being recomputed over the whole window.
+    `btc_ctx` is an optional FeatureContext for btc_candles, shareable
+    across pairs within a scan.
+    `cross_asset` is this pair's entry of the scan's PricePanel
+    (PricePanel.metrics); its timestamp-aligned RS replaces the per-pair one.
     """
+    # Every detector below reads from the same memoized features
+    ctx = FeatureContext(candles, recent_trades)
+    if btc_candles and btc_ctx is None:
+        btc_ctx = FeatureContext(btc_candles)
+    
     # ATR calculation (needed for Judas Swing)
-    atr_values = calculate_atr(candles, ATR_PERIOD)
+    if indicators is not None:
+        atr_values = indicators["atr_recent"] or [None]
+    else:
+        atr_values = ctx.atr(ATR_PERIOD)
     
     # 30M Range detection
-    ranges_30m = find_ranges_30m(candles)
+    ranges_30m = ctx.ranges()
     
     # Judas Swing detection
-    judas_signal, judas_details = detect_judas_swing(candles, ranges_30m, atr_values)
-    
-    # CVD calculation
-    cvd_value = calculate_cvd(recent_trades) if recent_trades else 0.0
+    judas_signal, judas_details = detect_judas_swing(candles, ranges_30m, atr_values, ctx)
     
     # Relative Strength
-    rs_score = calculate_relative_strength(candles, btc_candles, RS_LOOKBACK) if btc_candles else 0.0
+    if cross_asset is not None:
+        rs_score = cross_asset["rs_score"]
+    else:
+        rs_score = calculate_relative_strength(candles, btc_candles, RS_LOOKBACK, ctx, btc_ctx) if btc_candles else 0.0
 
-    # Absorption Detection
-    absorption_confirmed, absorption_details = detect_absorption(candles, recent_trades)
+    # CVD, Absorption, OI/LSR and Liquidity Hunt Target
+    flow = analyze_order_flow(candles, recent_trades, oi_data, lsr_data, ctx)
     
     # SFP Detection
-    sfp_signal, sfp_details = detect_sfp(candles)
+    sfp_signal, sfp_details = ctx.sfp()
     
     # RSI Crossover vs BTC Detection
-    rsi_crossover_btc, rsi_crossover_details = detect_rsi_crossover_vs_btc(candles, btc_candles) if btc_candles else (None, {})
+    rsi_crossover_btc, rsi_crossover_details = detect_rsi_crossover_vs_btc(candles, btc_candles, ctx, btc_ctx) if btc_candles else (None, {})
     
-    # Liquidity Hunt Target Detection
-    liquidity_hunt, liquidity_details = detect_liquidity_hunt_target(lsr_data, oi_data)
-
     # 4H Trend Filter
     trend_4h, trend_4h_details = None, {}
     if candles_4h:
         trend_4h, trend_4h_details = detect_trend_4h(candles_4h)
 
     # EMA Crossover
-    ema_signal, ema_details = detect_ema_crossover(candles)
+    ema_signal, ema_details = detect_ema_crossover(candles, indicators, ctx)
     
     # Pullback Detection
-    pullback_signal, pullback_details = detect_pullback(candles)
+    pullback_signal, pullback_details = detect_pullback(candles, indicators, ctx)
     
     # RSI + BB Reversal
-    rsi_signal, rsi_details = detect_rsi_bb_reversal(candles)
+    rsi_signal, rsi_details = detect_rsi_bb_reversal(candles, indicators, ctx)
     
     # Volume confirmation
-    volume_confirmed, volume_details = check_volume_confirmation(candles)
+    volume_confirmed, volume_details = check_volume_confirmation(candles, ctx)
     
     # Pivot Trend
-    pivot_trend, pivot_details = calculate_pivot_trend(candles)
+    pivot_trend, pivot_details = calculate_pivot_trend(candles, atr_values, ctx)
     
-    # MACD Current Data
-    closes = [c["close"] for c in candles]
-    macd_data = calculate_macd(closes)
-    current_hist = macd_data["histogram"][-1] if macd_data["histogram"] else None
-    
-    # RSI current value
-    rsi_values = calculate_rsi(closes, RSI_PERIOD)
-    current_rsi = rsi_values[-1] if rsi_values else None
+    if indicators is not None:
+        current_hist = indicators["macd_hist"]
+        current_rsi = indicators["rsi"]
+    else:
+        # MACD Current Data
+        macd_data = ctx.macd()
+        current_hist = macd_data["histogram"][-1] if macd_data["histogram"] else None
+        
+        # RSI current value
+        rsi_values = ctx.rsi(RSI_PERIOD)
+        current_rsi = rsi_values[-1] if rsi_values else None
     
     # Current price info
     current_candle = candles[-1] if candles else {}
@@ -1035,15 +1161,12 @@ def analyze_candles(
         "institutional": {
             "judas_signal": judas_signal,
             "judas_details": judas_details,
-            "cvd": cvd_value,
+            "cvd": flow["cvd"],
             "rs_score": rs_score,
             "ranges_30m": ranges_30m,
-            "oi_latest": oi_data[0]["openInterest"] if oi_data else None,
-            "lsr_latest": lsr_data[0]["ratio"] if lsr_data else None,
-            "absorption": {
-                "confirmed": absorption_confirmed,
-                "details": absorption_details
-            },
+            "oi_latest": flow["oi_latest"],
+            "lsr_latest": flow["lsr_latest"],
+            "absorption": flow["absorption"],
             "sfp": {
                 "signal": sfp_signal,
                 "details": sfp_details
@@ -1052,9 +1175,6 @@ def analyze_candles(
                 "signal": rsi_crossover_btc,
                 "details": rsi_crossover_details
             },
-            "liquidity_hunt": {
-                "target": liquidity_hunt,
-                "details": liquidity_details
-            }
+            "liquidity_hunt": flow["liquidity_hunt"]
         }
     }
@@ -0,0 +1,187 @@
+"""
+10D - Indicator Calculator (NumPy backend)
+Vectorized SMA, EMA, MACD, Bollinger Bands, RSI and ATR.
+
+The list functions mirror indicator_calculator's signatures and return values
+(lists with None during warm-up). Rolling windows are summed column by column
+in the same order as the Python reference, so results are bit-identical rather
+than merely close; EMA and Wilder smoothing are recursive and stay sequential.
+The *_array functions return float64 arrays (NaN during warm-up) for callers
+that stay in NumPy.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import sys
+import os
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import MACD_FAST, MACD_SLOW, MACD_SIGNAL, BB_PERIOD, BB_STD_DEV, RSI_PERIOD, ATR_PERIOD
+from services.candle_frame import candle_array
+from services import jit_kernels
+
+
+def _as_array(values: Sequence[float]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _to_list(arr: np.ndarray) -> List[Optional[float]]:
+    """float64 array -> list with None where NaN"""
+    return [None if v != v else v for v in arr.tolist()]
+
+
+def _rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """Sum of each full window, accumulated left to right like Python's sum()"""
+    windows = sliding_window_view(values, period)
+    total = windows[:, 0].copy()
+    for k in range(1, period):
+        total += windows[:, k]
+    return total
+
+
+# =============================================================================
+# ARRAY API
+# =============================================================================
+
+def sma_array(closes: Sequence[float], period: int) -> np.ndarray:
+    closes = _as_array(closes)
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period:
+        return out
+    out[period - 1:] = _rolling_sum(closes, period) / period
+    return out
+
+
+def ema_array(closes: Sequence[float], period: int) -> np.ndarray:
+    values = _as_array(closes)
+    out = np.full(len(values), np.nan)
+    if len(values) < period:
+        return out
+
+    # Recursive filter: sequential on Python floats (exact match with the reference)
+    data = values.tolist()
+    multiplier = 2 / (period + 1)
+    prev = sum(data[:period]) / period
+    out[period - 1] = prev
+    for i in range(period, len(data)):
+        prev = (data[i] - prev) * multiplier + prev
+        out[i] = prev
+    return out
+
+
+def macd_arrays(closes: Sequence[float]) -> Dict[str, np.ndarray]:
+    closes = _as_array(closes)
+    macd = ema_array(closes, MACD_FAST) - ema_array(closes, MACD_SLOW)
+    signal = np.full(len(closes), np.nan)
+
+    valid = np.flatnonzero(~np.isnan(macd))
+    if len(valid) >= MACD_SIGNAL:
+        signal[valid[0]:] = ema_array(macd[valid[0]:], MACD_SIGNAL)
+    return {"macd": macd, "signal": signal, "histogram": macd - signal}
+
+
+def bollinger_arrays(closes: Sequence[float], period: int = BB_PERIOD, std_dev: int = BB_STD_DEV) -> Dict[str, np.ndarray]:
+    closes = _as_array(closes)
+    middle = sma_array(closes, period)
+    upper = np.full(len(closes), np.nan)
+    lower = np.full(len(closes), np.nan)
+    if len(closes) < period:
+        return {"upper": upper, "middle": middle, "lower": lower}
+
+    windows = sliding_window_view(closes, period)
+    mean = middle[period - 1:]
+    sq = (windows[:, 0] - mean) ** 2
+    for k in range(1, period):
+        sq += (windows[:, k] - mean) ** 2
+    stdev = (sq / period) ** 0.5
+
+    upper[period - 1:] = mean + std_dev * stdev
+    lower[period - 1:] = mean - std_dev * stdev
+    return {"upper": upper, "middle": middle, "lower": lower}
+
+
+def rsi_array(closes: Sequence[float], period: int = RSI_PERIOD) -> np.ndarray:
+    closes = _as_array(closes)
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period + 1:
+        return out
+
+    if jit_kernels.ENABLED:
+        out[period:] = [round(v, 2) for v in jit_kernels.wilder_rsi(closes, period)[period:].tolist()]
+        return out
+
+    change = np.diff(closes)
+    gains = np.maximum(change, 0.0).tolist()
+    losses = np.maximum(-change, 0.0).tolist()
+
+    # Wilder smoothing is recursive -> sequential
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for i in range(period - 1, len(gains)):
+        if i > period - 1:
+            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        if avg_loss == 0:
+            rsi = 100
+        else:
+            rs = avg_gain / avg_loss
+            rsi = 100 - (100 / (1 + rs))
+        out[i + 1] = round(rsi, 2)
+    return out
+
+
+def true_range_array(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    """TR per bar (NaN for the first bar, which has no previous close)"""
+    tr = np.full(len(closes), np.nan)
+    if len(closes) < 2:
+        return tr
+    h, l, pc = highs[1:], lows[1:], closes[:-1]
+    tr[1:] = np.maximum(np.maximum(h - l, np.abs(h - pc)), np.abs(l - pc))
+    return tr
+
+
+def atr_array(candles, period: int = ATR_PERIOD) -> np.ndarray:
+    highs = candle_array(candles, "high")
+    lows = candle_array(candles, "low")
+    closes = candle_array(candles, "close")
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period + 1:
+        return out
+    # Simple mean of the last `period` true ranges (same as the reference, not Wilder)
+    tr = true_range_array(highs, lows, closes)
+    out[period:] = _rolling_sum(tr[1:], period) / period
+    return out
+
+
+# =============================================================================
+# LIST API (drop-in for indicator_calculator)
+# =============================================================================
+
+def calculate_sma(closes: List[float], period: int) -> List[Optional[float]]:
+    return _to_list(sma_array(closes, period))
+
+
+def calculate_ema(closes: List[float], period: int) -> List[Optional[float]]:
+    return _to_list(ema_array(closes, period))
+
+
+def calculate_macd(closes: List[float]) -> Dict[str, List[Optional[float]]]:
+    return {k: _to_list(v) for k, v in macd_arrays(closes).items()}
+
+
+def calculate_bollinger_bands(closes: List[float], period: int = BB_PERIOD, std_dev: int = BB_STD_DEV) -> Dict[str, List[Optional[float]]]:
+    return {k: _to_list(v) for k, v in bollinger_arrays(closes, period, std_dev).items()}
+
+
+def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> List[Optional[float]]:
+    return _to_list(rsi_array(closes, period))
+
+
+def calculate_atr(candles, period: int = ATR_PERIOD) -> List[Optional[float]]:
+    if len(candles) < 2:
+        return [None] * len(candles)
+    return _to_list(atr_array(candles, period))
@@ -0,0 +1,87 @@
+"""
+10D - Institutional Data
+Lazy per-pair trades / open interest / long-short ratio for one scan cycle.
+
+Most pairs produce no EMA, pullback, RSI+BB or Judas candidate, and none of
+those detectors read order-flow data, so the scan no longer requests it up
+front. Each series is fetched on first access and memoized on the pair's
+InstitutionalData, so the order-flow analysis and the AI feature capture of
+the same pair share one request per endpoint.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+# field -> (client method, positional args); same parameters analyze_pair always used
+FETCHES = {
+    "trades": ("get_recent_trades", (100,)),
+    "oi_data": ("get_open_interest", ("30min", 10)),
+    "lsr_data": ("get_long_short_ratio", ("30min", 10))
+}
+
+
+class InstitutionalStats:
+    """Pairs seen vs order-flow requests actually made, across scan cycles"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {"pairs": 0, "requests": 0, **{field: 0 for field in FETCHES}}
+
+    def pair(self):
+        with self._lock:
+            self._stats["pairs"] += 1
+
+    def fetched(self, field: str):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats[field] += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        eager = stats["pairs"] * len(FETCHES)
+        stats["deferred_ratio"] = round(1 - stats["requests"] / eager, 3) if eager else 0.0
+        return stats
+
+
+class InstitutionalData:
+    """Order-flow inputs of one pair; each attribute triggers its fetch on first read"""
+
+    def __init__(self, client, symbol: str, stats: Optional[InstitutionalStats] = None):
+        self.client = client
+        self.symbol = symbol
+        self.stats = stats
+        self._values: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+        if stats is not None:
+            stats.pair()
+
+    def _get(self, field: str) -> List[Dict]:
+        with self._lock:
+            if field not in self._values:
+                method, args = FETCHES[field]
+                self._values[field] = getattr(self.client, method)(self.symbol, *args)
+                if self.stats is not None:
+                    self.stats.fetched(field)
+            return self._values[field]
+
+    @property
+    def trades(self) -> List[Dict]:
+        return self._get("trades")
+
+    @property
+    def oi_data(self) -> List[Dict]:
+        return self._get("oi_data")
+
+    @property
+    def lsr_data(self) -> List[Dict]:
+        return self._get("lsr_data")
+
+    @property
+    def fetched(self) -> List[str]:
+        with self._lock:
+            return list(self._values)
+
+
+# Global instance
+institutional_stats = InstitutionalStats()
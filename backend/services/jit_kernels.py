@@ -0,0 +1,154 @@
+"""
+10D - JIT Kernels
+Numba-compiled loops for the sequential parts of the detectors: Wilder RSI
+smoothing, the Judas Swing reclaim search, candlestick pattern flags and the
+Fibonacci swing range.
+
+Numba is optional. Without it (or with JIT_KERNELS_ENABLED off) ENABLED is
+False and callers keep their pure-Python paths. The kernels are plain Python
+loops over float64 arrays, so the same code also runs uncompiled, which is
+how the parity tests exercise it when Numba is not installed.
+"""
+
+import math
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import JIT_KERNELS_ENABLED
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below stay importable as Python functions"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Read at call time by the dispatching callers
+ENABLED = NUMBA_AVAILABLE and JIT_KERNELS_ENABLED
+
+# Column order of candlestick_flags
+PATTERN_FLAGS = (
+    "hammer", "shooting_star", "bullish_engulfing", "bearish_engulfing",
+    "doji", "heavy_wick_top", "heavy_wick_bottom", "flat"
+)
+
+
+@njit(cache=True)
+def wilder_rsi(closes, period):
+    """Unrounded Wilder RSI per bar (NaN during warm-up); callers round like calculate_rsi"""
+    n = len(closes)
+    out = np.full(n, np.nan)
+    if n < period + 1:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n - 1):
+        change = closes[i + 1] - closes[i]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i < period:
+            # Seed: plain sums of the first `period` changes, in bar order
+            avg_gain += gain
+            avg_loss += loss
+            if i < period - 1:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss == 0:
+            out[i + 1] = 100.0
+        else:
+            out[i + 1] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+@njit(cache=True)
+def false_break(levels, o, h, l, c, atr, long, dev_low, dev_high, reclaim_max, wick_ratio):
+    """
+    detect_judas_swing reclaim search over the last 4 bars.
+    Returns (level index, break bar offset from the end, reclaim candles,
+    deviation in ATRs), with level index -1 when nothing fires.
+    """
+    n = len(c)
+    scale = atr if atr > 0 else 1.0
+    for k in range(len(levels)):
+        level = levels[k]
+        for i in range(n - 4, n - 1):
+            if long:
+                broke = l[i] < level
+                deviation = (level - l[i]) / scale
+            else:
+                broke = h[i] > level
+                deviation = (h[i] - level) / scale
+            if not broke or deviation < dev_low or deviation > dev_high:
+                continue
+            for j in range(i + 1, n):
+                inside = c[j] > level if long else c[j] < level
+                if not inside:
+                    continue
+                # Only the first reclaiming close counts
+                if j - i <= reclaim_max:
+                    body = abs(c[j] - o[j])
+                    total = h[j] - l[j]
+                    if total > 0 and (total - body) / total >= wick_ratio:
+                        return k, i - n, j - i, deviation
+                break
+    return -1, 0, 0, 0.0
+
+
+@njit(cache=True)
+def candlestick_flags(o, h, l, c):
+    """(bars x PATTERN_FLAGS) detect_candlestick_patterns flags for every bar with a previous bar"""
+    n = len(c)
+    flags = np.zeros((n, 8), dtype=np.bool_)
+    for i in range(1, n):
+        body = abs(c[i] - o[i])
+        upper_wick = h[i] - max(o[i], c[i])
+        lower_wick = min(o[i], c[i]) - l[i]
+        total_range = h[i] - l[i]
+        if total_range == 0:
+            flags[i, 4] = True
+            flags[i, 7] = True
+            continue
+
+        if body <= total_range * 0.3 and lower_wick >= body * 2 and upper_wick <= body * 0.5:
+            flags[i, 0] = c[i] > o[i]
+        if body <= total_range * 0.3 and upper_wick >= body * 2 and lower_wick <= body * 0.5:
+            flags[i, 1] = c[i] < o[i]
+
+        p_body = abs(c[i - 1] - o[i - 1])
+        if body > p_body and p_body > 0:
+            if c[i] > o[i] and c[i - 1] < o[i - 1]:
+                flags[i, 2] = True
+            elif c[i] < o[i] and c[i - 1] > o[i - 1]:
+                flags[i, 3] = True
+
+        flags[i, 4] = body <= total_range * 0.1
+        flags[i, 5] = upper_wick > total_range * 0.5
+        flags[i, 6] = lower_wick > total_range * 0.5
+    return flags
+
+
+@njit(cache=True)
+def swing_range(highs, lows):
+    """(highest high, lowest low) for calculate_fibonacci_levels"""
+    swing_high = -math.inf
+    swing_low = math.inf
+    for i in range(len(highs)):
+        if highs[i] > swing_high:
+            swing_high = highs[i]
+        if lows[i] < swing_low:
+            swing_low = lows[i]
+    return swing_high, swing_low
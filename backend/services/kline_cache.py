@@ -0,0 +1,224 @@
+"""
+10D - Kline Cache
+Per-(symbol, interval) columnar candle series (CandleFrame) kept inside the
+client layer. After a warm start each refresh only downloads the candles opened
+since the last cached bar and patches the still-forming bar. Callers get
+slices of the cached frame; dict readers share row dicts built once per bar.
+Closed bars are persisted to the CandleStore and reloaded after a restart.
+"""
+
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import KLINE_CACHE_CAPACITY
+from services.candle_frame import CandleFrame
+from services.candle_store import CandleStore, candle_store
+
+# Bar length per Bybit interval. "M" (month) has no fixed length and is never cached.
+INTERVAL_MS = {
+    "1": 60_000,
+    "3": 3 * 60_000,
+    "5": 5 * 60_000,
+    "15": 15 * 60_000,
+    "30": 30 * 60_000,
+    "60": 60 * 60_000,
+    "120": 120 * 60_000,
+    "240": 240 * 60_000,
+    "360": 360 * 60_000,
+    "720": 720 * 60_000,
+    "D": 86_400_000,
+    "W": 7 * 86_400_000
+}
+
+# Bybit caps a single kline request at 1000 candles
+MAX_FETCH = 1000
+
+Candles = Union[CandleFrame, List[Dict]]
+
+
+def _as_dicts(candles: Candles) -> List[Dict]:
+    return candles.to_dicts() if isinstance(candles, CandleFrame) else candles
+
+
+class KlineCache:
+    """
+    Thread-safe candle cache.
+
+    fetch_fn(n) must return the latest n candles in chronological order,
+    as a CandleFrame (parse_klines_columnar) or candle dicts (parse_klines).
+    Each update stores a new frame; frames already handed out never change.
+    """
+
+    def __init__(self, capacity: int = KLINE_CACHE_CAPACITY, store: Optional[CandleStore] = None):
+        self.capacity = min(int(capacity), MAX_FETCH)
+        self.store = store
+        self._series: Dict[Tuple[str, str], CandleFrame] = {}
+        self._maxlen: Dict[Tuple[str, str], int] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "full_fetches": 0,
+            "incremental_fetches": 0,
+            "candles_downloaded": 0,
+            "candles_served": 0,
+            "store_loads": 0
+        }
+
+    def _key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _count(self, stat: str, n: int = 1):
+        with self._lock:
+            self._stats[stat] += n
+
+    def get(self, symbol: str, interval: str, limit: int, fetch_fn: Callable[[int], Candles],
+            as_dicts: bool = False) -> Candles:
+        """
+        Latest `limit` candles for symbol/interval, downloading only what is missing.
+        
+        Returns a CandleFrame slice of the cached series (column views, no copy),
+        or the list of candle dicts with as_dicts=True. Row dicts are built once
+        per series and carried across updates, so only new bars are converted.
+        """
+        step = INTERVAL_MS.get(interval)
+        if step is None or limit > self.capacity:
+            candles = fetch_fn(limit)
+            return _as_dicts(candles) if as_dicts else CandleFrame.from_dicts(candles)
+
+        key = (symbol, interval)
+        with self._key_lock(key):
+            series = self._window(key, limit, fetch_fn, step)
+        if as_dicts:
+            return series.to_dicts()[-limit:]
+        return series[-limit:]
+
+    def _window(self, key: Tuple[str, str], limit: int, fetch_fn: Callable[[int], Candles], step: int) -> CandleFrame:
+        """Refreshed series for `key` (caller holds the key lock); may be longer than `limit`"""
+        with self._lock:
+            series = self._series.get(key)
+        from_store = False
+        if series is None and self.store is not None:
+            series = self._load_from_store(key, limit)
+            from_store = series is not None
+
+        # A disk seed may be short by the bars opened since shutdown; the
+        # incremental fetch below fills those in
+        if series is None or (len(series) < limit and not from_store):
+            return self._full_fetch(key, limit, fetch_fn)
+
+        # Bars opened since the last cached one, +1 to re-read (patch) the
+        # previously forming bar, +1 margin for clock skew against the exchange
+        now_ms = int(time.time() * 1000)
+        missing = max(0, (now_ms - int(series.timestamp[-1])) // step)
+        fetch_n = missing + 2
+        if fetch_n > limit:
+            return self._full_fetch(key, limit, fetch_fn)
+
+        fresh = CandleFrame.from_dicts(fetch_fn(fetch_n))
+        if not fresh:
+            return CandleFrame.empty()
+        self._count("incremental_fetches")
+        self._count("candles_downloaded", len(fresh))
+
+        merged = self._merge(series, fresh, self._maxlen.get(key, limit))
+        if merged is None or len(merged) < limit:
+            # Fresh data does not overlap the cache (gap) or the seed was too short -> resync
+            return self._full_fetch(key, limit, fetch_fn)
+
+        with self._lock:
+            self._series[key] = merged
+        self._persist(key, merged, step)
+        self._count("candles_served", limit)
+        return merged
+
+    def _full_fetch(self, key: Tuple[str, str], limit: int, fetch_fn: Callable[[int], Candles]) -> CandleFrame:
+        candles = CandleFrame.from_dicts(fetch_fn(limit))
+        self._count("full_fetches")
+        self._count("candles_downloaded", len(candles))
+        if candles:
+            # The per-key lock orders writers of this series; self._lock guards the
+            # dicts themselves against get_stats/invalidate running on other threads
+            with self._lock:
+                self._maxlen[key] = max(limit, self._maxlen.get(key, 0))
+                self._series[key] = candles
+            self._persist(key, candles, INTERVAL_MS[key[1]])
+        return candles
+
+    def _load_from_store(self, key: Tuple[str, str], limit: int) -> Optional[CandleFrame]:
+        """Seed a series from disk (closed bars saved before the last shutdown)"""
+        series = self.store.load_frame(key[0], key[1], limit)
+        if not series:
+            return None
+        self._count("store_loads")
+        with self._lock:
+            self._series[key] = series
+            self._maxlen[key] = limit
+        return series
+
+    def _persist(self, key: Tuple[str, str], series: CandleFrame, step: int):
+        """
+        Append bars that closed since the last write; rewrite the file only if
+        they do not continue it (after a resync gap). Calls within the same bar
+        return before touching the file.
+        """
+        if self.store is None or not series:
+            return
+        try:
+            last_ts = self.store.last_timestamp(*key)
+            now_ms = int(time.time() * 1000)
+            ts = series.timestamp
+            closed = int(np.searchsorted(ts, now_ms - step, side="right"))  # bars with ts + step <= now
+            if closed == 0 or (last_ts is not None and ts[closed - 1] <= last_ts):
+                return
+            first_new = 0 if last_ts is None else int(np.searchsorted(ts, last_ts, side="right"))
+            if last_ts is not None and ts[first_new] != last_ts + step:
+                self.store.replace(key[0], key[1], series[:closed])
+            else:
+                self.store.append(key[0], key[1], series[first_new:closed])
+        except OSError as e:
+            print(f"[KLINE CACHE] [WARN] Could not persist {key[0]} {key[1]}: {e}", flush=True)
+
+    @staticmethod
+    def _merge(series: CandleFrame, fresh: CandleFrame, maxlen: int) -> Optional[CandleFrame]:
+        """
+        New frame with chronological `fresh` candles patched over / appended to
+        `series` (the old frame is never modified: slices of it may be in use).
+        None on a gap.
+        """
+        if fresh.timestamp[0] > series.timestamp[-1]:
+            return None
+        keep = int(np.searchsorted(series.timestamp, fresh.timestamp[0], side="left"))
+        return CandleFrame.concat(series[:keep], fresh, maxlen)
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop cached series (all, or all intervals of one symbol)"""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+                self._maxlen.clear()
+            else:
+                for key in [k for k in self._series if k[0] == symbol]:
+                    del self._series[key]
+                    self._maxlen.pop(key, None)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["series"] = len(self._series)
+            stats["cached_candles"] = sum(len(s) for s in self._series.values())
+            stats["persistent"] = self.store is not None
+        return stats
+
+
+# Process-wide cache shared by all BybitClient instances
+shared_kline_cache = KlineCache(store=candle_store)
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Tuple, Optional
 from .base_agent import BaseAgent
+from services.ticker_snapshot import ticker_snapshots
 import json
 from datetime import datetime
 
@@ -176,12 +177,11 @@ class EliteManagerAgent(BaseAgent):
         print(f"[CAPTAIN] 🔍 Checking sector heat for {symbol} (Related: {related})...", flush=True)
         
         try:
-            tickers = bybit_client.get_all_tickers()
-            price_map = {t["symbol"]: float(t["lastPrice"]) for t in tickers if "symbol" in t}
+            snapshot = ticker_snapshots.get_snapshot(client=bybit_client)
             # Simplified check: if > 50% of the sector is down, it's 'COLD'
             downs = 0
             for r_sym in related:
-                ticker = next((t for t in tickers if t["symbol"] == r_sym), None)
+                ticker = snapshot.get(r_sym)
                 if ticker and float(ticker.get("price24hPcnt", 0)) < 0:
                     downs += 1
             
@@ -6,6 +6,7 @@ Uses Gemini free tier to validate signals, optimize TPs, and analyze exit opport
 import os
 import time
 import json
+import threading
 from typing import Dict, Optional, List
 from datetime import datetime
 import hashlib
@@ -24,6 +25,8 @@ class LLMTradingBrain:
         self.model = None
         self.db_manager = None  # Reference to DatabaseManager for learning
         self.cache: Dict[str, Dict] = {}  # Simple in-memory cache
+        # Cache, rate-limit counter and stats are shared by the parallel scan workers
+        self._lock = threading.Lock()
         self.cache_ttl = self.config.get("LLM_CACHE_TTL_SECONDS", 300)
         self.min_confidence = self.config.get("LLM_MIN_CONFIDENCE", 0.6)
         self.rag_memory = rag_memory
@@ -154,7 +157,7 @@ class LLMTradingBrain:
             system_stats = self._get_system_stats()
             self.learning_context = system_stats
             self.learning_context_timestamp = time.time()
-            self.stats["learning_context_refreshes"] += 1
+            self._count("learning_context_refreshes")
             print(f"[LLM] [REFRESH] Learning context refreshed - {system_stats.get('total_trades', 0)} trades analyzed", flush=True)
         
         # Build context string
@@ -215,20 +218,26 @@ class LLMTradingBrain:
             print(f"[LLM] [ERROR] Failed to initialize Gemini: {e}", flush=True)
             self.model = None
     
+    def _count(self, stat: str):
+        """Increment one of self.stats"""
+        with self._lock:
+            self.stats[stat] += 1
+    
     def _check_rate_limit(self) -> bool:
         """Check and update rate limit. Returns True if request allowed."""
         current_time = time.time()
         
-        # Reset counter if minute has passed
-        if current_time - self.minute_start >= 60:
-            self.requests_this_minute = 0
-            self.minute_start = current_time
-        
-        if self.requests_this_minute >= self.max_requests_per_minute:
-            return False
-        
-        self.requests_this_minute += 1
-        return True
+        with self._lock:
+            # Reset counter if minute has passed
+            if current_time - self.minute_start >= 60:
+                self.requests_this_minute = 0
+                self.minute_start = current_time
+            
+            if self.requests_this_minute >= self.max_requests_per_minute:
+                return False
+            
+            self.requests_this_minute += 1
+            return True
     
     def _get_cache_key(self, prefix: str, data: Dict) -> str:
         """Generate cache key from data"""
@@ -237,26 +246,27 @@ class LLMTradingBrain:
     
     def _get_from_cache(self, key: str) -> Optional[Dict]:
         """Get cached response if still valid"""
-        if key in self.cache:
-            entry = self.cache[key]
-            if time.time() - entry["timestamp"] < self.cache_ttl:
-                self.stats["cache_hits"] += 1
-                return entry["data"]
-            else:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if time.time() - entry["timestamp"] < self.cache_ttl:
+                    self.stats["cache_hits"] += 1
+                    return entry["data"]
                 del self.cache[key]
         return None
     
     def _save_to_cache(self, key: str, data: Dict):
         """Save response to cache"""
-        self.cache[key] = {
-            "timestamp": time.time(),
-            "data": data
-        }
-        
-        # Limit cache size
-        if len(self.cache) > 100:
-            oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k]["timestamp"])
-            del self.cache[oldest_key]
+        with self._lock:
+            self.cache[key] = {
+                "timestamp": time.time(),
+                "data": data
+            }
+            
+            # Limit cache size
+            if len(self.cache) > 100:
+                oldest_key = min(self.cache, key=lambda k: self.cache[k]["timestamp"])
+                del self.cache[oldest_key]
     
     def call_gemini(self, prompt: str, max_tokens: int = 500) -> Optional[str]:
         """Call Gemini API with rate limiting and error handling (Public)"""
@@ -272,7 +282,7 @@ class LLMTradingBrain:
             return None
         
         try:
-            self.stats["total_requests"] += 1
+            self._count("total_requests")
             response = self.model.generate_content(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
@@ -282,7 +292,7 @@ class LLMTradingBrain:
             )
             return response.text
         except Exception as e:
-            self.stats["errors"] += 1
+            self._count("errors")
             print(f"[LLM] [ERROR] Gemini API error: {e}", flush=True)
             return None
     
@@ -354,7 +364,7 @@ class LLMTradingBrain:
             result.setdefault("suggested_action", "PROCEED" if result["approved"] else "SKIP")
             
             if result["approved"]:
-                self.stats["validations_approved"] += 1
+                self._count("validations_approved")
                 print(f"[COUNCIL] [OK] APPROVED: {result.get('reasoning')}", flush=True)
                 
                 # Log to DB (Compatibility Mode)
@@ -380,7 +390,7 @@ class LLMTradingBrain:
                     self.log_callback("gemini", "COUNCIL_APPROVE", f"✅ FINAL DECISION: {result.get('reasoning')}", result)
 
             else:
-                self.stats["validations_rejected"] += 1
+                self._count("validations_rejected")
                 print(f"[COUNCIL] [X] REJECTED: {result.get('reasoning')}", flush=True)
                 
                 # Log to DB (Compatibility Mode)
@@ -484,7 +494,7 @@ RESPOND IN JSON FORMAT ONLY:
             elif result["suggested_tp_pct"] > 8:
                 result["suggested_tp_pct"] = 8.0
             
-            self.stats["tp_optimizations"] += 1
+            self._count("tp_optimizations")
             self._save_to_cache(cache_key, result)
             return result
         
@@ -569,7 +579,7 @@ RESPOND IN JSON FORMAT ONLY:
             if result["action"] not in ["HOLD", "PARTIAL", "EXIT"]:
                 result["action"] = "HOLD"
             
-            self.stats["exit_analyses"] += 1
+            self._count("exit_analyses")
             self._save_to_cache(cache_key, result)
             return result
         
@@ -647,19 +657,20 @@ RESPOND IN JSON FORMAT ONLY:
 
     def get_status(self) -> Dict:
         """Get LLM Brain status and statistics"""
-        return {
-            "enabled": self.model is not None,
-            "model": self.config.get("LLM_MODEL", "gemini-1.5-flash"),
-            "rate_limit": {
-                "requests_this_minute": self.requests_this_minute,
-                "max_per_minute": self.max_requests_per_minute
-            },
-            "cache": {
-                "entries": len(self.cache),
-                "ttl_seconds": self.cache_ttl
-            },
-            "stats": self.stats
-        }
+        with self._lock:
+            return {
+                "enabled": self.model is not None,
+                "model": self.config.get("LLM_MODEL", "gemini-1.5-flash"),
+                "rate_limit": {
+                    "requests_this_minute": self.requests_this_minute,
+                    "max_per_minute": self.max_requests_per_minute
+                },
+                "cache": {
+                    "entries": len(self.cache),
+                    "ttl_seconds": self.cache_ttl
+                },
+                "stats": dict(self.stats)
+            }
     
     def is_enabled(self) -> bool:
         """Check if LLM is properly initialized and enabled"""
@@ -0,0 +1,111 @@
+"""
+10D - Market Recorder
+Captures every Bybit REST response to compressed on-disk segments
+(gzip JSON lines) so scans can be replayed offline by market_replay_server.
+Enabled by setting BYBIT_RECORD_DIR.
+"""
+
+import gzip
+import json
+import time
+import atexit
+import threading
+from typing import Dict, Iterator, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import MARKET_RECORD_DIR, MARKET_RECORD_SEGMENT_RECORDS
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+FLUSH_EVERY = 50
+
+
+class MarketRecorder:
+    """
+    Thread-safe append-only recorder.
+
+    Each record: {"t": unix_seconds, "endpoint": "/v5/...", "params": {...},
+                  "latency_ms": float, "response": <full Bybit JSON>}
+    Segments rotate every `segment_records` responses.
+    """
+
+    def __init__(self, directory: str, segment_records: int = MARKET_RECORD_SEGMENT_RECORDS):
+        self.directory = directory
+        self.segment_records = max(1, int(segment_records))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._fh = None
+        self._segment_index = len(list_segments(directory))
+        self._segment_count = 0
+        self._total = 0
+        atexit.register(self.close)
+
+    def _open_segment(self):
+        self._segment_index += 1
+        path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{self._segment_index:05d}{SEGMENT_SUFFIX}")
+        self._fh = gzip.open(path, "wt", encoding="utf-8")
+        self._segment_count = 0
+        print(f"[RECORDER] Writing {path}", flush=True)
+
+    def record(self, endpoint: str, params: Optional[Dict], response: Dict, latency_ms: float = 0.0):
+        line = json.dumps({
+            "t": round(time.time(), 3),
+            "endpoint": endpoint,
+            "params": {k: str(v) for k, v in (params or {}).items()},
+            "latency_ms": round(latency_ms, 2),
+            "response": response
+        }, separators=(",", ":"))
+
+        with self._lock:
+            if self._fh is None or self._segment_count >= self.segment_records:
+                self._close_segment()
+                self._open_segment()
+            self._fh.write(line + "\n")
+            self._segment_count += 1
+            self._total += 1
+            if self._total % FLUSH_EVERY == 0:
+                self._fh.flush()
+
+    def _close_segment(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def close(self):
+        with self._lock:
+            self._close_segment()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {"directory": self.directory, "segments": self._segment_index, "records": self._total}
+
+
+def list_segments(directory: str) -> List[str]:
+    """Segment paths in recording order"""
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(n for n in os.listdir(directory) if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(directory, n) for n in names]
+
+
+def load_recordings(directory: str) -> Iterator[Dict]:
+    """Yield records from every segment; a segment cut short by a crash is read up to its last full line"""
+    for path in list_segments(directory):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+        except (EOFError, OSError) as e:
+            print(f"[RECORDER] Truncated segment {path}: {e}", flush=True)
+
+
+# Process-wide recorder (None unless BYBIT_RECORD_DIR is set)
+market_recorder = MarketRecorder(MARKET_RECORD_DIR) if MARKET_RECORD_DIR else None
@@ -0,0 +1,223 @@
+"""
+10D - Market Replay Server
+Local fake Bybit REST server that replays MarketRecorder segments with
+realistic latency and X-Bapi-Limit-* rate-limit headers.
+
+    python services/market_replay_server.py data/recordings --port 8899
+    BYBIT_BASE_URL=http://127.0.0.1:8899 python app.py
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qsl
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.market_recorder import load_recordings
+
+# Bybit-like per-endpoint budget advertised in the headers
+DEFAULT_RATE_LIMIT = 120  # requests per second per endpoint
+RATE_LIMIT_RET_CODE = 10006
+
+
+def _query_key(params: Dict) -> Tuple:
+    return tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+class ReplayStore:
+    """
+    Recorded responses indexed by (endpoint, query).
+
+    Identical requests replay their recordings in order (the last one repeats).
+    A request whose `limit` was never recorded is served from a recording of the
+    same query with a larger limit, trimmed (Bybit lists are newest-first).
+    """
+
+    def __init__(self, records: List[Dict]):
+        self._exact: Dict[Tuple, List[Dict]] = defaultdict(list)
+        self._by_limit: Dict[Tuple, List[Tuple[int, Dict]]] = defaultdict(list)
+        self._cursor: Dict[Tuple, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.latencies: List[float] = []
+
+        for rec in records:
+            params = rec.get("params", {})
+            self._exact[(rec["endpoint"], _query_key(params))].append(rec["response"])
+            if "limit" in params:
+                base = {k: v for k, v in params.items() if k != "limit"}
+                self._by_limit[(rec["endpoint"], _query_key(base))].append((int(params["limit"]), rec["response"]))
+            if rec.get("latency_ms"):
+                self.latencies.append(rec["latency_ms"])
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._exact.values())
+
+    def lookup(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        key = (endpoint, _query_key(params))
+        with self._lock:
+            responses = self._exact.get(key)
+            if responses:
+                i = self._cursor[key]
+                self._cursor[key] = i + 1
+                return responses[min(i, len(responses) - 1)]
+
+        if "limit" in params:
+            limit = int(params["limit"])
+            base = {k: v for k, v in params.items() if k != "limit"}
+            candidates = [r for n, r in self._by_limit.get((endpoint, _query_key(base)), []) if n >= limit]
+            if candidates:
+                response = json.loads(json.dumps(candidates[-1]))
+                result = response.get("result") or {}
+                if isinstance(result.get("list"), list):
+                    result["list"] = result["list"][:limit]
+                return response
+
+        if endpoint == "/v5/market/time":
+            now = time.time()
+            return {"retCode": 0, "retMsg": "OK", "result": {
+                "timeSecond": str(int(now)), "timeNano": str(int(now * 1e9))
+            }}
+        return None
+
+
+class MarketReplayServer:
+    """ThreadingHTTPServer replaying a recording directory"""
+
+    def __init__(
+        self,
+        directory: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: Optional[float] = None,
+        jitter_ms: float = 5.0,
+        rate_limit: int = DEFAULT_RATE_LIMIT,
+        seed: int = 42
+    ):
+        self.store = ReplayStore(list(load_recordings(directory)))
+        # Default latency: median of what was recorded
+        if latency_ms is None:
+            lat = sorted(self.store.latencies)
+            latency_ms = lat[len(lat) // 2] if lat else 0.0
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self._window_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.served = 0
+        self.misses = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _delay(self) -> float:
+        with self._rng_lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def _rate_headers(self, endpoint: str) -> Tuple[Dict[str, str], bool]:
+        """Per-endpoint 1s window, advertised like Bybit's X-Bapi-Limit-* headers"""
+        now_ms = int(time.time() * 1000)
+        window = now_ms // 1000
+        with self._window_lock:
+            start, used = self._windows.get(endpoint, (window, 0))
+            if start != window:
+                start, used = window, 0
+            used += 1
+            self._windows[endpoint] = (start, used)
+        remaining = max(0, self.rate_limit - used)
+        headers = {
+            "X-Bapi-Limit": str(self.rate_limit),
+            "X-Bapi-Limit-Status": str(remaining),
+            "X-Bapi-Limit-Reset-Timestamp": str((window + 1) * 1000)
+        }
+        return headers, used > self.rate_limit
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        parsed = urlparse(request.path)
+        endpoint = parsed.path
+        params = dict(parse_qsl(parsed.query))
+
+        time.sleep(self._delay())
+        headers, limited = self._rate_headers(endpoint)
+
+        if limited:
+            body = {"retCode": RATE_LIMIT_RET_CODE, "retMsg": "Too many visits!", "result": {}}
+        else:
+            body = self.store.lookup(endpoint, params)
+            with self._lock:
+                if body is None:
+                    self.misses += 1
+                else:
+                    self.served += 1
+            if body is None:
+                body = {"retCode": 10001, "retMsg": f"No recording for {endpoint} {params}", "result": {}}
+
+        payload = json.dumps(body).encode("utf-8")
+        request.send_response(200)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {"recorded": len(self.store), "served": self.served, "misses": self.misses}
+
+    def start(self) -> "MarketReplayServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"[REPLAY] Serving {len(self.store)} recorded responses on {self.url}", flush=True)
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def serve_forever(self):
+        print(f"[REPLAY] Serving {len(self.store)} recorded responses on {self.url}", flush=True)
+        self.httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded Bybit market data")
+    parser.add_argument("directory", help="Directory with segment-*.jsonl.gz files (BYBIT_RECORD_DIR)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency-ms", type=float, default=None, help="Default: recorded median")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--rate-limit", type=int, default=DEFAULT_RATE_LIMIT)
+    args = parser.parse_args()
+
+    MarketReplayServer(
+        args.directory, args.host, args.port,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_limit=args.rate_limit
+    ).serve_forever()
@@ -0,0 +1,152 @@
+"""
+10D - Price Panel
+Timestamp-aligned close prices for many symbols on one dense bar grid.
+
+Each row is one symbol, each column one bar open time. Missing bars are
+forward-filled for display/levels but flagged in `observed`, and returns are
+only valid where both of their bars were actually observed. Cross-asset
+metrics (relative strength, correlation, decoupling vs BTC) are computed for
+the whole universe in a few vectorized passes instead of pairing candles by
+position, which misaligns as soon as one series skips a bar.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import RS_LOOKBACK
+from services.kline_cache import INTERVAL_MS
+from services.candle_frame import candle_array
+
+# Lookback used by BTCRegimeTracker.calculate_decoupling_score
+DECOUPLING_LOOKBACK = 20
+
+
+def same_tail(timestamps_a, timestamps_b, bars: int) -> bool:
+    """True when both series have the same last `bars` bar times (positional pairing is safe)"""
+    if len(timestamps_a) < bars or len(timestamps_b) < bars:
+        return False
+    return list(timestamps_a[-bars:]) == list(timestamps_b[-bars:])
+
+
+class PricePanel:
+    """(symbols x bars) forward-filled closes with an observed-bar mask"""
+
+    def __init__(self, symbols: List[str], timestamps: np.ndarray, closes: np.ndarray, observed: np.ndarray):
+        self.symbols = symbols
+        self.timestamps = timestamps
+        self.closes = closes
+        self.observed = observed
+        self._rows = {s: i for i, s in enumerate(symbols)}
+        self._metrics: Dict[Tuple[str, str, int], np.ndarray] = {}
+
+    @classmethod
+    def build(cls, candles_by_symbol: Dict[str, object], interval: str = "30", bars: int = 100) -> "PricePanel":
+        """Align every series onto the last `bars` grid points ending at the newest bar seen"""
+        step = INTERVAL_MS[interval]
+        series = {s: c for s, c in candles_by_symbol.items() if c is not None and len(c) > 0}
+        symbols = list(series)
+        if not symbols:
+            return cls([], np.empty(0, dtype=np.int64), np.empty((0, 0)), np.empty((0, 0), dtype=bool))
+
+        last = max(int(candle_array(c, "timestamp")[-1]) for c in series.values())
+        last -= last % step
+        timestamps = last - step * np.arange(bars - 1, -1, -1, dtype=np.int64)
+
+        raw = np.full((len(symbols), bars), np.nan)
+        for row, symbol in enumerate(symbols):
+            ts = candle_array(series[symbol], "timestamp").astype(np.int64)
+            col = (ts - timestamps[0]) // step
+            keep = (col >= 0) & (col < bars) & (ts % step == timestamps[0] % step)
+            raw[row, col[keep]] = candle_array(series[symbol], "close")[keep]
+        observed = ~np.isnan(raw)
+
+        # Forward fill along the bar axis; bars before a symbol's first close stay NaN
+        last_seen = np.maximum.accumulate(np.where(observed, np.arange(bars), 0), axis=1)
+        closes = raw[np.arange(len(symbols))[:, None], last_seen]
+        closes[~np.maximum.accumulate(observed, axis=1)] = np.nan
+        return cls(symbols, timestamps, closes, observed)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def window(self, symbol: str, bars: Optional[int] = None) -> np.ndarray:
+        """Forward-filled closes of one symbol on the shared grid"""
+        row = self.closes[self._rows[symbol]]
+        return row[-bars:] if bars else row
+
+    def returns(self, lookback: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(symbols x lookback) bar returns and the mask of returns whose two bars were observed"""
+        c = self.closes[:, -(lookback + 1):]
+        o = self.observed[:, -(lookback + 1):]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = (c[:, 1:] - c[:, :-1]) / c[:, :-1]
+        return r, o[:, 1:] & o[:, :-1]
+
+    def _joint(self, reference: str, lookback: int):
+        r, valid = self.returns(lookback)
+        ref = self._rows[reference]
+        joint = valid & valid[ref]
+        return r, r[ref][None, :], joint
+
+    def relative_strength(self, reference: str = "BTCUSDT", lookback: int = RS_LOOKBACK) -> Dict[str, float]:
+        """Mean (alt - ref) return over bars where the reference dropped (calculate_relative_strength)"""
+        key = ("rs", reference, lookback)
+        if key not in self._metrics:
+            r, ref, joint = self._joint(reference, lookback)
+            drops = joint & (ref < 0)
+            count = drops.sum(axis=1)
+            total = np.where(drops, r - ref, 0.0).sum(axis=1)
+            self._metrics[key] = np.where(count > 0, total / np.maximum(count, 1), 0.0)
+        return dict(zip(self.symbols, self._metrics[key].tolist()))
+
+    def correlation(self, reference: str = "BTCUSDT", lookback: int = DECOUPLING_LOOKBACK) -> Dict[str, Optional[float]]:
+        """Pearson correlation of returns with the reference (None without variance)"""
+        corr, _, _ = self._correlation(reference, lookback)
+        return {s: (None if np.isnan(v) else v) for s, v in zip(self.symbols, corr.tolist())}
+
+    def _correlation(self, reference: str, lookback: int):
+        r, ref, joint = self._joint(reference, lookback)
+        n = joint.sum(axis=1)
+        safe_n = np.maximum(n, 1)
+        a = np.where(joint, r, 0.0)
+        b = np.where(joint, ref, 0.0)
+        a_mean = a.sum(axis=1) / safe_n
+        b_mean = b.sum(axis=1) / safe_n
+        da = np.where(joint, r - a_mean[:, None], 0.0)
+        db = np.where(joint, ref - b_mean[:, None], 0.0)
+        cov = (da * db).sum(axis=1) / safe_n
+        a_std = np.sqrt((da ** 2).sum(axis=1) / safe_n)
+        b_std = np.sqrt((db ** 2).sum(axis=1) / safe_n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.where((a_std == 0) | (b_std == 0) | (n == 0), np.nan, cov / (a_std * b_std))
+        return corr, (a.sum(axis=1), b.sum(axis=1)), n
+
+    def decoupling(self, reference: str = "BTCUSDT", lookback: int = DECOUPLING_LOOKBACK) -> Dict[str, float]:
+        """0..1 independence from the reference (same scale as calculate_decoupling_score)"""
+        key = ("decoupling", reference, lookback)
+        if key not in self._metrics:
+            corr, (alt_total, ref_total), n = self._correlation(reference, lookback)
+            score = (1 - corr) / 2
+            # Alt gaining while the reference is flat/down
+            bonus = (ref_total < 0.01) & (alt_total > 0.02)
+            score = np.where(bonus, np.minimum(1.0, score + 0.2), score)
+            score = np.clip(score, 0.0, 1.0)
+            score = np.where(np.isnan(corr), 0.5, score)
+            self._metrics[key] = np.where(n == 0, 0.0, score)
+        return {s: round(v, 3) for s, v in zip(self.symbols, self._metrics[key].tolist())}
+
+    def metrics(self, symbol: str, reference: str = "BTCUSDT") -> Optional[Dict]:
+        """Cross-asset metrics of one symbol vs the reference (None if either is missing)"""
+        if symbol not in self._rows or reference not in self._rows:
+            return None
+        return {
+            "rs_score": self.relative_strength(reference)[symbol],
+            "decoupling_score": self.decoupling(reference)[symbol]
+        }
@@ -0,0 +1,243 @@
+"""
+10D - Rate Limiter
+Process-wide token buckets (one per Bybit endpoint group) shared by every caller:
+scanner, bankroll, elite agent, health monitor and API routes.
+Buckets adapt to Bybit's X-Bapi-Limit-* response headers, and priority classes
+let TP/SL monitoring go ahead of background scanning when the budget is tight.
+"""
+
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Dict, Mapping, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BYBIT_RATE_LIMITS, BYBIT_RATE_LIMIT_RESERVE
+
+# Priority classes (lower value = served first)
+PRIORITY_HIGH = 0    # TP/SL monitoring, position management
+PRIORITY_NORMAL = 1  # API routes, health checks
+PRIORITY_LOW = 2     # Background scanning
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+ENDPOINT_GROUPS = {
+    "/v5/market/kline": "kline",
+    "/v5/market/tickers": "tickers",
+    "/v5/market/recent-trade": "trades",
+    "/v5/market/open-interest": "derivatives",
+    "/v5/market/account-ratio": "derivatives",
+    "/v5/market/instruments-info": "market",
+    "/v5/market/time": "market"
+}
+DEFAULT_GROUP = "market"
+
+# Bybit retCode for "Too many visits"
+RATE_LIMIT_RET_CODE = 10006
+PENALTY_SECONDS = 1.0
+MAX_WAIT_SLICE = 0.5
+
+
+class TokenBucket:
+    """Refilling bucket; not thread-safe on its own (RateLimiter holds the lock)"""
+
+    def __init__(self, name: str, rate: float, burst: float):
+        self.name = name
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.server_limit: Optional[int] = None
+        self.server_remaining: Optional[int] = None
+        self.waiting = {p: 0 for p in PRIORITIES}
+        self.granted = {p: 0 for p in PRIORITIES}
+        self.total_wait = 0.0
+        self.throttled = 0
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def floor_for(self, priority: int) -> float:
+        """Tokens a priority class must leave in the bucket for higher classes"""
+        return self.capacity * BYBIT_RATE_LIMIT_RESERVE * priority / PRIORITY_LOW
+
+    def try_take(self, priority: int, now: float) -> float:
+        """Take one token. Returns 0 on success, else seconds to wait before retrying."""
+        self.refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        # Higher classes already queued on this bucket go first
+        if any(self.waiting[p] for p in PRIORITIES if p < priority):
+            return 1.0 / self.rate
+
+        floor = self.floor_for(priority)
+        if self.tokens - 1.0 >= floor:
+            self.tokens -= 1.0
+            self.granted[priority] += 1
+            return 0.0
+        return (floor + 1.0 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter keyed by endpoint group.
+
+    The priority for calls made from the current thread is set with:
+
+        with request_priority(PRIORITY_HIGH):
+            client.get_all_tickers()
+    """
+
+    def __init__(self, limits: Mapping[str, tuple] = BYBIT_RATE_LIMITS):
+        self._cond = threading.Condition()
+        self._buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(name, rate, burst) for name, (rate, burst) in limits.items()
+        }
+        if DEFAULT_GROUP not in self._buckets:
+            self._buckets[DEFAULT_GROUP] = TokenBucket(DEFAULT_GROUP, 10, 10)
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Priority context (thread-local)
+    # ------------------------------------------------------------------
+
+    def current_priority(self) -> int:
+        return getattr(self._local, "priority", PRIORITY_NORMAL)
+
+    @contextmanager
+    def priority(self, priority: int):
+        """Set the priority class for requests issued by this thread"""
+        previous = self.current_priority()
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    # ------------------------------------------------------------------
+    # Acquire
+    # ------------------------------------------------------------------
+
+    def bucket_for(self, endpoint: str) -> TokenBucket:
+        return self._buckets.get(ENDPOINT_GROUPS.get(endpoint, DEFAULT_GROUP), self._buckets[DEFAULT_GROUP])
+
+    def acquire(self, endpoint: str, priority: Optional[int] = None) -> float:
+        """Block until a token for `endpoint` is available. Returns seconds waited."""
+        bucket = self.bucket_for(endpoint)
+        priority = self.current_priority() if priority is None else priority
+        start = time.monotonic()
+
+        with self._cond:
+            bucket.waiting[priority] += 1
+            try:
+                while True:
+                    delay = bucket.try_take(priority, time.monotonic())
+                    if delay <= 0:
+                        break
+                    self._cond.wait(min(delay, MAX_WAIT_SLICE))
+            finally:
+                bucket.waiting[priority] -= 1
+                waited = time.monotonic() - start
+                bucket.total_wait += waited
+                # Lower classes re-check once a higher-priority waiter leaves
+                self._cond.notify_all()
+        return waited
+
+    async def acquire_async(self, endpoint: str, priority: Optional[int] = None) -> float:
+        """Awaitable acquire for AsyncBybitClient (never blocks the event loop)"""
+        bucket = self.bucket_for(endpoint)
+        priority = self.current_priority() if priority is None else priority
+        start = time.monotonic()
+
+        with self._cond:
+            bucket.waiting[priority] += 1
+        try:
+            while True:
+                with self._cond:
+                    delay = bucket.try_take(priority, time.monotonic())
+                if delay <= 0:
+                    break
+                await asyncio.sleep(min(delay, MAX_WAIT_SLICE))
+        finally:
+            with self._cond:
+                bucket.waiting[priority] -= 1
+                waited = time.monotonic() - start
+                bucket.total_wait += waited
+                self._cond.notify_all()
+        return waited
+
+    # ------------------------------------------------------------------
+    # Feedback from the exchange
+    # ------------------------------------------------------------------
+
+    def observe(self, endpoint: str, headers: Optional[Mapping[str, str]]):
+        """Adapt a bucket to X-Bapi-Limit-Status / X-Bapi-Limit-Reset-Timestamp"""
+        if not headers:
+            return
+        remaining = headers.get("X-Bapi-Limit-Status")
+        if remaining is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            limit = headers.get("X-Bapi-Limit")
+            reset_ms = headers.get("X-Bapi-Limit-Reset-Timestamp")
+            reset_in = max(0.0, int(reset_ms) / 1000 - time.time()) if reset_ms else PENALTY_SECONDS
+        except (TypeError, ValueError):
+            return
+
+        bucket = self.bucket_for(endpoint)
+        with self._cond:
+            bucket.refill(time.monotonic())
+            bucket.server_remaining = remaining
+            if limit:
+                bucket.server_limit = int(limit)
+            # The exchange also counts other processes sharing our IP/key
+            bucket.tokens = min(bucket.tokens, float(remaining))
+            if remaining <= 0:
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + reset_in)
+            self._cond.notify_all()
+
+    def penalize(self, endpoint: str, seconds: float = PENALTY_SECONDS):
+        """Pause a group after HTTP 429 / retCode 10006"""
+        bucket = self.bucket_for(endpoint)
+        with self._cond:
+            bucket.tokens = 0.0
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+            bucket.throttled += 1
+        print(f"[RATE LIMIT] {bucket.name} throttled by exchange, pausing {seconds:.1f}s", flush=True)
+
+    def get_stats(self) -> Dict:
+        with self._cond:
+            now = time.monotonic()
+            stats = {}
+            for name, bucket in self._buckets.items():
+                bucket.refill(now)
+                granted = sum(bucket.granted.values())
+                stats[name] = {
+                    "rate": bucket.rate,
+                    "tokens": round(bucket.tokens, 2),
+                    "blocked_for_s": round(max(0.0, bucket.blocked_until - now), 2),
+                    "server_limit": bucket.server_limit,
+                    "server_remaining": bucket.server_remaining,
+                    "granted_high": bucket.granted[PRIORITY_HIGH],
+                    "granted_normal": bucket.granted[PRIORITY_NORMAL],
+                    "granted_low": bucket.granted[PRIORITY_LOW],
+                    "throttled": bucket.throttled,
+                    "avg_wait_ms": round(bucket.total_wait / granted * 1000, 2) if granted else 0.0
+                }
+            return stats
+
+
+# Process-wide limiter shared by all Bybit clients
+bybit_rate_limiter = RateLimiter()
+
+
+def request_priority(priority: int):
+    """Context manager / decorator setting the request priority of the current thread"""
+    return bybit_rate_limiter.priority(priority)
@@ -0,0 +1,145 @@
+"""
+10D - Scan Pipeline
+Staged scan execution: each pair flows through a chain of stages (fetch ->
+analyze -> score -> gate), and each stage is a bounded queue drained by its own
+worker threads. A slow stage (a Gemini call, a Supabase upsert) only fills its
+own queue; earlier stages keep working on the next pairs until that queue is
+full, which is the backpressure bound.
+
+submit() returns a Future per item that resolves when the item leaves the last
+stage, so callers can still consume results in a fixed order.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class PipelineStage:
+    """
+    One stage: a bounded input queue and `workers` daemon threads applying `fn`.
+    Jobs are (future, item). `fn` returning None before the last stage drops
+    the item (its future resolves to None); an exception resolves the future
+    with that exception.
+    """
+
+    def __init__(self, name: str, fn: Callable, workers: int, queue_size: int,
+                 next_stage: Optional["PipelineStage"] = None):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.next_stage = next_stage
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stats = {"processed": 0, "dropped": 0, "errors": 0, "busy_s": 0.0, "max_depth": 0}
+        self._started_at: Optional[float] = None
+
+    def start(self):
+        if self._threads:
+            return
+        self._started_at = time.time()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def put(self, future: Future, item):
+        """Enqueue an item, blocking while the stage queue is full"""
+        self.queue.put((future, item))
+        depth = self.queue.qsize()
+        with self._lock:
+            if depth > self._stats["max_depth"]:
+                self._stats["max_depth"] = depth
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            future, item = job
+            start = time.time()
+            try:
+                result = self.fn(item)
+            except Exception as e:
+                self._record(start, "errors")
+                future.set_exception(e)
+                continue
+
+            if self.next_stage is None:
+                self._record(start)
+                future.set_result(result)
+            elif result is None:
+                self._record(start, "dropped")
+                future.set_result(None)
+            else:
+                self._record(start)
+                self.next_stage.put(future, result)
+
+    def _record(self, start: float, outcome: Optional[str] = None):
+        with self._lock:
+            self._stats["processed"] += 1
+            self._stats["busy_s"] += time.time() - start
+            if outcome:
+                self._stats[outcome] += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        elapsed = time.time() - self._started_at if self._started_at else 0.0
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "max_depth": stats["max_depth"],
+            "processed": stats["processed"],
+            "dropped": stats["dropped"],
+            "errors": stats["errors"],
+            "busy_ms": round(stats["busy_s"] * 1000, 1),
+            "throughput_per_s": round(stats["processed"] / elapsed, 2) if elapsed > 0 else 0.0
+        }
+
+
+class ScanPipeline:
+    """Chain of PipelineStages built from (name, fn, workers) tuples"""
+
+    def __init__(self, stages: Sequence[Tuple[str, Callable, int]], queue_size: int):
+        self.stages: List[PipelineStage] = []
+        next_stage = None
+        for name, fn, workers in reversed(stages):
+            next_stage = PipelineStage(name, fn, workers, queue_size, next_stage)
+            self.stages.insert(0, next_stage)
+        self._started = False
+
+    def start(self) -> "ScanPipeline":
+        for stage in self.stages:
+            stage.start()
+        self._started = True
+        return self
+
+    def stop(self):
+        """Let queued items finish, then stop the workers stage by stage"""
+        for stage in self.stages:
+            stage.stop()
+        self._started = False
+
+    def submit(self, item) -> Future:
+        """Feed an item into the first stage; the future resolves with the last stage's output"""
+        if not self._started:
+            self.start()
+        future: Future = Future()
+        future.set_running_or_notify_cancel()  # Not cancellable once queued
+        self.stages[0].put(future, item)
+        return future
+
+    def get_stats(self) -> Dict[str, Dict]:
+        return {stage.name: stage.get_stats() for stage in self.stages}
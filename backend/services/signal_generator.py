@@ -14,6 +14,7 @@ import sys
 import os
 import io
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # FORCE UTF-8 STDOUT/STDERR FOR WINDOWS
 try:
@@ -38,21 +39,32 @@ from config import (
     SNIPER_FORCE_TARGET, SNIPER_DECOUPLING_THRESHOLD, SNIPER_BEST_SCORE_THRESHOLD,
     LLM_ENABLED, LLM_MODEL, LLM_VALIDATE_SIGNALS, LLM_OPTIMIZE_TP,
     LLM_MONITOR_EXITS, LLM_CACHE_TTL_SECONDS, LLM_MIN_CONFIDENCE,
-    MIN_SCORE_TO_SAVE
+    MIN_SCORE_TO_SAVE, STREAMING_INDICATORS_ENABLED, SCAN_BATCH_INDICATORS,
+    SCAN_MODE, SCAN_WORKERS, SCAN_PIPELINE_WORKERS, SCAN_PIPELINE_QUEUE_SIZE,
+    TICKER_PREFILTER_ENABLED
 )
 
 import json
 
 print("[SG] Importing bybit_client...", flush=True)
 from services.bybit_client import BybitClient
+from services.rate_limiter import request_priority, PRIORITY_HIGH, PRIORITY_LOW
+from services.ticker_snapshot import ticker_snapshots
+from services.ticker_prefilter import ticker_prefilter
 print("[SG] bybit_client imported OK", flush=True)
 
 print("[SG] Importing indicator_calculator...", flush=True)
-from services.indicator_calculator import analyze_candles
+from services.indicator_calculator import analyze_candles, analyze_order_flow, FeatureContext
+from services.streaming_indicators import streaming_indicators
+from services.batch_indicators import compute_batch, select_candidates
+from services.price_panel import PricePanel
+from services.scan_pipeline import ScanPipeline
+from services.analysis_pool import analysis_pool
+from services.institutional_data import InstitutionalData, institutional_stats
 print("[SG] indicator_calculator imported OK", flush=True)
 
 print("[SG] Importing sr_detector...", flush=True)
-from services.sr_detector import get_all_sr_levels, check_sr_proximity, get_sr_alignment
+from services.sr_detector import check_sr_proximity, get_sr_alignment, sr_level_cache
 print("[SG] sr_detector imported OK", flush=True)
 
 print("[SG] Importing signal_scorer...", flush=True)
@@ -134,6 +146,13 @@ class SignalGenerator:
         self.last_scan_heartbeat = time.time()
         self.active_signals: Dict[str, Dict] = {}
         self.signal_history: List[Dict] = []
+        self.batch_stats = {"pairs": 0, "candidates": 0, "elapsed_ms": 0.0}
+        self.scan_mode = SCAN_MODE
+        self.scan_workers = SCAN_WORKERS
+        self.scan_stats = {"mode": None, "workers": 0, "pairs_analyzed": 0, "duration_ms": 0.0}
+        self.scan_pipeline: Optional[ScanPipeline] = None  # Staged mode, built on first use
+        self.persist_pipeline: Optional[ScanPipeline] = None
+        self.kline_pipeline: Optional[ScanPipeline] = None
         self.monitored_pairs: List[str] = []
         self.instruments_info: Dict[str, Dict] = {}
         self.tz = pytz.timezone('America/Sao_Paulo')
@@ -163,6 +182,8 @@ class SignalGenerator:
         self.btc_tracker = BTCRegimeTracker()
         self.current_btc_regime = "TRENDING"
         self.current_btc_candles = [] # Stores recent BTC 30m candles
+        self.btc_reference = None # BTC returns/RSI/drop mask shared by every pair in a scan
+        self.price_panel = None # Timestamp-aligned closes of the scanned universe (cross-asset metrics)
         self.current_regime_details = {}
         print("[BTC REGIME] [OK] Tracker inicializado", flush=True)
         
@@ -254,6 +275,21 @@ class SignalGenerator:
         """Set system readiness status (called after ML training)"""
         self.system_ready = status
         print(f"[SYSTEM] System Ready Status set to: {status}", flush=True)
+
+    def set_scan_mode(self, mode: str, workers: Optional[int] = None):
+        """
+        Switch pair analysis between sequential, parallel and staged; applies from
+        the next scan. `workers` sizes the parallel-mode pool.
+        """
+        mode = mode.lower()
+        if mode not in ("sequential", "parallel", "staged"):
+            raise ValueError(f"Unknown scan mode: {mode}")
+        if workers is not None:
+            if int(workers) < 1:
+                raise ValueError("workers must be >= 1")
+            self.scan_workers = int(workers)
+        self.scan_mode = mode
+        print(f"[SCAN] Mode set to {mode} ({self.scan_workers} workers)", flush=True)
     
     def initialize(self, pair_limit: int = 100):
         """Initialize the generator with top pairs"""
@@ -268,7 +304,7 @@ class SignalGenerator:
             print(f"[GENERATOR] Pairs: {', '.join(self.monitored_pairs[:10])}... and {len(self.monitored_pairs)-10} more", flush=True)
         return self.monitored_pairs
     
-    def analyze_pair(self, symbol: str) -> Optional[Dict]:
+    def analyze_pair(self, symbol: str, candles_30m=None) -> Optional[Dict]:
         """
         Analyze a single pair for ALL signal types:
         1. EMA 20/50 Crossover + MACD
@@ -276,37 +312,100 @@ class SignalGenerator:
         3. RSI + Bollinger Reversal
         
         Returns the BEST signal if multiple are found
+        
+        Runs the scan pipeline stages back to back (SCAN_MODE=staged runs the
+        same stages on separate worker pools, see _get_scan_pipeline).
+        """
+        pair = self._fetch_pair_data(symbol, candles_30m)
+        if pair is None:
+            return None
+        pair = self._analyze_pair_data(pair)
+        if pair is None:
+            return None
+        return self._gate_signal(self._score_pair(pair))
+
+    def _fetch_pair_data(self, symbol: str, candles_30m=None) -> Optional[Dict]:
+        """
+        Pipeline stage 1 (I/O): candles of one pair. Trades/OI/LSR are only
+        wrapped here; they are requested once a candidate needs them.
         """
-        # Fetch 30M candles
-        candles_30m = self.client.get_klines(symbol, "30", 100)
+        # Fetch 30M candles (unless the klines stage / batch prefilter already did)
+        if candles_30m is None:
+            candles_30m = self.client.get_klines(symbol, "30", 100, columnar=True)
         if not candles_30m:
             return None
             
-        # Fetch 4H candles for trend filter
-        candles_4h = self.client.get_klines(symbol, "240", 60)
-        
-        # Run indicator analysis
-        # Fetch institutional data
-        trades = self.client.get_recent_trades(symbol, 100)
-        oi_data = self.client.get_open_interest(symbol, "30min", 10)
-        lsr_data = self.client.get_long_short_ratio(symbol, "30min", 10)
+        # 4H candles for trend filter (derived from the cached 30m series)
+        candles_4h = self.client.get_resampled_klines(symbol, "240", 60, columnar=True)
         
+        return {
+            "symbol": symbol,
+            "candles_30m": candles_30m,
+            "candles_4h": candles_4h,
+            "institutional": InstitutionalData(self.client, symbol, institutional_stats)
+        }
+
+    @staticmethod
+    def _has_candidate(analysis: Dict) -> bool:
+        """
+        True when a detector fired in a way the 4H / RS filters of
+        _analyze_pair_data accept. None of those filters read order-flow data,
+        so a False here means the pair yields no potential signal at all.
+        """
+        trend_4h = analysis["trend_4h"]["direction"]
+        aligned = {"LONG": "UPTREND", "SHORT": "DOWNTREND"}
+        if analysis["rsi_bb"]["signal"]:
+            return True
+        for direction in (analysis["ema"]["signal"], analysis["pullback"]["signal"]):
+            if direction and aligned[direction] == trend_4h:
+                return True
+        judas = analysis["institutional"]["judas_signal"]
+        if judas and aligned[judas] == trend_4h:
+            return judas != "LONG" or analysis["institutional"]["rs_score"] >= RS_MIN_THRESHOLD
+        return False
+
+    def _analyze_pair_data(self, pair: Dict) -> Optional[Dict]:
+        """Pipeline stage 2 (CPU): indicators and candidate signals; None when nothing fires"""
+        symbol, candles_30m = pair["symbol"], pair["candles_30m"]
+
         # Use existing btc_candles if available (should be passed or stored)
         btc_candles = getattr(self, "current_btc_candles", None)
         
+        panel = getattr(self, "price_panel", None)
+        cross_asset = panel.metrics(symbol) if panel is not None and btc_candles else None
+        
+        # Run indicator analysis
         try:
-            analysis = analyze_candles(
+            indicators = streaming_indicators.update(symbol, "30", candles_30m) if STREAMING_INDICATORS_ENABLED else None
+            # The analysis pool runs the same call in a worker process (candles via shared memory)
+            analyze = analysis_pool.analyze if analysis_pool.enabled else analyze_candles
+            # Order-flow inputs are left out here and merged in below for candidates only
+            analysis = analyze(
                 candles_30m, 
-                candles_4h, 
-                recent_trades=trades,
-                oi_data=oi_data,
-                lsr_data=lsr_data,
-                btc_candles=btc_candles
+                pair["candles_4h"], 
+                btc_candles=btc_candles,
+                indicators=indicators,
+                btc_ctx=getattr(self, "btc_reference", None) if btc_candles else None,
+                cross_asset=cross_asset
             )
         except Exception as e:
             print(f"[ERROR] Error in analyze_candles for {symbol}: {e}", flush=True)
             return None
 
+        # No candidate can come out of the filters below: skip the trades/OI/LSR requests entirely
+        if not self._has_candidate(analysis):
+            return None
+
+        institutional = pair["institutional"]
+        oi_data, lsr_data = institutional.oi_data, institutional.lsr_data
+        try:
+            analysis["institutional"].update(
+                analyze_order_flow(candles_30m, institutional.trades, oi_data, lsr_data)
+            )
+        except Exception as e:
+            print(f"[ERROR] Error in order flow analysis for {symbol}: {e}", flush=True)
+            return None
+
         # 4H Trend Filter Logic
         trend_4h = analysis["trend_4h"]["direction"] # "UPTREND" or "DOWNTREND"
         
@@ -437,21 +536,31 @@ class SignalGenerator:
         # If no signals found, return None
         if not potential_signals:
             return None
-        
+
+        return {
+            **pair,
+            "analysis": analysis,
+            "trend_4h": trend_4h,
+            "cross_asset": cross_asset,
+            "potential_signals": potential_signals
+        }
+
+    def _score_pair(self, pair: Dict) -> Dict:
+        """Pipeline stage 3: S/R, scoring, targets and ML probability of the best candidate"""
+        symbol, candles_30m, analysis = pair["symbol"], pair["candles_30m"], pair["analysis"]
+        trend_4h, cross_asset, potential_signals = pair["trend_4h"], pair["cross_asset"], pair["potential_signals"]
+
         # Get current price
         current_price = analysis["current_price"]
         
-        # Fetch daily candles for S/R
-        candles_daily = self.client.get_klines(symbol, "D", 30)
-        
-        # Calculate S/R levels
-        sr_levels = get_all_sr_levels(candles_daily) if candles_daily else {"resistances": [], "supports": []}
+        # S/R levels from closed daily candles (fetched once per symbol per UTC day)
+        sr_levels = sr_level_cache.get_levels(symbol, self.client)
         
         # Check S/R proximity
         sr_proximity = check_sr_proximity(current_price, sr_levels)
         
-        # Build and score each potential signal
-        scored_signals = []
+        # Score inputs of each potential signal
+        score_calls = []
         
         for sig in potential_signals:
             # Get S/R alignment for this signal direction (inverted for institutional signals)
@@ -471,31 +580,38 @@ class SignalGenerator:
                 elif sig["direction"] == "SHORT" and liquidity_hunt == "LONG_HUNT":
                     liquidity_aligned = True
             
-            # Calculate score
-            score_result = calculate_signal_score(
-                sig["direction"],
-                sig["volume_confirmed"],
-                pivot_trend,
-                sr_alignment,
-                signal_type=sig["type"],
-                macd_confirmed=sig.get("macd_confirmed", False),
-                trend_4h_aligned=sig.get("trend_4h_aligned", False),
-                cvd_divergence=sig.get("cvd_divergence", False),
-                oi_accumulation=sig.get("oi_accumulation", False),
-                lsr_cleanup=sig.get("lsr_cleanup", False),
-                absorption_confirmed=sig.get("absorption_confirmed", False),
-                rsi_crossover_btc=sig.get("rsi_crossover_btc", False),
-                liquidity_aligned=liquidity_aligned,
-                rsi_value=analysis["rsi_bb"].get("current_value", 50),
-                ai_features=None  # Features serão capturadas após o score ser calculado
-            )
-            
+            score_calls.append({
+                "signal_direction": sig["direction"],
+                "volume_confirmed": sig["volume_confirmed"],
+                "pivot_trend_direction": pivot_trend,
+                "sr_alignment": sr_alignment,
+                "signal_type": sig["type"],
+                "macd_confirmed": sig.get("macd_confirmed", False),
+                "trend_4h_aligned": sig.get("trend_4h_aligned", False),
+                "cvd_divergence": sig.get("cvd_divergence", False),
+                "oi_accumulation": sig.get("oi_accumulation", False),
+                "lsr_cleanup": sig.get("lsr_cleanup", False),
+                "absorption_confirmed": sig.get("absorption_confirmed", False),
+                "rsi_crossover_btc": sig.get("rsi_crossover_btc", False),
+                "liquidity_aligned": liquidity_aligned,
+                "rsi_value": analysis["rsi_bb"].get("current_value", 50),
+                "ai_features": None  # Features serão capturadas após o score ser calculado
+            })
+        
+        # Calculate scores (one round trip to the analysis pool when enabled)
+        if analysis_pool.enabled:
+            score_results = analysis_pool.score(score_calls)
+        else:
+            score_results = [calculate_signal_score(**kwargs) for kwargs in score_calls]
+        
+        scored_signals = []
+        for sig, kwargs, score_result in zip(potential_signals, score_calls, score_results):
             scored_signals.append({
                 **sig,
                 "score": score_result["score"],
                 "score_result": score_result,
-                "sr_alignment": sr_alignment,
-                "pivot_trend": pivot_trend,
+                "sr_alignment": kwargs["sr_alignment"],
+                "pivot_trend": kwargs["pivot_trend_direction"],
                 "lsr_cleanup": sig.get("lsr_cleanup", False),
                 "oi_accumulation": sig.get("oi_accumulation", False),
                 "cvd_divergence": sig.get("cvd_divergence", False),
@@ -519,9 +635,11 @@ class SignalGenerator:
         
         # Calculate decoupling score (Always, for ML and Turbo logic)
         decoupling_score = 0.0
-        if self.current_btc_candles:
+        if cross_asset is not None:
+            decoupling_score = cross_asset["decoupling_score"]
+        elif self.current_btc_candles:
             decoupling_score = self.btc_tracker.calculate_decoupling_score(
-                candles_30m, self.current_btc_candles
+                candles_30m, self.current_btc_candles, btc_ref=getattr(self, "btc_reference", None)
             )
 
         # [TURBO STRATEGY] If Alt is Decoupled (>0.6), force BREAKOUT targets regardless of regime
@@ -616,7 +734,7 @@ class SignalGenerator:
                 "liquidity_aligned": score_result.get("confirmations", {}).get("liquidity_aligned", False),
                 "liquidity_details": analysis["institutional"]["liquidity_hunt"]["details"]
             },
-            "ai_features": self._capture_ai_features(symbol, analysis, best_signal, decoupling_score),
+            "ai_features": self._capture_ai_features(symbol, analysis, best_signal, decoupling_score, pair["institutional"]),
             # BTC Regime Tracking
             "btc_regime": self.current_btc_regime,
             "is_sniper": is_sniper_signal,
@@ -660,7 +778,20 @@ class SignalGenerator:
                 signal["ml_probability"] = None
         else:
             signal["ml_probability"] = None
-        
+
+        return {
+            "symbol": symbol,
+            "signal": signal,
+            "current_price": current_price,
+            "tick_size": tick_size,
+            "decoupling_score": decoupling_score
+        }
+
+    def _gate_signal(self, scored: Dict) -> Dict:
+        """Pipeline stage 4: LLM validation and TP suggestion, Eagle Elite tagging"""
+        symbol, signal = scored["symbol"], scored["signal"]
+        current_price, tick_size, decoupling_score = scored["current_price"], scored["tick_size"], scored["decoupling_score"]
+
         # === LLM INTELLIGENCE LAYER ===
         if self.llm_brain and LLM_ENABLED:
             # Prepare enriched market context for The Council
@@ -684,8 +815,9 @@ class SignalGenerator:
                     llm_validation = self.llm_brain.validate_signal_context(signal, market_context)
                     signal["llm_validation"] = llm_validation
                     
-                    # Store for UI (AI Page Audit)
-                    self.last_council_debate = llm_validation
+                    # Store for UI (AI Page Audit); gate stages run on several threads
+                    with self._lock:
+                        self.last_council_debate = llm_validation
                     
                     if llm_validation.get("approved"):
                         print(f"[LLM] [OK] {symbol} aprovado (conf: {llm_validation.get('confidence', 0):.0%})", flush=True)
@@ -744,21 +876,21 @@ class SignalGenerator:
         """
         try:
             # Fetch additional klines
-            klines_2h = self.client.get_klines(symbol, "120", 50)
-            klines_1h = self.client.get_klines(symbol, "60", 50)
+            klines_2h = self.client.get_resampled_klines(symbol, "120", 50, columnar=True)
+            klines_1h = self.client.get_resampled_klines(symbol, "60", 50, columnar=True)
             
             if not klines_2h or not klines_1h:
                 return {"total_score": 0, "details": "Insufficient data"}
 
             # Analyze 2H Structure
             # Simplified structure check: SMA 20 vs SMA 50 equivalent
-            close_2h = [c["close"] for c in klines_2h]
+            close_2h = klines_2h.close.tolist()
             sma20_2h = sum(close_2h[-20:]) / 20
             sma50_2h = sum(close_2h[-50:]) / 50
             trend_2h = "UPTREND" if sma20_2h > sma50_2h else "DOWNTREND"
 
             # Analyze 1H Structure (Looking for actual breakout)
-            close_1h = [c["close"] for c in klines_1h]
+            close_1h = klines_1h.close.tolist()
             sma20_1h = sum(close_1h[-20:]) / 20
             # Check for "Engulfing" or strength in the last 2 candles
             recent_strength = close_1h[-1] > close_1h[-2] if trend_4h == "UPTREND" else close_1h[-1] < close_1h[-2]
@@ -778,7 +910,65 @@ class SignalGenerator:
         except Exception as e:
             print(f"[MTF ERROR] {symbol}: {e}", flush=True)
             return {"total_score": 0, "error": str(e)}
-    def _update_active_signals_prices(self):
+
+    def _ticker_prefilter(self) -> List[str]:
+        """
+        Monitored pairs that can produce a signal this cycle, judged from the
+        shared ticker snapshot alone (no per-pair requests). All pairs when
+        disabled or when the ticker table is unavailable.
+        """
+        if not TICKER_PREFILTER_ENABLED:
+            return list(self.monitored_pairs)
+        try:
+            snapshot = ticker_snapshots.get_snapshot(client=self.client)
+            survivors = ticker_prefilter.select(self.monitored_pairs, snapshot)
+            stats = ticker_prefilter.get_stats()
+            illiquid = f", {stats['illiquid']} below turnover floor" if stats["illiquid"] else ""
+            print(f"[TICKER] {len(survivors)}/{len(self.monitored_pairs)} pairs passed the ticker prefilter (skip ratio {stats['skip_ratio']:.0%}{illiquid})", flush=True)
+            return survivors
+        except Exception as e:
+            print(f"[TICKER] [WARN] Prefilter failed, fetching all pairs: {e}", flush=True)
+            return list(self.monitored_pairs)
+
+    def _fetch_scan_klines(self, symbol: str):
+        """30M candles for the batch prefilter; None on failure (analyze_pair retries the fetch)"""
+        try:
+            return self.client.get_klines(symbol, "30", 100, columnar=True)
+        except Exception:
+            return None
+
+    def _batch_prefilter(self, symbols: Optional[List[str]] = None, candles: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Run one vectorized indicator pass over the 30M candles of every pair in
+        `symbols` (default: all monitored pairs). `candles` holds them when the
+        scan already fetched them on its workers; otherwise they are fetched here.
+        
+        Returns {symbol: candles} for the pairs worth a full analysis (the
+        candles are reused by analyze_pair), or None to scan every pair.
+        """
+        try:
+            if candles is None:
+                candles = {s: self._fetch_scan_klines(s) for s in (self.monitored_pairs if symbols is None else symbols)}
+                    
+            btc_candles = getattr(self, "current_btc_candles", None)
+            start = time.perf_counter()
+            results = compute_batch(candles, btc_candles)
+            ticker_prefilter.record(results, candles)
+            
+            # Built once per cycle: RS/decoupling for every pair read from the aligned panel
+            if btc_candles:
+                self.price_panel = PricePanel.build({**candles, "BTCUSDT": btc_candles})
+            candidates = select_candidates(results, self.monitored_pairs)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            self.batch_stats = {"pairs": len(candles), "candidates": len(candidates), "elapsed_ms": round(elapsed_ms, 2)}
+            print(f"[BATCH] {len(candidates)}/{len(candles)} pairs passed the indicator prefilter ({elapsed_ms:.1f}ms)", flush=True)
+            return {s: candles[s] for s in candidates}
+        except Exception as e:
+            print(f"[BATCH] [WARN] Prefilter failed, scanning all pairs: {e}", flush=True)
+            return None
+
+    def _update_active_signals_prices(self, snapshot=None):
 
         """
         Batch update current prices for all active signals.
@@ -788,12 +978,10 @@ class SignalGenerator:
             return
 
         try:
-            # Batch fetch all tickers (Bybit v5 supports category=linear)
-            # Fetching all is often faster than N individual calls
-            tickers = self.client.get_all_tickers()
-            
-            # Create a lookup map
-            price_map = {t["symbol"]: float(t["lastPrice"]) for t in tickers if "symbol" in t and "lastPrice" in t}
+            # Shared ticker table (one get_all_tickers per tick for all consumers)
+            if snapshot is None:
+                snapshot = ticker_snapshots.get_snapshot(client=self.client)
+            price_map = snapshot.prices
             
             # Update our active signals in memory
             for symbol, signal in self.active_signals.items():
@@ -829,18 +1017,22 @@ class SignalGenerator:
         except Exception as e:
             print(f"[PRICE UPDATE ERROR] Failed to batch update prices: {e}", flush=True)
 
-    def _capture_ai_features(self, symbol: str, analysis: Dict, best_signal: Dict, decoupling_score: float = 0.0) -> Dict:
+    def _capture_ai_features(self, symbol: str, analysis: Dict, best_signal: Dict, decoupling_score: float = 0.0,
+                             institutional: Optional[InstitutionalData] = None) -> Dict:
         """
         Captura um instantâneo (snapshot) de métricas de mercado para treinamento de IA.
         Calcula as variações percentuais em vez de valores absolutos.
+        `institutional` é o InstitutionalData do par neste ciclo (OI/LSR já buscados).
         """
         try:
             oi_latest = analysis["institutional"].get("oi_latest", 0)
             lsr_latest = analysis["institutional"].get("lsr_latest", 0)
             
-            # Buscamos dados históricos para calcular Δ%
-            oi_data = self.client.get_open_interest(symbol, "30min", 2)
-            lsr_data = self.client.get_long_short_ratio(symbol, "30min", 2)
+            # Buscamos dados históricos para calcular Δ% (reaproveitados do ciclo quando disponíveis)
+            if institutional is None:
+                institutional = InstitutionalData(self.client, symbol)
+            oi_data = institutional.oi_data
+            lsr_data = institutional.lsr_data
             
             oi_change = 0
             if len(oi_data) > 1:
@@ -894,6 +1086,208 @@ class SignalGenerator:
             print(f"[AI LOGGER ERROR] {symbol}: {e}", flush=True)
             return {}
 
+    def _admit_signal(self, symbol: str, signal: Optional[Dict], new_signals: List[Dict], persist=None) -> bool:
+        """
+        Scan merge step for one analyzed pair: ML and score filters, governor,
+        sniper tagging, active_signals insert, bankroll and DB (`persist`, default
+        save_signal_to_db). Runs on the scan thread in pair order in every scan
+        mode. False when a filter skipped the pair.
+        """
+        if signal:
+            # Check if we already have an active signal for this pair
+            if symbol not in self.active_signals:
+                # ML-Based Filtering (if ML enabled)
+                ml_approved = False
+                
+                if ML_ENABLED and self.ml_predictor and signal.get("ml_probability") is not None:
+                    # ML-Based Filtering (Softened)
+                    if signal["ml_probability"] < ML_PROBABILITY_THRESHOLD:
+                        # Check if model is actually ready/accurate
+                        stats = self.ml_predictor.get_status()
+                        if stats.get("model_loaded") and stats.get("last_accuracy", 0) > 0.60:
+                            print(f"[ML FILTER] {symbol} probability {signal['ml_probability']:.2%} < {ML_PROBABILITY_THRESHOLD:.0%}, blocked (Model is Accurate)", flush=True)
+                            return False
+                        else:
+                            # Model not ready or low accuracy, allow signal as "Technical Only"
+                            print(f"[ML WARMUP] {symbol} probability {signal['ml_probability']:.2%} is low, but allowing as Technical-Elite (Model Warming Up)", flush=True)
+                            ml_approved = True
+                    else:
+                        # ML Approves
+                        ml_approved = True
+                        print(f"[ML APPROVED] {symbol} - ML: {signal['ml_probability']:.2%} >= {ML_PROBABILITY_THRESHOLD:.0%}", flush=True)
+                
+                # Technical Score Check
+                # [DATA COLLECTION] Use RAW Rules Score if available (don't let ML dilute it)
+                raw_score = signal.get("score_breakdown", {}).get("rules_score", signal["score"])
+                
+                if raw_score < MIN_SCORE_TO_SAVE:
+                    print(f"[SKIP] {symbol} Raw Score {raw_score:.1f}% < {MIN_SCORE_TO_SAVE}%, nao sera monitorado", flush=True)
+                    return False
+                
+                if signal:
+                # 4. PORTFOLIO GOVERNANCE CHECK
+                # Before adding to active, check if Governor allows it
+                    if LLM_ENABLED:
+                        gov_res = self.governor_agent.authorize_trade(
+                            signal, 
+                            list(self.active_signals.values()), 
+                            lambda p: self.llm_brain.call_gemini(p)
+                        )
+                        signal["governor_report"] = gov_res
+                        if not gov_res.get("authorized", True):
+                            # [DATA COLLECTION MODE] Log warning but DO NOT BLOCK
+                            print(f"[GOVERNOR] ⚠️ Signal {symbol} NOT AUTHORIZED (Soft Veto): {gov_res.get('reasoning')} - Proceeding for Data Collection", flush=True)
+                            signal["governor_veto"] = True  # Tag it so we know it was vetoed
+                            # continue  <-- DISABLED FOR TRAINING
+                        if gov_res.get("suggested_size_reduction", 0) > 0:
+                            print(f"[GOVERNOR] ⚠️ {symbol} size reduced by {gov_res.get('suggested_size_reduction')*100:.0f}%", flush=True)
+
+                # [SNIPER FILTER] Determine if this qualifies for Elite or Journey
+                sniper_check_score = raw_score
+                is_elite = True
+                
+                if self.current_btc_regime == "RANGING":
+                    if signal.get("decoupling_score", 0) < SNIPER_DECOUPLING_THRESHOLD:
+                        is_elite = False
+                        print(f"[JOURNEY MODE] {symbol} Decoupling {signal.get('decoupling_score', 0):.2f} < {SNIPER_DECOUPLING_THRESHOLD} - Saving for ML Training only.", flush=True)
+                elif self.current_btc_regime in ["TRENDING", "BREAKOUT"]:
+                    if sniper_check_score < SNIPER_BEST_SCORE_THRESHOLD:
+                        is_elite = False
+                        print(f"[JOURNEY MODE] {symbol} Score {sniper_check_score:.1f} < {SNIPER_BEST_SCORE_THRESHOLD} - Saving for ML Training only.", flush=True)
+
+                # Update signal sniper status based on final scan filters
+                signal["is_sniper"] = is_elite
+                
+                # LLM Intelligence Layer - additional validation (soft filter)
+                llm_info = ""
+                if LLM_ENABLED and signal.get("llm_validation"):
+                    llm_val = signal["llm_validation"]
+                    llm_conf = llm_val.get("confidence", 0)
+                    llm_info = f" | LLM: {llm_conf:.0%}"
+                
+                with self._lock:
+                    self.active_signals[symbol] = signal
+                
+                if is_elite:
+                    new_signals.append(signal)
+                    sig_type = signal['signal_type'].replace('_', ' ')
+                    ml_info = f" | ML: {signal['ml_probability']:.2%}" if signal.get('ml_probability') else ""
+                    print(f"[NEW ELITE SIGNAL] 🦅 {symbol} {signal['direction']} ({sig_type}) Score: {signal['score']:.1f}%{ml_info}{llm_info}", flush=True)
+                    
+                    # Assess for Elite Bankroll
+                    if self.bankroll_manager:
+                        self.bankroll_manager.assess_signal(signal)
+                
+                (persist or self.save_signal_to_db)(signal)
+        return True
+
+    def _analyze_scan_pair(self, symbol: str, batch_candles: Optional[Dict]) -> Optional[Dict]:
+        """analyze_pair on a scan worker thread (request priority is per thread)"""
+        with request_priority(PRIORITY_LOW):
+            return self.analyze_pair(symbol, batch_candles[symbol] if batch_candles is not None else None)
+
+    @staticmethod
+    def _at_scan_priority(fn):
+        """Wrap a pipeline stage so it runs at scan (low) request priority on its worker thread"""
+        def run(item):
+            with request_priority(PRIORITY_LOW):
+                return fn(item)
+        return run
+
+    def _get_scan_pipeline(self) -> ScanPipeline:
+        """Staged-mode pipelines; worker threads are started once and live across scans"""
+        if self.scan_pipeline is None:
+            low = self._at_scan_priority
+            workers = SCAN_PIPELINE_WORKERS
+            self.persist_pipeline = ScanPipeline(
+                [("persist", self.save_signal_to_db, workers["persist"])], SCAN_PIPELINE_QUEUE_SIZE
+            ).start()
+            # Separate pipeline: the batch prefilter needs every pair's candles at once
+            self.kline_pipeline = ScanPipeline(
+                [("klines", low(self._fetch_scan_klines), workers["klines"])], SCAN_PIPELINE_QUEUE_SIZE
+            ).start()
+            self.scan_pipeline = ScanPipeline([
+                ("fetch", low(lambda item: self._fetch_pair_data(*item)), workers["fetch"]),
+                ("analyze", low(self._analyze_pair_data), workers["analyze"]),
+                ("score", low(self._score_pair), workers["score"]),
+                ("gate", low(self._gate_signal), workers["gate"])
+            ], SCAN_PIPELINE_QUEUE_SIZE).start()
+        return self.scan_pipeline
+
+    def _persist_signal(self, signal: Dict):
+        """Queue a DB write on the persist stage; nothing waits on it, so failures are logged here"""
+        def log_failure(future):
+            error = future.exception()
+            if error is not None:
+                print(f"[DB ERROR] Persist stage failed for {signal.get('symbol')}: {error}", flush=True)
+        self.persist_pipeline.submit(signal).add_done_callback(log_failure)
+
+    def get_pipeline_stats(self) -> Optional[Dict]:
+        """Per-stage queue depth and throughput of the staged scan (None until first used)"""
+        if self.scan_pipeline is None:
+            return None
+        return {**self.kline_pipeline.get_stats(), **self.scan_pipeline.get_stats(),
+                **self.persist_pipeline.get_stats()}
+
+    def _merge_scan_pair(self, i: int, symbol: str, total_pairs: int, future, batch_candles: Optional[Dict],
+                         new_signals: List[Dict], persist=None):
+        """
+        One iteration of the scan loop. `future` holds the pair's analysis in
+        parallel and staged mode; otherwise the pair is analyzed here.
+        """
+        try:
+            # Log progress every 10 pairs
+            if (i + 1) % 10 == 0 or i == 0:
+                print(f"  [SCAN] Progress: [{i+1}/{total_pairs}] - Current: {symbol}", flush=True)
+
+            if future is not None:
+                signal = future.result()
+            else:
+                signal = self.analyze_pair(symbol, batch_candles[symbol] if batch_candles is not None else None)
+
+            if not self._admit_signal(symbol, signal, new_signals, persist):
+                return
+
+            # Periodic cleanup of history (every scan)
+            self.cleanup_history()
+
+
+            # === 5. STRATEGIST REFLECTION ===
+            # Every 20 scans or if history is fresh, run strategist
+            if LLM_ENABLED and len(self.signal_history) >= 5:
+                # Run roughly once an hour (assuming 3 min scans)
+                if int(time.time()) % 20 == 0: 
+                    print("[STRATEGIST] 🧠 Running post-mortem analysis...", flush=True)
+                    report = self.strategist_agent.analyze_performance(
+                        self.signal_history, 
+                        lambda p: self.llm_brain.call_gemini(p)
+                    )
+                    self.strategist_report = report
+
+            # === 6. ML MODEL CARE (Autonomous) ===
+            if self.ml_supervisor_agent and self.ml_predictor:
+                care_res = self.ml_supervisor_agent.care_for_model(self.ml_predictor)
+                if care_res.get("action") == "TRAIN":
+                    print(f"[ML SUPERVISOR] 🧠 Autonomous Training Triggered: {care_res.get('reason')}", flush=True)
+                    # Run training in background to not block scan loop
+                    def async_train():
+                        try:
+                            self.ml_predictor.train_model(min_samples=ML_MIN_SAMPLES)
+                        except Exception as e:
+                            print(f"[ML ERROR] Async training failed: {e}")
+                    import threading
+                    threading.Thread(target=async_train, daemon=True).start()
+
+            # Small delay to avoid rate limiting (parallel mode is paced by the rate limiter)
+            if future is None:
+                time.sleep(0.1)
+
+        except Exception as e:
+            import traceback
+            print(f"[SCAN ERROR] {symbol}: {e}", flush=True)
+            traceback.print_exc()
+
+    @request_priority(PRIORITY_LOW)
     def scan_all_pairs(self) -> List[Dict]:
         """Core engine: Scans all monitored pairs and generates signals"""
         self.last_scan_heartbeat = time.time()
@@ -910,15 +1304,22 @@ class SignalGenerator:
         # Sentiment update moved to after regime detection
         
         try:
-            self.current_btc_candles = self.client.get_klines("BTCUSDT", "30", 100)
+            self.current_btc_candles = self.client.get_klines("BTCUSDT", "30", 100, columnar=True)
         except:
             self.current_btc_candles = None
         
+        # BTC reference features, computed once and shared by every pair this cycle
+        self.btc_reference = FeatureContext(self.current_btc_candles) if self.current_btc_candles else None
+        self.price_panel = None
+        
         # Detect BTC market regime
         try:
-            btc_4h = self.client.get_klines("BTCUSDT", "240", 50)
+            btc_4h = self.client.get_resampled_klines("BTCUSDT", "240", 50, columnar=True)
+            btc_indicators = None
+            if STREAMING_INDICATORS_ENABLED and self.current_btc_candles:
+                btc_indicators = streaming_indicators.update("BTCUSDT", "30", self.current_btc_candles)
             self.current_btc_regime, self.current_regime_details = self.btc_tracker.detect_regime(
-                self.current_btc_candles, btc_4h
+                self.current_btc_candles, btc_4h, indicators=btc_indicators
             )
             regime_info = self.btc_tracker.get_regime_info()
             print(f"[BTC REGIME] {self.current_btc_regime} | TP: {regime_info['tp_pct']:.1f}% | SL: {regime_info['sl_pct']:.1f}%", flush=True)
@@ -945,154 +1346,84 @@ class SignalGenerator:
             except Exception as e:
                 print(f"[ANCHOR ERROR] Macro analysis failed: {e}", flush=True)
             
-        for i, symbol in enumerate(self.monitored_pairs):
-            try:
-                # Log progress every 10 pairs
-                if (i + 1) % 10 == 0 or i == 0:
-                    print(f"  [SCAN] Progress: [{i+1}/{total_pairs}] - Current: {symbol}", flush=True)
-                
-                signal = self.analyze_pair(symbol)
-                
-                if signal:
-                    # Check if we already have an active signal for this pair
-                    if symbol not in self.active_signals:
-                        # ML-Based Filtering (if ML enabled)
-                        ml_approved = False
-                        
-                        if ML_ENABLED and self.ml_predictor and signal.get("ml_probability") is not None:
-                            # ML-Based Filtering (Softened)
-                            if signal["ml_probability"] < ML_PROBABILITY_THRESHOLD:
-                                # Check if model is actually ready/accurate
-                                stats = self.ml_predictor.get_status()
-                                if stats.get("model_loaded") and stats.get("last_accuracy", 0) > 0.60:
-                                    print(f"[ML FILTER] {symbol} probability {signal['ml_probability']:.2%} < {ML_PROBABILITY_THRESHOLD:.0%}, blocked (Model is Accurate)", flush=True)
-                                    continue
-                                else:
-                                    # Model not ready or low accuracy, allow signal as "Technical Only"
-                                    print(f"[ML WARMUP] {symbol} probability {signal['ml_probability']:.2%} is low, but allowing as Technical-Elite (Model Warming Up)", flush=True)
-                                    ml_approved = True
-                            else:
-                                # ML Approves
-                                ml_approved = True
-                                print(f"[ML APPROVED] {symbol} - ML: {signal['ml_probability']:.2%} >= {ML_PROBABILITY_THRESHOLD:.0%}", flush=True)
-                        
-                        # Technical Score Check
-                        # [DATA COLLECTION] Use RAW Rules Score if available (don't let ML dilute it)
-                        raw_score = signal.get("score_breakdown", {}).get("rules_score", signal["score"])
-                        
-                        if raw_score < MIN_SCORE_TO_SAVE:
-                            print(f"[SKIP] {symbol} Raw Score {raw_score:.1f}% < {MIN_SCORE_TO_SAVE}%, nao sera monitorado", flush=True)
-                            continue
-                        
-                        if signal:
-                        # 4. PORTFOLIO GOVERNANCE CHECK
-                        # Before adding to active, check if Governor allows it
-                            if LLM_ENABLED:
-                                gov_res = self.governor_agent.authorize_trade(
-                                    signal, 
-                                    list(self.active_signals.values()), 
-                                    lambda p: self.llm_brain.call_gemini(p)
-                                )
-                                signal["governor_report"] = gov_res
-                                if not gov_res.get("authorized", True):
-                                    # [DATA COLLECTION MODE] Log warning but DO NOT BLOCK
-                                    print(f"[GOVERNOR] ⚠️ Signal {symbol} NOT AUTHORIZED (Soft Veto): {gov_res.get('reasoning')} - Proceeding for Data Collection", flush=True)
-                                    signal["governor_veto"] = True  # Tag it so we know it was vetoed
-                                    # continue  <-- DISABLED FOR TRAINING
-                                if gov_res.get("suggested_size_reduction", 0) > 0:
-                                    print(f"[GOVERNOR] ⚠️ {symbol} size reduced by {gov_res.get('suggested_size_reduction')*100:.0f}%", flush=True)
-
-                        # [SNIPER FILTER] Determine if this qualifies for Elite or Journey
-                        sniper_check_score = raw_score
-                        is_elite = True
-                        
-                        if self.current_btc_regime == "RANGING":
-                            if signal.get("decoupling_score", 0) < SNIPER_DECOUPLING_THRESHOLD:
-                                is_elite = False
-                                print(f"[JOURNEY MODE] {symbol} Decoupling {signal.get('decoupling_score', 0):.2f} < {SNIPER_DECOUPLING_THRESHOLD} - Saving for ML Training only.", flush=True)
-                        elif self.current_btc_regime in ["TRENDING", "BREAKOUT"]:
-                            if sniper_check_score < SNIPER_BEST_SCORE_THRESHOLD:
-                                is_elite = False
-                                print(f"[JOURNEY MODE] {symbol} Score {sniper_check_score:.1f} < {SNIPER_BEST_SCORE_THRESHOLD} - Saving for ML Training only.", flush=True)
-
-                        # Update signal sniper status based on final scan filters
-                        signal["is_sniper"] = is_elite
-                        
-                        # LLM Intelligence Layer - additional validation (soft filter)
-                        llm_info = ""
-                        if LLM_ENABLED and signal.get("llm_validation"):
-                            llm_val = signal["llm_validation"]
-                            llm_conf = llm_val.get("confidence", 0)
-                            llm_info = f" | LLM: {llm_conf:.0%}"
-                        
-                        with self._lock:
-                            self.active_signals[symbol] = signal
-                        
-                        if is_elite:
-                            new_signals.append(signal)
-                            sig_type = signal['signal_type'].replace('_', ' ')
-                            ml_info = f" | ML: {signal['ml_probability']:.2%}" if signal.get('ml_probability') else ""
-                            print(f"[NEW ELITE SIGNAL] 🦅 {symbol} {signal['direction']} ({sig_type}) Score: {signal['score']:.1f}%{ml_info}{llm_info}", flush=True)
-                            
-                            # Assess for Elite Bankroll
-                            if self.bankroll_manager:
-                                self.bankroll_manager.assess_signal(signal)
-                        
-                        self.save_signal_to_db(signal)
-                
-                # Periodic cleanup of history (every scan)
-                self.cleanup_history()
-                
+        # === 2. TICKER + BATCH PREFILTER ===
+        # Pairs the ticker snapshot rules out are not fetched at all
+        scan_pairs = self._ticker_prefilter()
+        scan_set = set(scan_pairs)
+        scan_mode, scan_workers = self.scan_mode, self.scan_workers
+        # Parallel mode fetches the prefilter candles on the same pool it analyzes on
+        pool = None
+        if scan_mode == "parallel" and len(scan_pairs) >= 2:
+            pool = ThreadPoolExecutor(max_workers=scan_workers, thread_name_prefix="scan")
+
+        try:
+            # Streaming indicators read values the windowed batch pass does not reproduce
+            batch_candles = None
+            if SCAN_BATCH_INDICATORS and not STREAMING_INDICATORS_ENABLED:
+                klines = None
+                if pool is not None:
+                    fetch = self._at_scan_priority(self._fetch_scan_klines)
+                    klines = dict(zip(scan_pairs, pool.map(fetch, scan_pairs)))
+                elif scan_mode == "staged" and len(scan_pairs) >= 2:
+                    # Every pair goes through the klines stage; waiting on all of
+                    # them is the barrier in front of the cross-sectional pass
+                    self._get_scan_pipeline()
+                    pending = [self.kline_pipeline.submit(s) for s in scan_pairs]
+                    klines = {s: f.result() for s, f in zip(scan_pairs, pending)}
+                batch_candles = self._batch_prefilter(scan_pairs, klines)
+
+            # === 3. PAIR ANALYSIS ===
+            # Parallel mode runs analyze_pair on the worker pool, staged mode runs its
+            # stages on the scan pipeline; results are still merged below one pair
+            # at a time, in monitored_pairs order
+            scan_start = time.time()
+            candidates = [s for s in scan_pairs if batch_candles is None or s in batch_candles]
+            futures = {}
+            persist = None
+            if len(candidates) < 2:
+                scan_mode, scan_workers = "sequential", 1
+            elif scan_mode == "parallel" and pool is not None:
+                futures = {s: pool.submit(self._analyze_scan_pair, s, batch_candles) for s in candidates}
+            elif scan_mode == "staged":
+                pipeline = self._get_scan_pipeline()
+                scan_workers = dict(SCAN_PIPELINE_WORKERS)
+                # DB writes go to the persist stage; the scan does not wait for them
+                persist = self._persist_signal
+                futures = {
+                    s: pipeline.submit((s, batch_candles[s] if batch_candles is not None else None))
+                    for s in candidates
+                }
+            else:
+                scan_mode, scan_workers = "sequential", 1
+
+            for i, symbol in enumerate(self.monitored_pairs):
+                if symbol not in scan_set or (batch_candles is not None and symbol not in batch_candles):
+                    continue
+                self._merge_scan_pair(i, symbol, total_pairs, futures.get(symbol), batch_candles, new_signals, persist)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        self.scan_stats = {
+            "mode": scan_mode,
+            "workers": scan_workers,
+            "pairs_analyzed": len(candidates),
+            "duration_ms": round((time.time() - scan_start) * 1000, 1)
+        }
+        print(f"[SCAN] Analyzed {len(candidates)} pairs ({scan_mode}, workers: {scan_workers}) in {self.scan_stats['duration_ms']:.0f}ms", flush=True)
 
-                # === 5. STRATEGIST REFLECTION ===
-                # Every 20 scans or if history is fresh, run strategist
-                if LLM_ENABLED and len(self.signal_history) >= 5:
-                    # Run roughly once an hour (assuming 3 min scans)
-                    if int(time.time()) % 20 == 0: 
-                        print("[STRATEGIST] 🧠 Running post-mortem analysis...", flush=True)
-                        report = self.strategist_agent.analyze_performance(
-                            self.signal_history, 
-                            lambda p: self.llm_brain.call_gemini(p)
-                        )
-                        self.strategist_report = report
-
-                # === 6. ML MODEL CARE (Autonomous) ===
-                if self.ml_supervisor_agent and self.ml_predictor:
-                    care_res = self.ml_supervisor_agent.care_for_model(self.ml_predictor)
-                    if care_res.get("action") == "TRAIN":
-                        print(f"[ML SUPERVISOR] 🧠 Autonomous Training Triggered: {care_res.get('reason')}", flush=True)
-                        # Run training in background to not block scan loop
-                        def async_train():
-                            try:
-                                self.ml_predictor.train_model(min_samples=ML_MIN_SAMPLES)
-                            except Exception as e:
-                                print(f"[ML ERROR] Async training failed: {e}")
-                        import threading
-                        threading.Thread(target=async_train, daemon=True).start()
-
-                # Small delay to avoid rate limiting
-                time.sleep(0.1)
-                
-            except Exception as e:
-                import traceback
-                print(f"[SCAN ERROR] {symbol}: {e}", flush=True)
-                traceback.print_exc()
-                continue
-        
         # === BATCH PRICE UPDATE ===
         # Update prices for all active signals (both new and old)
         # This ensures get_active_signals is fast (no network calls)
-        self._update_active_signals_prices()
+        # Position management (TP/SL, flips) must not queue behind the scan
+        with request_priority(PRIORITY_HIGH):
+            # Fresh ticker table for this tick, shared by signals and bankroll
+            snapshot = ticker_snapshots.refresh(self.client)
+            self._update_active_signals_prices(snapshot)
 
-        # === UPDATE BANKROLL POSITIONS (Optimized) ===
-        if self.bankroll_manager:
-            # Re-use price_map from _update_active_signals_prices if possible or build from ticker_map
-            # Actually, _update_active_signals_prices doesn't return the map, so we use ticker_map if it was built
-            # But ticker_map is local to monitor_active_signals. Let's build a quick one here if needed.
-            # Actually, let's just use what's available.
-            tickers = self.client.get_all_tickers()
-            price_map = {t["symbol"]: float(t["lastPrice"]) for t in tickers if "symbol" in t and "lastPrice" in t}
-            self.bankroll_manager.update_positions(price_map)
+            # === UPDATE BANKROLL POSITIONS (Optimized) ===
+            if self.bankroll_manager:
+                self.bankroll_manager.update_positions(snapshot.prices)
         
         # Summary after scan
         active_count = len(self.active_signals)
@@ -1289,6 +1620,7 @@ class SignalGenerator:
         load_thread.start()
 
 
+    @request_priority(PRIORITY_HIGH)
     def monitor_active_signals(self):
         """Monitor active signals for TP, SL, or Volume Climax hits"""
         self.last_scan_heartbeat = time.time()
@@ -1301,12 +1633,12 @@ class SignalGenerator:
 
         print(f"[MONITOR] Checking {len(snapshot_items)} active signals...", flush=True)
         
-        # Get all tickers in one call for efficiency
-        tickers = self.client.get_all_tickers()
-        if not tickers:
+        # One ticker table per tick, shared with bankroll/agents/routes
+        snapshot = ticker_snapshots.refresh(self.client)
+        if not snapshot or snapshot.age > ticker_snapshots.max_age:
             return []
             
-        ticker_map = {t["symbol"]: t for t in tickers}
+        ticker_map = snapshot.tickers
         
         finalized = []
         current_time = int(time.time() * 1000)
@@ -1719,7 +2051,21 @@ class SignalGenerator:
                 "signal_types": type_counts,
                 "db_connected": self.db.is_connected(),
                 "db_connecting": self.db.is_connecting(),
-                "system_ready": self.system_ready
+                "system_ready": self.system_ready,
+                "http_pool": self.client.get_pool_stats(),
+                "kline_cache": self.client.get_kline_cache_stats(),
+                "rate_limits": self.client.get_rate_limit_stats(),
+                "single_flight": self.client.get_single_flight_stats(),
+                "mtf_resampler": self.client.get_resampler_stats(),
+                "ticker_snapshot": ticker_snapshots.get_stats(),
+                "streaming_indicators": streaming_indicators.get_stats(),
+                "batch_prefilter": self.batch_stats,
+                "sr_cache": sr_level_cache.get_stats(),
+                "scan": {"configured_mode": self.scan_mode, "configured_workers": self.scan_workers, **self.scan_stats},
+                "scan_pipeline": self.get_pipeline_stats(),
+                "analysis_pool": analysis_pool.get_stats(),
+                "ticker_prefilter": ticker_prefilter.get_stats(),
+                "institutional_data": institutional_stats.get_stats()
             }
         except Exception as e:
             print(f"[STATS ERROR] Failed to calculate stats: {e}", flush=True)
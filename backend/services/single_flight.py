@@ -0,0 +1,114 @@
+"""
+10D - Single Flight
+Request coalescing: identical calls issued concurrently (or within a short
+freshness window) share one network round trip and one result.
+"""
+
+import time
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BYBIT_SINGLE_FLIGHT_TTL
+
+# Completed results kept before expired entries are pruned
+PRUNE_EVERY = 256
+
+
+class _Call:
+    """One in-flight execution that followers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescer.
+
+    do(key, fn, ttl):
+      - if a result for `key` completed less than `ttl` seconds ago, return it;
+      - if `fn` is already running for `key`, wait for it and return its result;
+      - otherwise run `fn` (this caller becomes the leader).
+    None results are never kept beyond the in-flight window (failed requests retry).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+        self._stores = 0
+        self._stats = {"executed": 0, "shared_in_flight": 0, "fresh_hits": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], ttl: float = 0.0) -> Any:
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._stats["fresh_hits"] += 1
+                    return cached[1]
+                del self._results[key]
+
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["executed"] += 1
+            else:
+                self._stats["shared_in_flight"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and call.value is not None and ttl > 0:
+                    self._results[key] = (time.monotonic() + ttl, call.value)
+                    self._stores += 1
+                    if self._stores % PRUNE_EVERY == 0:
+                        self._prune()
+            call.done.set()
+        return call.value
+
+    def _prune(self):
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._results.items() if expires <= now]:
+            del self._results[key]
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls)
+            stats["fresh_entries"] = len(self._results)
+        return stats
+
+
+def request_key(endpoint: str, params: Optional[Dict]) -> Tuple:
+    """Order-independent key for an endpoint + query params"""
+    return (endpoint, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+
+def ttl_for(endpoint: str) -> float:
+    """Freshness window for an endpoint (0 = coalesce in-flight calls only)"""
+    return BYBIT_SINGLE_FLIGHT_TTL.get(endpoint, 0.0)
+
+
+# Process-wide coalescer shared by all BybitClient instances
+bybit_single_flight = SingleFlight()
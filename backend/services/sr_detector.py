@@ -3,12 +3,21 @@ CryptoFastSignals - Support/Resistance Detector
 Detects S/R levels using Pivot Points and historical High/Low
 """
 
+import threading
+import time
 from typing import List, Dict, Tuple, Optional
 import sys
 import os
 
+import numpy as np
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import SR_PROXIMITY_THRESHOLD, SR_LOOKBACK_DAYS
+from services.candle_frame import candle_column
+
+# Daily candles fetched per symbol for pivots + N-day high/low
+SR_DAILY_CANDLES = 30
+DAY_MS = 86_400_000
 
 
 def calculate_pivot_points(daily_candles: List[Dict]) -> Dict:
@@ -76,8 +85,8 @@ def get_high_low_levels(daily_candles: List[Dict], period: int = SR_LOOKBACK_DAY
     
     recent_candles = daily_candles[-period:]
     
-    highest_high = max(c["high"] for c in recent_candles)
-    lowest_low = min(c["low"] for c in recent_candles)
+    highest_high = max(candle_column(recent_candles, "high"))
+    lowest_low = min(candle_column(recent_candles, "low"))
     
     return {
         "HIGH": round(highest_high, 6),
@@ -201,6 +210,139 @@ def check_sr_proximity(
     return result
 
 
+def check_sr_proximity_batch(
+    prices: Dict[str, float],
+    sr_levels_by_symbol: Dict[str, Dict],
+    threshold: float = SR_PROXIMITY_THRESHOLD
+) -> Dict[str, Dict]:
+    """
+    check_sr_proximity for many symbols at once
+    
+    Levels are stacked into (symbols x levels) matrices, NaN-padded, and the
+    nearest resistance above / support below each price is found with one
+    argmax per side. Symbols without levels or price are skipped.
+    
+    Returns:
+        {symbol: proximity dict}, identical to check_sr_proximity per symbol
+    """
+    symbols = [s for s in sr_levels_by_symbol if prices.get(s)]
+    if not symbols:
+        return {}
+    
+    price = np.array([prices[s] for s in symbols], dtype=np.float64)[:, None]
+    results = {}
+    sides = {}
+    for side in ("resistances", "supports"):
+        rows = [sr_levels_by_symbol[s].get(side, []) for s in symbols]
+        width = max((len(r) for r in rows), default=0)
+        levels = np.full((len(symbols), max(width, 1)), np.nan)
+        for i, r in enumerate(rows):
+            levels[i, :len(r)] = [x["level"] for x in r]
+        # Resistances are sorted ascending and supports descending, so the first match is the nearest
+        beyond = levels > price if side == "resistances" else levels < price
+        sides[side] = (rows, beyond.any(axis=1), beyond.argmax(axis=1),
+                       np.abs(levels - price) / price)
+    
+    for i, symbol in enumerate(symbols):
+        result = {
+            "zone": "NEUTRAL",
+            "nearest_resistance": None,
+            "nearest_support": None,
+            "distance_to_resistance": None,
+            "distance_to_support": None,
+            "at_resistance": False,
+            "at_support": False
+        }
+        for side, name, zone in (("resistances", "resistance", "RESISTANCE"), ("supports", "support", "SUPPORT")):
+            rows, found, first, distance = sides[side]
+            if found[i]:
+                j = int(first[i])
+                d = float(distance[i, j])
+                result[f"nearest_{name}"] = rows[i][j]
+                result[f"distance_to_{name}"] = round(d, 6)
+                if d <= threshold:
+                    result[f"at_{name}"] = True
+                    result["zone"] = zone
+        results[symbol] = result
+    return results
+
+
+def utc_day(timestamp_ms: Optional[float] = None) -> int:
+    """Days since the epoch (UTC) of a millisecond timestamp, now by default"""
+    if timestamp_ms is None:
+        timestamp_ms = time.time() * 1000
+    return int(timestamp_ms // DAY_MS)
+
+
+class SRLevelCache:
+    """
+    get_all_sr_levels per (symbol, UTC day).
+    
+    Daily pivots and the N-day high/low only move when a daily candle closes,
+    so levels are computed once per symbol per day from the closed daily
+    candles (today's forming candle is left out) and dropped on day rollover.
+    """
+    
+    def __init__(self, daily_candles: int = SR_DAILY_CANDLES):
+        self.daily_candles = daily_candles
+        self._levels: Dict[Tuple[str, int], Dict] = {}
+        self._day: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "rollovers": 0}
+    
+    def _roll(self, day: int):
+        if day != self._day:
+            if self._day is not None:
+                self._stats["rollovers"] += 1
+            self._levels.clear()
+            self._day = day
+    
+    def get_levels(self, symbol: str, client, now_ms: Optional[float] = None) -> Dict:
+        """S/R levels of today for symbol, fetching daily candles on the first call of the day"""
+        day = utc_day(now_ms)
+        with self._lock:
+            self._roll(day)
+            levels = self._levels.get((symbol, day))
+            self._stats["hits" if levels is not None else "misses"] += 1
+        if levels is not None:
+            return levels
+        
+        candles = client.get_klines(symbol, "D", self.daily_candles)
+        if not candles:
+            # Not cached, so the next cycle retries the fetch
+            return {"resistances": [], "supports": []}
+        
+        timestamps = candle_column(candles, "timestamp")
+        closed = len(timestamps) - sum(1 for t in timestamps if t >= day * DAY_MS)
+        levels = get_all_sr_levels(candles[:closed]) if closed else {"resistances": [], "supports": []}
+        
+        with self._lock:
+            if day == self._day:
+                self._levels[(symbol, day)] = levels
+        return levels
+    
+    def proximity(self, prices: Dict[str, float], threshold: float = SR_PROXIMITY_THRESHOLD) -> Dict[str, Dict]:
+        """check_sr_proximity for every symbol in prices with levels cached today"""
+        with self._lock:
+            cached = {s: levels for (s, day), levels in self._levels.items() if day == self._day and s in prices}
+        return check_sr_proximity_batch(prices, cached, threshold)
+    
+    def clear(self):
+        with self._lock:
+            self._levels.clear()
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["symbols"] = len(self._levels)
+            stats["day"] = self._day
+        return stats
+
+
+# Process-wide cache used by the signal generator
+sr_level_cache = SRLevelCache()
+
+
 def get_sr_alignment(signal_direction: str, sr_proximity: Dict, signal_type: str = "EMA_CROSSOVER") -> Tuple[str, int]:
     """
     Determine if signal is aligned with S/R zones
@@ -0,0 +1,325 @@
+"""
+10D - Streaming Indicators
+Stateful EMA, MACD, Wilder RSI, ATR and Bollinger Bands per symbol/timeframe.
+
+Each closed bar is folded in once (update); the still-forming bar is evaluated
+with peek() without being committed, so a scan costs O(1) per indicator instead
+of a full recomputation over the lookback window. Fed the same bars from the
+same starting point, the values match indicator_calculator exactly.
+"""
+
+import bisect
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    EMA_FAST_PERIOD, EMA_SLOW_PERIOD,
+    MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+    BB_PERIOD, BB_STD_DEV, RSI_PERIOD, ATR_PERIOD,
+    STREAMING_INDICATORS_MAX_SERIES
+)
+from services.candle_frame import candle_column
+
+# ATR values kept for "current vs recent average" checks (BTC regime)
+ATR_HISTORY = 10
+
+
+class StreamingEMA:
+    """EMA seeded with the SMA of the first `period` values"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.value: Optional[float] = None
+        self._seed: List[float] = []
+
+    def _step(self, x: float) -> Optional[float]:
+        if self.value is not None:
+            return (x - self.value) * self.multiplier + self.value
+        if len(self._seed) + 1 == self.period:
+            return sum(self._seed + [x]) / self.period
+        return None
+
+    def update(self, x: float) -> Optional[float]:
+        value = self._step(x)
+        if value is None:
+            self._seed.append(x)
+        else:
+            self._seed = []
+        self.value = value
+        return value
+
+    def peek(self, x: float) -> Optional[float]:
+        return self._step(x)
+
+
+class StreamingMACD:
+    """MACD line, signal (EMA of the MACD line) and histogram"""
+
+    def __init__(self, fast: int = MACD_FAST, slow: int = MACD_SLOW, signal: int = MACD_SIGNAL):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+        self.histogram: Optional[float] = None
+
+    def update(self, x: float) -> Optional[float]:
+        fast, slow = self.fast.update(x), self.slow.update(x)
+        self.histogram = None
+        if fast is not None and slow is not None:
+            macd = fast - slow
+            signal = self.signal.update(macd)
+            if signal is not None:
+                self.histogram = macd - signal
+        return self.histogram
+
+    def peek(self, x: float) -> Optional[float]:
+        fast, slow = self.fast.peek(x), self.slow.peek(x)
+        if fast is None or slow is None:
+            return None
+        macd = fast - slow
+        signal = self.signal.peek(macd)
+        return macd - signal if signal is not None else None
+
+
+class StreamingRSI:
+    """Wilder-smoothed RSI, rounded to 2 decimals like calculate_rsi"""
+
+    def __init__(self, period: int = RSI_PERIOD):
+        self.period = period
+        self.value: Optional[float] = None
+        self._prev_close: Optional[float] = None
+        self._avg_gain: Optional[float] = None
+        self._avg_loss: Optional[float] = None
+        self._gains: List[float] = []
+        self._losses: List[float] = []
+
+    def _step(self, x: float) -> Tuple[Optional[float], Optional[float], Optional[float], float, float]:
+        if self._prev_close is None:
+            return None, None, None, 0, 0
+        change = x - self._prev_close
+        gain, loss = max(0, change), max(0, -change)
+        p = self.period
+
+        if self._avg_gain is None:
+            if len(self._gains) + 1 < p:
+                return None, None, None, gain, loss
+            avg_gain = sum(self._gains + [gain]) / p
+            avg_loss = sum(self._losses + [loss]) / p
+        else:
+            avg_gain = (self._avg_gain * (p - 1) + gain) / p
+            avg_loss = (self._avg_loss * (p - 1) + loss) / p
+
+        if avg_loss == 0:
+            rsi = 100
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return round(rsi, 2), avg_gain, avg_loss, gain, loss
+
+    def update(self, x: float) -> Optional[float]:
+        value, avg_gain, avg_loss, gain, loss = self._step(x)
+        if self._prev_close is not None and avg_gain is None:
+            self._gains.append(gain)
+            self._losses.append(loss)
+        elif avg_gain is not None:
+            self._gains, self._losses = [], []
+        self._avg_gain, self._avg_loss = avg_gain, avg_loss
+        self._prev_close = x
+        self.value = value
+        return value
+
+    def peek(self, x: float) -> Optional[float]:
+        return self._step(x)[0]
+
+
+class StreamingATR:
+    """Mean of the last `period` true ranges (same definition as calculate_atr)"""
+
+    def __init__(self, period: int = ATR_PERIOD, history: int = ATR_HISTORY):
+        self.period = period
+        self.value: Optional[float] = None
+        self.history: Deque[float] = deque(maxlen=history)
+        self._prev_close: Optional[float] = None
+        self._ranges: Deque[float] = deque(maxlen=period)
+
+    def _true_range(self, high: float, low: float) -> float:
+        prev = self._prev_close
+        return max(high - low, abs(high - prev), abs(low - prev))
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        if self._prev_close is not None:
+            self._ranges.append(self._true_range(high, low))
+            if len(self._ranges) == self.period:
+                self.value = sum(self._ranges) / self.period
+                self.history.append(self.value)
+        self._prev_close = close
+        return self.value
+
+    def peek(self, high: float, low: float) -> Optional[float]:
+        if self._prev_close is None or len(self._ranges) + 1 < self.period:
+            return None
+        window = list(self._ranges)[1 - self.period:] if self.period > 1 else []
+        return sum(window + [self._true_range(high, low)]) / self.period
+
+
+class StreamingBollinger:
+    """Bollinger Bands over a fixed window of closes"""
+
+    def __init__(self, period: int = BB_PERIOD, std_dev: float = BB_STD_DEV):
+        self.period = period
+        self.std_dev = std_dev
+        self._window: Deque[float] = deque(maxlen=period)
+
+    def _bands(self, window: List[float]) -> Dict[str, Optional[float]]:
+        if len(window) < self.period:
+            return {"upper": None, "middle": None, "lower": None}
+        sma = sum(window) / self.period
+        stdev = (sum((x - sma) ** 2 for x in window) / self.period) ** 0.5
+        return {"upper": sma + self.std_dev * stdev, "middle": sma, "lower": sma - self.std_dev * stdev}
+
+    def update(self, x: float) -> Dict[str, Optional[float]]:
+        self._window.append(x)
+        return self._bands(list(self._window))
+
+    def peek(self, x: float) -> Dict[str, Optional[float]]:
+        window = list(self._window)[1 - self.period:] if self.period > 1 else []
+        return self._bands(window + [x])
+
+
+class IndicatorState:
+    """
+    All streaming indicators for one symbol/timeframe.
+
+    sync() takes the usual kline window (chronological, last bar forming),
+    commits the closed bars it has not seen and peeks the forming one. A window
+    that no longer contains the last committed bar (gap, rollback) rebuilds the
+    state from that window.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.ema_fast = StreamingEMA(EMA_FAST_PERIOD)
+        self.ema_slow = StreamingEMA(EMA_SLOW_PERIOD)
+        self.macd = StreamingMACD()
+        self.rsi = StreamingRSI()
+        self.atr = StreamingATR()
+        self.bb = StreamingBollinger()
+        self.last_timestamp: Optional[int] = None
+        self.bars = 0
+
+    def commit(self, timestamp: int, high: float, low: float, close: float):
+        self.ema_fast.update(close)
+        self.ema_slow.update(close)
+        self.macd.update(close)
+        self.rsi.update(close)
+        self.atr.update(high, low, close)
+        self.bb.update(close)
+        self.last_timestamp = timestamp
+        self.bars += 1
+
+    def sync(self, candles) -> Tuple[int, bool]:
+        """Commit unseen closed bars. Returns (bars committed, rebuilt)."""
+        timestamps = candle_column(candles, "timestamp")
+        closed = len(timestamps) - 1
+
+        start, rebuilt = 0, False
+        if self.last_timestamp is not None:
+            i = bisect.bisect_left(timestamps, self.last_timestamp)
+            if i < closed and timestamps[i] == self.last_timestamp:
+                start = i + 1
+            else:
+                rebuilt = True
+        if rebuilt:
+            self._reset()
+
+        if start < closed:
+            highs = candle_column(candles, "high")
+            lows = candle_column(candles, "low")
+            closes = candle_column(candles, "close")
+            for i in range(start, closed):
+                self.commit(timestamps[i], highs[i], lows[i], closes[i])
+        return max(0, closed - start), rebuilt
+
+    def snapshot(self, candles) -> Dict:
+        """Current values with the forming (last) bar applied, plus the last closed values"""
+        forming = candles[-1:]
+        close = candle_column(forming, "close")[0]
+        high = candle_column(forming, "high")[0]
+        low = candle_column(forming, "low")[0]
+        atr = self.atr.peek(high, low)
+        bands = self.bb.peek(close)
+        return {
+            "timestamp": candle_column(forming, "timestamp")[0],
+            "bars": self.bars + 1,
+            "ema_fast": self.ema_fast.peek(close),
+            "ema_fast_prev": self.ema_fast.value,
+            "ema_slow": self.ema_slow.peek(close),
+            "ema_slow_prev": self.ema_slow.value,
+            "macd_hist": self.macd.peek(close),
+            "rsi": self.rsi.peek(close),
+            "atr": atr,
+            "atr_recent": (list(self.atr.history) + [atr])[-ATR_HISTORY:] if atr is not None else [],
+            "bb_upper": bands["upper"],
+            "bb_middle": bands["middle"],
+            "bb_lower": bands["lower"]
+        }
+
+
+class StreamingIndicatorRegistry:
+    """IndicatorState per (symbol, interval), least recently used evicted"""
+
+    def __init__(self, max_series: int = STREAMING_INDICATORS_MAX_SERIES):
+        self.max_series = max_series
+        self._states: "OrderedDict[Tuple[str, str], IndicatorState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"updates": 0, "bars_committed": 0, "rebuilds": 0}
+
+    def _state(self, key: Tuple[str, str]) -> IndicatorState:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = IndicatorState()
+                if len(self._states) > self.max_series:
+                    self._states.popitem(last=False)
+            else:
+                self._states.move_to_end(key)
+            return state
+
+    def update(self, symbol: str, interval: str, candles) -> Optional[Dict]:
+        """Sync with the latest window and return current indicator values"""
+        if not candles or len(candles) == 0:
+            return None
+        state = self._state((symbol, interval))
+        with state.lock:
+            committed, rebuilt = state.sync(candles)
+            snapshot = state.snapshot(candles)
+
+        with self._lock:
+            self._stats["updates"] += 1
+            self._stats["bars_committed"] += committed
+            self._stats["rebuilds"] += int(rebuilt)
+        return snapshot
+
+    def reset(self, symbol: Optional[str] = None):
+        with self._lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                for key in [k for k in self._states if k[0] == symbol]:
+                    del self._states[key]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["series"] = len(self._states)
+        return stats
+
+
+# Process-wide registry used by the signal generator
+streaming_indicators = StreamingIndicatorRegistry()
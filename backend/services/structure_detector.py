@@ -0,0 +1,165 @@
+"""
+10D - Structure Detector
+Horizontal S/R clustering and Judas Swing false-break checks.
+
+Levels come from the same greedy rule as before (each value joins the first
+cluster whose mean is within the tolerance, else opens a new one), but cluster
+means are kept as running sums in a mean-sorted index, so a value only looks at
+the few clusters near its price instead of re-averaging every cluster. The
+false-break rules are evaluated as (levels x break bars) masks.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Sequence
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import JUDAS_RECLAIM_CANDLES, JUDAS_WICK_PERCENT
+from services.candle_frame import candle_array, candle_column
+from services import jit_kernels
+
+# find_ranges_30m: bars scanned and relative distance to a cluster mean
+RANGES_LOOKBACK = 50
+LEVEL_TOLERANCE = 0.001
+
+# detect_judas_swing: deviation window (ATR multiples) and bars that may break a level
+JUDAS_DEVIATION = (0.5, 1.5)
+JUDAS_BREAK_BARS = (-4, -3, -2)
+
+# Widens the bisect window so float rounding never hides a matching cluster
+_SEARCH_SLACK = 1e-9
+
+
+def cluster_levels(values: Sequence[float], tolerance: float = LEVEL_TOLERANCE) -> List[float]:
+    """Means of the clusters with at least 2 touches, in the order the clusters were opened"""
+    sums: List[float] = []
+    touches: List[int] = []
+    index: List[tuple] = []  # (mean, cluster id), sorted by mean
+    low_factor = (1 - _SEARCH_SLACK) / (1 + tolerance)
+    high_factor = (1 + _SEARCH_SLACK) / (1 - tolerance)
+
+    for val in values:
+        if val > 0:
+            lo = bisect_left(index, (val * low_factor, -1))
+            hi = bisect_right(index, (val * high_factor, len(sums)))
+        else:
+            lo, hi = 0, len(index)
+
+        slot = None
+        for mean, cluster in index[lo:hi]:
+            if abs(val - mean) / mean <= tolerance and (slot is None or cluster < slot):
+                slot = cluster
+
+        if slot is None:
+            sums.append(val)
+            touches.append(1)
+            insort(index, (val, len(sums) - 1))
+        else:
+            del index[bisect_left(index, (sums[slot] / touches[slot], slot))]
+            sums[slot] += val
+            touches[slot] += 1
+            insort(index, (sums[slot] / touches[slot], slot))
+
+    return [s / n for s, n in zip(sums, touches) if n >= 2]
+
+
+def find_ranges(candles, lookback: int = RANGES_LOOKBACK) -> Dict[str, List[float]]:
+    """Supports (ascending) and resistances (descending) from the last `lookback` lows/highs"""
+    if len(candles) < lookback:
+        return {"supports": [], "resistances": []}
+    recent = candles[-lookback:]
+    return {
+        "supports": sorted(cluster_levels(candle_column(recent, "low"))),
+        "resistances": sorted(cluster_levels(candle_column(recent, "high")), reverse=True)
+    }
+
+
+def find_false_break(candles, levels: List[float], atr: float, long: bool) -> Optional[Dict]:
+    """
+    First (level, break bar) in scan order where price broke the level by
+    0.5-1.5 ATR and the first close back inside came within
+    JUDAS_RECLAIM_CANDLES bars on a candle with a >= JUDAS_WICK_PERCENT wick.
+    """
+    if not levels:
+        return None
+    window = candles[-4:]
+    scale = atr if atr > 0 else 1
+
+    # Only levels inside the deviation band of some break bar can fire
+    extremes = candle_column(window, "low" if long else "high")[:3]
+    slack = _SEARCH_SLACK * (abs(max(extremes)) + scale)
+    if long:
+        lo, hi = min(extremes) + JUDAS_DEVIATION[0] * scale, max(extremes) + JUDAS_DEVIATION[1] * scale
+    else:
+        lo, hi = min(extremes) - JUDAS_DEVIATION[1] * scale, max(extremes) - JUDAS_DEVIATION[0] * scale
+    levels = [v for v in levels if lo - slack <= v <= hi + slack]
+    if not levels:
+        return None
+
+    o = candle_array(window, "open")
+    h = candle_array(window, "high")
+    l = candle_array(window, "low")
+    c = candle_array(window, "close")
+    if jit_kernels.ENABLED:
+        return _false_break_kernel(window, levels, o, h, l, c, scale, long)
+    lv = np.asarray(levels, dtype=np.float64)[:, None]
+
+    # Break bars are window positions 0..2 (bars -4..-2), reclaim bars positions 1..3
+    extreme = l[:3] if long else h[:3]
+    deviation = ((lv - extreme) if long else (extreme - lv)) / scale
+    broke = (extreme < lv) if long else (extreme > lv)
+    ok = broke & (JUDAS_DEVIATION[0] <= deviation) & (deviation <= JUDAS_DEVIATION[1])
+    if not ok.any():
+        return None
+
+    inside = (c[1:] > lv) if long else (c[1:] < lv)                    # (levels x 3)
+    after = np.arange(3)[None, :] >= np.arange(3)[:, None]              # reclaim bar follows break bar
+    candidates = inside[:, None, :] & after[None, :, :]                 # (levels x break x reclaim)
+    reclaimed = candidates.any(axis=2)
+    first = candidates.argmax(axis=2)
+    reclaim_candles = first + 1 - np.arange(3)[None, :]
+
+    body = np.abs(c[1:] - o[1:])
+    total = h[1:] - l[1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wick_ok = (total > 0) & (((total - body) / total) >= (JUDAS_WICK_PERCENT / 100))
+
+    hit = ok & reclaimed & (reclaim_candles <= JUDAS_RECLAIM_CANDLES) & wick_ok[first]
+    if not hit.any():
+        return None
+
+    level_idx, bar = divmod(int(hit.argmax()), 3)
+    reclaim = int(first[level_idx, bar]) + 1
+    target = window[reclaim]
+    body = abs(target["close"] - target["open"])
+    total = target["high"] - target["low"]
+    return {
+        "type": "JUDAS_SWING",
+        "level": round(levels[level_idx], 6),
+        "deviation_atr": round(float(deviation[level_idx, bar]), 2),
+        "reclaim_candles": reclaim - bar,
+        "wick_percent": round(((total - body) / total) * 100, 2)
+    }
+
+
+def _false_break_kernel(window, levels, o, h, l, c, scale, long) -> Optional[Dict]:
+    """find_false_break via the compiled reclaim search"""
+    level_idx, bar, reclaim_candles, deviation = jit_kernels.false_break(
+        np.asarray(levels, dtype=np.float64), o, h, l, c, float(scale), long,
+        JUDAS_DEVIATION[0], JUDAS_DEVIATION[1], JUDAS_RECLAIM_CANDLES, JUDAS_WICK_PERCENT / 100
+    )
+    if level_idx < 0:
+        return None
+    target = window[bar + reclaim_candles]
+    body = abs(target["close"] - target["open"])
+    total = target["high"] - target["low"]
+    return {
+        "type": "JUDAS_SWING",
+        "level": round(levels[level_idx], 6),
+        "deviation_atr": round(float(deviation), 2),
+        "reclaim_candles": int(reclaim_candles),
+        "wick_percent": round(((total - body) / total) * 100, 2)
+    }
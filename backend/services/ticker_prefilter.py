@@ -0,0 +1,180 @@
+"""
+10D - Ticker Prefilter
+Decides, from the single get_all_tickers snapshot, which monitored pairs can
+possibly produce a signal this cycle, so only those pay for the per-pair
+kline / trades / OI / LSR fetches.
+
+State comes from the last batch indicator pass (batch_indicators.compute_batch)
+of each pair: the 30M candles it evaluated and whether an entry detector fired.
+The only candle that can change before the next 30M close is the forming one,
+so while that bar is still open a pair is re-checked without fetching: the
+batch detectors are rerun on the stored candles with the forming bar's close
+set to the ticker's last price and its high/low widened to every last price
+seen since the batch pass. The pair is skipped only when none of them fires on
+that data.
+
+Everything else survives: missing tickers or state, a 30M close since the
+batch pass, a detector that fired at the batch pass, and |24h change| at or
+above TICKER_FORCE_CHANGE_24H.
+
+Separately, when TICKER_MIN_TURNOVER_24H is set (off by default), pairs below
+that 24h turnover are dropped before the rules above. That is a liquidity
+choice, not a "cannot signal" verdict, and is counted as "illiquid".
+
+A ticker only shows the last price, so a wick that starts and reverses between
+two snapshots is not part of the forming bar this check sees.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import TICKER_MIN_TURNOVER_24H, TICKER_FORCE_CHANGE_24H
+from services.batch_indicators import compute_batch
+from services.candle_frame import CandleFrame, FIELD_INDEX
+from services.kline_cache import INTERVAL_MS
+
+BAR_MS = INTERVAL_MS["30"]
+
+
+def _float(ticker: Dict, field: str) -> Optional[float]:
+    try:
+        return float(ticker[field])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def forming_bar(frame: CandleFrame, price: float, high: float, low: float) -> CandleFrame:
+    """Copy of `frame` whose last bar closes at `price` with the given high/low"""
+    data = frame.values.copy()
+    data[FIELD_INDEX["close"], -1] = price
+    data[FIELD_INDEX["high"], -1] = high
+    data[FIELD_INDEX["low"], -1] = low
+    return CandleFrame(data)
+
+
+class TickerPrefilter:
+    """Per-pair candles from the last batch pass plus the survive/skip rules above"""
+
+    def __init__(self, min_turnover: float = TICKER_MIN_TURNOVER_24H,
+                 force_change: float = TICKER_FORCE_CHANGE_24H):
+        self.min_turnover = min_turnover
+        self.force_change = force_change
+        self._state: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._last = {"pairs": 0, "survivors": 0, "skipped": 0, "illiquid": 0, "skip_ratio": 0.0, "reasons": {}}
+        self._totals = {"pairs": 0, "skipped": 0}
+
+    def record(self, results: Dict[str, Dict], candles_by_symbol: Dict[str, object]):
+        """Remember the batch pass outcome and candles of every batched pair"""
+        with self._lock:
+            for symbol, result in results.items():
+                candles = candles_by_symbol.get(symbol)
+                if not result.get("batched") or not candles:
+                    self._state.pop(symbol, None)
+                    continue
+                frame = CandleFrame.from_dicts(candles)
+                self._state[symbol] = {
+                    "frame": frame,
+                    "bar_ts": float(frame.timestamp[-1]),
+                    "high": float(frame.high[-1]),
+                    "low": float(frame.low[-1]),
+                    "candidate": result["candidate"]
+                }
+
+    def _illiquid(self, ticker: Optional[Dict]) -> bool:
+        """Below the opt-in turnover floor (never when the floor is off or unknown)"""
+        if self.min_turnover <= 0 or ticker is None:
+            return False
+        turnover = _float(ticker, "turnover24h")
+        return turnover is not None and turnover < self.min_turnover
+
+    def _verdict(self, ticker: Optional[Dict], state: Optional[Dict], now_ms: float) -> str:
+        """Reason a pair survives without a re-check, or "recheck" when the forming bar decides"""
+        if ticker is None:
+            return "no_ticker"
+        price = _float(ticker, "lastPrice")
+        change = _float(ticker, "price24hPcnt")
+        if price is None:
+            return "no_ticker"
+        if change is not None and abs(change) >= self.force_change:
+            return "momentum"
+        if state is None:
+            return "no_state"
+        if now_ms >= state["bar_ts"] + BAR_MS:
+            return "new_bar"
+        if state["candidate"]:
+            return "candidate"
+        return "recheck"
+
+    def _recheck(self, prices: Dict[str, float]) -> Dict[str, bool]:
+        """
+        Batch detectors on the stored candles with each pair's forming bar at
+        its ticker price; True where one fires. Widens the tracked high/low.
+        """
+        frames = {}
+        with self._lock:
+            for symbol, price in prices.items():
+                state = self._state[symbol]
+                state["high"] = max(state["high"], price)
+                state["low"] = min(state["low"], price)
+                frames[symbol] = forming_bar(state["frame"], price, state["high"], state["low"])
+        results = compute_batch(frames)
+        return {symbol: results[symbol]["candidate"] for symbol in prices}
+
+    def select(self, symbols: List[str], snapshot, now_ms: Optional[float] = None) -> List[str]:
+        """Survivors of `symbols` (same order) for this cycle's ticker snapshot"""
+        if not snapshot:
+            return list(symbols)
+        now_ms = time.time() * 1000 if now_ms is None else now_ms
+        with self._lock:
+            state = dict(self._state)
+
+        illiquid = [s for s in symbols if self._illiquid(snapshot.get(s))]
+        dropped = set(illiquid)
+        verdicts = {
+            symbol: self._verdict(snapshot.get(symbol), state.get(symbol), now_ms)
+            for symbol in symbols if symbol not in dropped
+        }
+        recheck = [s for s, verdict in verdicts.items() if verdict == "recheck"]
+        if recheck:
+            fires = self._recheck({s: float(snapshot.get(s)["lastPrice"]) for s in recheck})
+            for symbol in recheck:
+                verdicts[symbol] = "forming_bar" if fires[symbol] else "settled"
+
+        survivors = [s for s, verdict in verdicts.items() if verdict != "settled"]
+        reasons = Counter(verdicts.values())
+        skipped = len(verdicts) - len(survivors)
+        with self._lock:
+            self._last = {
+                "pairs": len(symbols),
+                "survivors": len(survivors),
+                "skipped": skipped,
+                "illiquid": len(illiquid),
+                "skip_ratio": round(skipped / len(symbols), 3) if symbols else 0.0,
+                "reasons": dict(reasons)
+            }
+            self._totals["pairs"] += len(symbols)
+            self._totals["skipped"] += skipped
+        return survivors
+
+    def clear(self):
+        with self._lock:
+            self._state.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            total = self._totals["pairs"]
+            return {
+                **self._last,
+                "tracked": len(self._state),
+                "total_skip_ratio": round(self._totals["skipped"] / total, 3) if total else 0.0
+            }
+
+
+# Global instance
+ticker_prefilter = TickerPrefilter()
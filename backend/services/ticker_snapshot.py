@@ -0,0 +1,135 @@
+"""
+10D - Ticker Snapshot
+One linear ticker table per tick, shared by every consumer (monitor, scanner,
+bankroll, elite agent, API routes) as an indexed, versioned in-memory map.
+"""
+
+import time
+import threading
+from typing import Dict, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import TICKER_SNAPSHOT_MAX_AGE
+
+
+class TickerSnapshot:
+    """Immutable view of the full ticker table at one point in time"""
+
+    __slots__ = ("version", "fetched_at", "tickers", "prices")
+
+    def __init__(self, version: int, fetched_at: float, tickers: Dict[str, Dict], prices: Dict[str, float]):
+        self.version = version
+        self.fetched_at = fetched_at
+        self.tickers = tickers
+        self.prices = prices
+
+    @property
+    def age(self) -> float:
+        """Seconds since the table was fetched (inf if never fetched)"""
+        return time.time() - self.fetched_at if self.fetched_at else float("inf")
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        return self.tickers.get(symbol)
+
+    def price(self, symbol: str) -> Optional[float]:
+        return self.prices.get(symbol)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __bool__(self) -> bool:
+        return bool(self.tickers)
+
+
+EMPTY_SNAPSHOT = TickerSnapshot(0, 0.0, {}, {})
+
+
+class TickerSnapshotService:
+    """
+    Refreshes the ticker table with a single get_all_tickers call and hands out
+    the latest snapshot. The scan/monitor tick calls refresh(); other readers use
+    get_snapshot(max_age), which only refreshes when the table is too old.
+    A failed refresh keeps the previous snapshot (its age keeps growing).
+    """
+
+    def __init__(self, client=None, max_age: float = TICKER_SNAPSHOT_MAX_AGE):
+        self.client = client
+        self.max_age = max_age
+        self._snapshot = EMPTY_SNAPSHOT
+        self._refresh_lock = threading.Lock()
+        self._refreshes = 0
+        self._failures = 0
+
+    def _get_client(self, client):
+        if client is not None:
+            return client
+        if self.client is None:
+            from services.bybit_client import BybitClient
+            self.client = BybitClient()
+        return self.client
+
+    def refresh(self, client=None) -> TickerSnapshot:
+        """Fetch the full linear ticker table now and publish a new version"""
+        with self._refresh_lock:
+            tickers = self._get_client(client).get_all_tickers()
+            if not tickers:
+                self._failures += 1
+                return self._snapshot
+            self._publish(tickers)
+            return self._snapshot
+
+    def _publish(self, tickers: List[Dict]):
+        table = {}
+        prices = {}
+        for t in tickers:
+            symbol = t.get("symbol")
+            if not symbol:
+                continue
+            table[symbol] = t
+            try:
+                prices[symbol] = float(t["lastPrice"])
+            except (KeyError, TypeError, ValueError):
+                pass
+        self._refreshes += 1
+        # Swap the reference: readers holding the old snapshot are unaffected
+        self._snapshot = TickerSnapshot(self._snapshot.version + 1, time.time(), table, prices)
+
+    def get_snapshot(self, max_age: Optional[float] = None, client=None) -> TickerSnapshot:
+        """Latest snapshot, refreshed first if older than max_age seconds"""
+        max_age = self.max_age if max_age is None else max_age
+        snapshot = self._snapshot
+        if snapshot.age <= max_age:
+            return snapshot
+
+        with self._refresh_lock:
+            # Another reader may have refreshed while we waited
+            if self._snapshot.age <= max_age:
+                return self._snapshot
+            tickers = self._get_client(client).get_all_tickers()
+            if tickers:
+                self._publish(tickers)
+            else:
+                self._failures += 1
+            return self._snapshot
+
+    def get_price(self, symbol: str, max_age: Optional[float] = None, client=None) -> Optional[float]:
+        return self.get_snapshot(max_age, client).price(symbol)
+
+    def get_ticker(self, symbol: str, max_age: Optional[float] = None, client=None) -> Optional[Dict]:
+        return self.get_snapshot(max_age, client).get(symbol)
+
+    def get_stats(self) -> Dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version,
+            "symbols": len(snapshot),
+            "age_s": round(snapshot.age, 2) if snapshot.fetched_at else None,
+            "refreshes": self._refreshes,
+            "failures": self._failures
+        }
+
+
+# Process-wide snapshot shared by all consumers
+ticker_snapshots = TickerSnapshotService()
@@ -0,0 +1,60 @@
+"""
+10D - Test Helpers
+Synthetic candles and the reference loops that structure_detector replaced.
+Shared by the unit tests and benchmarks/bench_structure.py.
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import JUDAS_RECLAIM_CANDLES, JUDAS_WICK_PERCENT
+from services.structure_detector import LEVEL_TOLERANCE
+
+
+def make_candles(n, seed=0, vol=0.004):
+    """Random-walk OHLC bars; timestamp is the bar index"""
+    rng = random.Random(seed)
+    bars, price = [], 100.0
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.gauss(0, vol))
+        w = abs(rng.gauss(0, vol)) * o * 3
+        bars.append({"timestamp": i, "open": o, "high": max(o, c) + w * rng.random(),
+                     "low": min(o, c) - w * rng.random(), "close": c, "volume": 1.0, "turnover": 1.0})
+        price = c
+    return bars
+
+
+def first_fit_levels(values, tolerance=LEVEL_TOLERANCE):
+    """Previous find_ranges_30m clustering (re-averages every cluster per value)"""
+    clusters = []
+    for val in values:
+        for group in clusters:
+            avg = sum(group) / len(group)
+            if abs(val - avg) / avg <= tolerance:
+                group.append(val)
+                break
+        else:
+            clusters.append([val])
+    return [sum(c) / len(c) for c in clusters if len(c) >= 2]
+
+
+def loop_false_break(candles, levels, atr):
+    """Previous detect_judas_swing support loop"""
+    for support in levels:
+        for i in range(-4, -1):
+            if candles[i]["low"] < support:
+                desvio = (support - candles[i]["low"]) / (atr if atr > 0 else 1)
+                if 0.5 <= desvio <= 1.5:
+                    for j in range(i + 1, 0):
+                        if candles[j]["close"] > support:
+                            target = candles[j]
+                            body = abs(target["close"] - target["open"])
+                            total = target["high"] - target["low"]
+                            if (j - i) <= JUDAS_RECLAIM_CANDLES and total > 0 and \
+                                    (total - body) / total >= JUDAS_WICK_PERCENT / 100:
+                                return support
+                            break
+    return None
@@ -0,0 +1,75 @@
+"""
+10D - Analysis Pool Tests
+Worker-process analysis must match the in-process result
+"""
+
+import types
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.datasets import synthetic_universe
+from services.analysis_pool import AnalysisPool, pack_frames, unpack_frames
+from services.candle_frame import CandleFrame
+from services.indicator_calculator import analyze_candles
+from services.signal_scorer import calculate_signal_score
+
+UNIVERSE = synthetic_universe(100, 3, seed=11)
+SCORE_CALLS = [
+    {"signal_direction": "LONG", "volume_confirmed": True, "pivot_trend_direction": "LONG",
+     "sr_alignment": "ALIGNED", "signal_type": "JUDAS_SWING", "cvd_divergence": True},
+    {"signal_direction": "SHORT", "volume_confirmed": False, "pivot_trend_direction": "LONG",
+     "sr_alignment": "NEUTRAL", "rsi_value": 71.0}
+]
+
+
+def analysis_inputs(symbol):
+    return dict(
+        candles_4h=UNIVERSE["candles_4h"][symbol],
+        recent_trades=UNIVERSE["trades"][symbol],
+        oi_data=UNIVERSE["oi"][symbol],
+        lsr_data=UNIVERSE["lsr"][symbol],
+        btc_candles=UNIVERSE["btc"]
+    )
+
+
+class TestAnalysisPool:
+    """services/analysis_pool.py"""
+
+    def test_shared_memory_round_trip(self):
+        symbol = UNIVERSE["symbols"][0]
+        shm, layout = pack_frames({"candles": UNIVERSE["candles"][symbol], "candles_4h": None,
+                                   "btc_candles": UNIVERSE["btc"]})
+        try:
+            frames = unpack_frames(shm.name, layout)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        assert list(frames) == ["candles", "btc_candles"]
+        assert frames["candles"] == CandleFrame.from_dicts(UNIVERSE["candles"][symbol])
+        assert frames["btc_candles"] == CandleFrame.from_dicts(UNIVERSE["btc"])
+        assert pack_frames({"candles": []}) == (None, [])
+
+    def test_worker_results_match_in_process(self):
+        pool = AnalysisPool(workers=1, enabled=True)
+        try:
+            for symbol in UNIVERSE["symbols"]:
+                candles = CandleFrame.from_dicts(UNIVERSE["candles"][symbol])
+                expected = analyze_candles(candles, **analysis_inputs(symbol))
+                assert pool.analyze(candles, **analysis_inputs(symbol)) == expected
+            assert pool.score(SCORE_CALLS) == [calculate_signal_score(**kw) for kw in SCORE_CALLS]
+            stats = pool.get_stats()
+        finally:
+            pool.shutdown()
+
+        assert stats["running"] and stats["fallbacks"] == 0
+        assert (stats["analyze_jobs"], stats["score_jobs"]) == (3, 1)
+        assert stats["shm_bytes"] > 0
+
+    def test_app_script_runs_in_process(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "__main__", types.SimpleNamespace(__file__="/srv/backend/app.py"))
+        pool = AnalysisPool(workers=1, enabled=True)
+
+        assert pool.score(SCORE_CALLS[:1]) == [calculate_signal_score(**SCORE_CALLS[0])]
+        assert not pool.enabled and not pool.get_stats()["running"]
@@ -0,0 +1,145 @@
+"""
+10D - Async Bybit Client Tests
+Return shapes must match the sync BybitClient for the same raw payloads
+"""
+
+import asyncio
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.bybit_client import BybitClient
+from services.async_bybit_client import AsyncBybitClient
+from services.kline_cache import KlineCache
+
+
+RAW = {
+    "/v5/market/kline": {"list": [
+        ["1700001800000", "101", "103", "100", "102", "10", "1020"],
+        ["1700000000000", "100", "102", "99", "101", "12", "1212"]
+    ]},
+    "/v5/market/open-interest": {"list": [
+        {"openInterest": "5000", "timestamp": "1700001800000"},
+        {"openInterest": "4900", "timestamp": "1700000000000"}
+    ]},
+    "/v5/market/account-ratio": {"list": [
+        {"buyRatio": "0.55", "sellRatio": "0.45", "timestamp": "1700001800000"}
+    ]},
+    "/v5/market/recent-trade": {"list": [
+        {"price": "101.5", "size": "2", "side": "Buy", "time": "1700001810000"},
+        {"price": "101.4", "size": "1", "side": "Sell", "time": "1700001805000"}
+    ]},
+    "/v5/market/tickers": {"list": [{"symbol": "ETHUSDT", "lastPrice": "2000"}]},
+    "/v5/market/instruments-info": {"list": [
+        {"symbol": "ETHUSDT", "baseCoin": "ETH", "quoteCoin": "USDT",
+         "leverageFilter": {"maxLeverage": "100"}, "priceFilter": {"minPrice": "0.01", "tickSize": "0.01"}},
+        {"symbol": "LOWUSDT", "baseCoin": "LOW", "quoteCoin": "USDT",
+         "leverageFilter": {"maxLeverage": "10"}, "priceFilter": {"minPrice": "0.01", "tickSize": "0.01"}}
+    ]}
+}
+
+
+class FakeAsyncClient(AsyncBybitClient):
+    def __init__(self):
+        super().__init__(max_concurrency=4, session=object())
+        self.calls = []
+
+    async def open(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def _make_request(self, endpoint, params=None):
+        self.calls.append((endpoint, params))
+        await asyncio.sleep(0)
+        return RAW[endpoint]
+
+
+def make_sync_client():
+    client = BybitClient(kline_cache=KlineCache())
+    client._make_request = lambda endpoint, params=None: RAW[endpoint]
+    return client
+
+
+class TestAsyncBybitClient:
+    """Async API parity with the sync client"""
+
+    def test_same_shapes_as_sync(self):
+        sync_client = make_sync_client()
+
+        async def run():
+            client = FakeAsyncClient()
+            return (
+                await client.get_klines("ETHUSDT", "30", 2),
+                await client.get_open_interest("ETHUSDT", "30min", 2),
+                await client.get_long_short_ratio("ETHUSDT", "30min", 1),
+                await client.get_recent_trades("ETHUSDT", 2),
+                await client.get_all_tickers(),
+                await client.get_instruments()
+            )
+
+        klines, oi, lsr, trades, tickers, instruments = asyncio.run(run())
+
+        assert klines == sync_client.get_klines("ETHUSDT", "30", 2)
+        assert klines[0]["timestamp"] < klines[1]["timestamp"]
+        assert oi == sync_client.get_open_interest("ETHUSDT", "30min", 2)
+        assert lsr == sync_client.get_long_short_ratio("ETHUSDT", "30min", 1)
+        assert trades == sync_client.get_recent_trades("ETHUSDT", 2)
+        assert tickers == sync_client.get_all_tickers()
+        assert instruments == sync_client.get_instruments()
+        assert [i["symbol"] for i in instruments] == ["ETHUSDT"]
+
+    def test_fetch_universe_fans_out(self):
+        async def run():
+            client = FakeAsyncClient()
+            data = await client.fetch_universe(["AUSDT", "BUSDT", "CUSDT"])
+            return client, data
+
+        client, data = asyncio.run(run())
+
+        assert set(data) == {"AUSDT", "BUSDT", "CUSDT"}
+        assert len(client.calls) == 15  # 5 endpoints per pair
+        assert len(data["AUSDT"]["candles_30m"]) == 2
+        assert data["BUSDT"]["oi_data"][0]["openInterest"] == 5000.0
+
+    def test_signs_after_rate_limit_wait(self):
+        events = []
+
+        class Limiter:
+            async def acquire_async(self, endpoint):
+                events.append("acquire")
+
+            def observe(self, endpoint, headers):
+                pass
+
+        class Response:
+            status = 200
+            headers = {}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def raise_for_status(self):
+                pass
+
+            async def json(self, content_type=None):
+                return {"retCode": 0, "result": {"list": []}}
+
+        class Session:
+            def get(self, url, params=None, headers=None):
+                events.append(("send", headers["X-BAPI-TIMESTAMP"]))
+                return Response()
+
+        async def run():
+            client = AsyncBybitClient(max_concurrency=1, session=Session())
+            client.api_key, client.api_secret = "key", "secret"
+            client.rate_limiter = Limiter()
+            client._semaphore = asyncio.Semaphore(1)
+            with patch("services.async_bybit_client.build_auth_headers",
+                       lambda *args: events.append("sign") or {"X-BAPI-TIMESTAMP": "1"}):
+                return await client._make_request("/v5/market/time")
+
+        assert asyncio.run(run()) == {"list": []}
+        assert events == ["acquire", "sign", ("send", "1")]
@@ -0,0 +1,83 @@
+"""
+10D - Batch Indicator Tests
+The cross-sectional pass must agree with the per-pair detectors and never
+filter out a pair that analyze_candles would signal on
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services import indicator_calculator as ic
+from services.batch_indicators import compute_batch, select_candidates
+from services.candle_frame import CandleFrame
+
+STEP = 30 * 60_000
+
+
+def make_pair(n, seed, vol=0.01):
+    rng = random.Random(seed)
+    bars, price = [], 100.0
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.gauss(0, vol))
+        wick = abs(rng.gauss(0, vol)) * o
+        bars.append({"timestamp": i * STEP, "open": o, "high": max(o, c) + wick * rng.random() * 3,
+                     "low": min(o, c) - wick * rng.random() * 3, "close": c,
+                     "volume": rng.uniform(1, 10), "turnover": 1.0})
+        price = c
+    return bars
+
+
+def make_universe(pairs=300, n=100):
+    return {f"P{i}USDT": make_pair(n, seed=i, vol=0.003 + 0.002 * (i % 7)) for i in range(pairs)}
+
+
+class TestBatchIndicators:
+    """Vectorized prefilter over the pair universe"""
+
+    def test_detectors_match_per_pair(self):
+        universe = make_universe()
+        btc = make_pair(100, seed=999)
+        results = compute_batch({s: CandleFrame.from_dicts(c) for s, c in universe.items()}, btc)
+
+        for symbol, candles in universe.items():
+            batch = results[symbol]
+            assert batch["ema_signal"] == ic.detect_ema_crossover(candles)[0]
+            assert batch["pullback_signal"] == ic.detect_pullback(candles)[0]
+            assert batch["rsi_bb_signal"] == ic.detect_rsi_bb_reversal(candles)[0]
+            assert batch["pivot_trend"] == ic.calculate_pivot_trend(candles)[0]
+            assert batch["volume_confirmed"] == ic.check_volume_confirmation(candles)[0]
+            assert batch["rsi_crossover_btc"] == ic.detect_rsi_crossover_vs_btc(candles, btc)[0]
+            assert batch["atr"] == ic.calculate_atr(candles)[-1]
+
+            atr = ic.calculate_atr(candles)
+            assert batch["judas_signal"] == ic.detect_judas_swing(candles, ic.find_ranges_30m(candles), atr)[0]
+
+    def test_never_drops_a_signal(self):
+        universe = make_universe()
+        results = compute_batch(universe)
+        candidates = set(select_candidates(results))
+
+        signalled = set()
+        for symbol, candles in universe.items():
+            analysis = ic.analyze_candles(candles)
+            if (analysis["ema"]["signal"] or analysis["pullback"]["signal"] or analysis["rsi_bb"]["signal"]
+                    or analysis["institutional"]["judas_signal"]):
+                signalled.add(symbol)
+
+        assert signalled  # the universe actually exercises the detectors
+        assert signalled <= candidates
+        assert len(candidates) < len(universe)
+
+    def test_unstackable_pairs_stay_candidates(self):
+        universe = make_universe(pairs=5)
+        universe["NEWUSDT"] = make_pair(40, seed=77)
+        universe["DEADUSDT"] = None
+
+        results = compute_batch(universe)
+        order = list(universe)
+
+        assert results["NEWUSDT"] == {"batched": False, "candidate": True}
+        assert {"NEWUSDT", "DEADUSDT"} <= set(select_candidates(results, order))
@@ -0,0 +1,71 @@
+"""
+10D - Candle Frame Tests
+The columnar container must be a drop-in replacement for the list of candle dicts
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.candle_frame import CandleFrame, candle_array
+from services.bybit_client import parse_klines, parse_klines_columnar
+from services.indicator_calculator import analyze_candles
+
+
+def make_raw(n, seed=7, start_ts=1_700_000_000_000, step=1_800_000):
+    """Bybit-style newest-first kline rows"""
+    rng = random.Random(seed)
+    price = 100.0
+    rows = []
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.uniform(-0.02, 0.02))
+        h = max(o, c) * (1 + rng.uniform(0, 0.01))
+        l = min(o, c) * (1 - rng.uniform(0, 0.01))
+        v = rng.uniform(100, 1000)
+        rows.append([str(start_ts + i * step), f"{o:.4f}", f"{h:.4f}", f"{l:.4f}", f"{c:.4f}", f"{v:.2f}", f"{v * c:.2f}"])
+        price = c
+    return {"list": list(reversed(rows))}
+
+
+class TestCandleFrame:
+    """Tests for the columnar candle representation"""
+
+    def test_from_raw_matches_dict_parser(self):
+        raw = make_raw(50)
+        frame = parse_klines_columnar(raw)
+        candles = parse_klines(raw)
+
+        assert len(frame) == 50
+        assert frame == candles
+        assert frame[-1] == candles[-1]
+        assert frame[10:20].to_dicts() == candles[10:20]
+        assert [c["close"] for c in frame] == [c["close"] for c in candles]
+        assert isinstance(frame[0]["timestamp"], int)
+
+    def test_columns_are_zero_copy_views(self):
+        frame = parse_klines_columnar(make_raw(30))
+        tail = frame[-10:]
+
+        assert frame.close.flags["C_CONTIGUOUS"]
+        assert tail.close.base is not None
+        assert candle_array(tail, "close") is not None
+        assert tail.close[0] == frame.close[20]
+        assert CandleFrame.from_dicts(frame.to_dicts()) == frame
+
+    def test_empty(self):
+        frame = parse_klines_columnar(None)
+        assert not frame
+        assert len(frame) == 0
+        assert list(frame) == []
+
+    def test_analyze_candles_parity(self):
+        raw_30m, raw_4h, raw_btc = make_raw(100, 1), make_raw(60, 2), make_raw(100, 3)
+
+        from_lists = analyze_candles(parse_klines(raw_30m), parse_klines(raw_4h),
+                                     btc_candles=parse_klines(raw_btc))
+        from_frames = analyze_candles(parse_klines_columnar(raw_30m), parse_klines_columnar(raw_4h),
+                                      btc_candles=parse_klines_columnar(raw_btc))
+
+        assert from_frames == from_lists
@@ -0,0 +1,77 @@
+"""
+10D - Candle Resampler Tests
+Higher timeframes derived from 30m bars must match exchange-style aggregation
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.candle_resampler import resample, resample_ratio, CandleResampler
+from services.candle_frame import CandleFrame
+
+STEP_30M = 30 * 60_000
+STEP_4H = 240 * 60_000
+T0 = 1_700_000_000_000 - (1_700_000_000_000 % STEP_4H)
+
+
+def make_30m(n, start=T0, seed=3):
+    rng = random.Random(seed)
+    candles, price = [], 100.0
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.uniform(-0.01, 0.01))
+        candles.append({"timestamp": start + i * STEP_30M, "open": o, "high": max(o, c) + 0.5,
+                        "low": min(o, c) - 0.5, "close": c, "volume": rng.uniform(1, 10), "turnover": rng.uniform(100, 1000)})
+        price = c
+    return candles
+
+
+def naive_4h(candles):
+    groups = {}
+    for c in candles:
+        groups.setdefault(c["timestamp"] - c["timestamp"] % STEP_4H, []).append(c)
+    return [{"timestamp": ts, "open": g[0]["open"], "high": max(x["high"] for x in g), "low": min(x["low"] for x in g),
+             "close": g[-1]["close"], "volume": sum(x["volume"] for x in g), "turnover": sum(x["turnover"] for x in g)}
+            for ts, g in sorted(groups.items())]
+
+
+class TestCandleResampler:
+    """Tests for local multi-timeframe bars"""
+
+    def test_ratio(self):
+        assert resample_ratio("30", "240") == 8
+        assert resample_ratio("30", "60") == 2
+        assert resample_ratio("30", "W") is None
+        assert resample_ratio("240", "60") is None
+
+    def test_matches_naive_aggregation(self):
+        candles = make_30m(8 * 10 + 3)  # 10 full 4h bars + forming bar
+        bars = resample(candles, "240")
+        expected = naive_4h(candles)
+
+        assert len(bars) == 11
+        assert [b["timestamp"] for b in bars] == [e["timestamp"] for e in expected]
+        for b, e in zip(bars, expected):
+            for field in ("open", "high", "low", "close"):
+                assert b[field] == e[field]
+            assert abs(b["volume"] - e["volume"]) < 1e-9
+
+    def test_partial_leading_bucket_dropped(self):
+        candles = make_30m(20, start=T0 + 3 * STEP_30M)
+        bars = resample(CandleFrame.from_dicts(candles), "240")
+
+        assert bars[0]["timestamp"] == T0 + STEP_4H
+        assert all(b["timestamp"] % STEP_4H == 0 for b in bars)
+
+    def test_incremental_equals_full(self):
+        history = make_30m(8 * 30)
+        resampler = CandleResampler()
+
+        resampler.update("ETHUSDT", "30", "240", history[:200], 20)
+        for n in range(201, len(history) + 1):
+            incremental = resampler.update("ETHUSDT", "30", "240", history[n - 160:n], 20)
+            assert incremental == resample(history[:n], "240")[-20:]
+
+        assert resampler.get_stats()["incremental"] > 0
@@ -0,0 +1,110 @@
+"""
+10D - HTTP Pool Tests
+Checks the in-flight bound and stats of the shared request engine
+"""
+
+import time
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.http_pool import HttpPool, DEFAULT_HEADERS
+
+
+class SlowSession:
+    """Fake requests.Session that records concurrency"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return {"url": url, "params": params}
+
+
+class TestHttpPool:
+    """Tests for the bounded request engine"""
+
+    def test_default_headers_always_sent(self):
+        assert HttpPool().session.headers["User-Agent"] == DEFAULT_HEADERS["User-Agent"]
+        custom = HttpPool(headers={"X-Trace": "1"}).session.headers
+        assert custom["X-Trace"] == "1" and custom["User-Agent"] == DEFAULT_HEADERS["User-Agent"]
+
+    def test_in_flight_is_bounded(self):
+        pool = HttpPool(max_in_flight=3)
+        pool.session = SlowSession()
+
+        threads = [threading.Thread(target=pool.get, args=(f"http://x/{i}",)) for i in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = pool.get_stats()
+        assert pool.session.max_active <= 3
+        assert stats["peak_in_flight"] == pool.session.max_active
+        assert stats["completed"] == 12
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+        assert stats["peak_queued"] > 0
+
+    def test_requests_run_concurrently(self):
+        pool = HttpPool(max_in_flight=4)
+        pool.session = SlowSession(delay=0.1)
+
+        start = time.time()
+        threads = [threading.Thread(target=pool.get, args=("http://x",)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 4 calls of 100ms in parallel, not 400ms serialized
+        assert time.time() - start < 0.3
+
+    def test_failures_release_slot(self):
+        pool = HttpPool(max_in_flight=1)
+
+        class Broken:
+            def get(self, *args, **kwargs):
+                raise ConnectionError("down")
+
+        pool.session = Broken()
+        for _ in range(3):
+            try:
+                pool.get("http://x")
+            except ConnectionError:
+                pass
+
+        stats = pool.get_stats()
+        assert stats["failed"] == 3
+        assert stats["in_flight"] == 0
+
+    def test_header_factory_runs_once_a_slot_is_held(self):
+        pool = HttpPool(max_in_flight=1)
+        pool.session = SlowSession(delay=0.1)
+        signed_at = []
+
+        def sign():
+            signed_at.append(time.time())
+            return {"X-BAPI-TIMESTAMP": str(int(signed_at[-1] * 1000))}
+
+        start = time.time()
+        threads = [threading.Thread(target=pool.get, args=("http://x",), kwargs={"headers": sign}) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # The queued request signs after the first one released the only slot
+        assert len(signed_at) == 2
+        assert max(signed_at) - start >= 0.1
@@ -3,6 +3,7 @@ CryptoFastSignals - Indicator Tests
 Unit tests for indicator calculations
 """
 
+import random
 import pytest
 import sys
 import os
@@ -10,17 +11,22 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from services.indicator_calculator import (
     calculate_sma,
-    detect_sma_crossover,
     calculate_atr,
     calculate_pivot_trend,
-    check_volume_confirmation
+    check_volume_confirmation,
+    detect_ema_crossover
 )
+from services import indicator_calculator
 from services.sr_detector import (
     calculate_pivot_points,
     get_high_low_levels,
     check_sr_proximity,
-    get_sr_alignment
+    check_sr_proximity_batch,
+    get_sr_alignment,
+    SRLevelCache,
+    DAY_MS
 )
+from services import signal_scorer
 from services.signal_scorer import calculate_signal_score, get_score_rating
 
 
@@ -53,33 +59,50 @@ class TestSMACalculation:
         assert sma == [10, 20, 30]
 
 
-class TestSMACrossover:
-    """Tests for SMA crossover detection"""
+class TestEMACrossover:
+    """Tests for EMA 20/50 crossover detection"""
     
     def create_candles(self, closes):
         """Helper to create candle list from closes"""
         return [{"close": c, "high": c, "low": c, "open": c, "volume": 100} for c in closes]
     
+    def trend_reversal(self, step):
+        """60 bars trending against `step`, then 11 bars of 6x the move back (crosses on the last one)"""
+        closes = [100 - step * i for i in range(60)]
+        closes += [closes[-1] + 6 * step * j for j in range(1, 12)]
+        return closes
+    
     def test_long_crossover(self):
         """Test detection of bullish crossover"""
-        # Fast SMA crosses above Slow SMA
-        # Need enough data for SMA 21
-        closes = [100] * 25  # Initialize with flat prices
-        closes[-3] = 95  # Set up for crossover
-        closes[-2] = 98
-        closes[-1] = 105  # Fast now above slow
-        
-        candles = self.create_candles(closes)
-        signal, details = detect_sma_crossover(candles)
-        
-        # Verify we got the details
-        assert "sma_fast" in details
-        assert "sma_slow" in details
+        signal, details = detect_ema_crossover(self.create_candles(self.trend_reversal(0.5)))
+        
+        assert signal == "LONG"
+        assert details["ema_fast"] > details["ema_slow"]
+        assert details["macd_confirmed"] is True
+        
+        # One bar earlier the fast EMA is still below: no cross yet
+        signal, _ = detect_ema_crossover(self.create_candles(self.trend_reversal(0.5)[:-1]))
+        assert signal is None
+    
+    def test_short_crossover(self):
+        """Test detection of bearish crossover"""
+        signal, details = detect_ema_crossover(self.create_candles(self.trend_reversal(-0.5)))
+        
+        assert signal == "SHORT"
+        assert details["ema_fast"] < details["ema_slow"]
+        assert details["macd_confirmed"] is True
+    
+    def test_flat_market(self):
+        """Test no signal without a cross"""
+        signal, details = detect_ema_crossover(self.create_candles([100] * 60))
+        
+        assert signal is None
+        assert details["ema_fast"] == details["ema_slow"] == 100.0
     
     def test_insufficient_data(self):
         """Test with insufficient data"""
         candles = self.create_candles([100, 101, 102])
-        signal, details = detect_sma_crossover(candles)
+        signal, details = detect_ema_crossover(candles)
         
         assert signal is None
         assert "error" in details
@@ -176,6 +199,59 @@ class TestSRProximity:
         assert proximity["at_support"] is True
 
 
+class TestSRLevelCache:
+    """Daily S/R levels cached per (symbol, UTC day)"""
+    
+    class FakeClient:
+        def __init__(self):
+            self.calls = 0
+        
+        def get_klines(self, symbol, interval, limit):
+            self.calls += 1
+            rng = random.Random(symbol)
+            days = []
+            for d in range(limit):
+                base = 100 + rng.uniform(-5, 5)
+                days.append({"timestamp": d * DAY_MS, "open": base, "high": base + rng.uniform(0, 3),
+                             "low": base - rng.uniform(0, 3), "close": base + rng.uniform(-1, 1)})
+            return days
+    
+    def test_fetches_once_per_day_from_closed_candles(self):
+        """Same day hits the cache; rollover refetches; the forming day is excluded"""
+        client = self.FakeClient()
+        cache = SRLevelCache()
+        today = 29 * DAY_MS + 3_600_000  # last fetched candle (day 29) is still forming
+        
+        levels = cache.get_levels("ETHUSDT", client, now_ms=today)
+        assert cache.get_levels("ETHUSDT", client, now_ms=today + 60_000) is levels
+        assert client.calls == 1
+        
+        closed = self.FakeClient().get_klines("ETHUSDT", "D", 30)[:-1]
+        assert levels["raw"]["pivot"] == calculate_pivot_points(closed)
+        
+        cache.get_levels("ETHUSDT", client, now_ms=today + DAY_MS)
+        assert client.calls == 2
+        assert cache.get_stats()["rollovers"] == 1
+    
+    def test_batch_proximity_matches_per_symbol(self):
+        """Vectorized check_sr_proximity over many symbols"""
+        client = self.FakeClient()
+        cache = SRLevelCache()
+        symbols = [f"P{i}USDT" for i in range(40)]
+        levels = {s: cache.get_levels(s, client, now_ms=30 * DAY_MS) for s in symbols}
+        levels["EMPTYUSDT"] = {"resistances": [], "supports": []}
+        
+        rng = random.Random(1)
+        prices = {s: 100 + rng.uniform(-6, 6) for s in levels}
+        # A price exactly on a level is neither above nor below it
+        prices["P0USDT"] = levels["P0USDT"]["resistances"][0]["level"]
+        
+        batch = check_sr_proximity_batch(prices, levels)
+        for symbol, price in prices.items():
+            assert batch[symbol] == check_sr_proximity(price, levels[symbol])
+        assert cache.proximity(prices) == {s: batch[s] for s in symbols}
+
+
 class TestSRAlignment:
     """Tests for S/R alignment logic"""
     
@@ -207,8 +283,13 @@ class TestSRAlignment:
 class TestSignalScorer:
     """Tests for signal scoring"""
     
+    @pytest.fixture(autouse=True)
+    def no_ml_bonus(self, monkeypatch):
+        """Score the configured weights only (the ML bonus depends on ml_brain.json)"""
+        monkeypatch.setattr(signal_scorer, "get_ml_bonus", lambda **kwargs: 0)
+    
     def test_perfect_score(self):
-        """Test maximum score with all confirmations"""
+        """Test score with volume, pivot and S/R confirmations"""
         result = calculate_signal_score(
             signal_direction="LONG",
             volume_confirmed=True,
@@ -216,14 +297,14 @@ class TestSignalScorer:
             sr_alignment="ALIGNED"
         )
         
-        # 30 + 25 + 20 + 25 = 100
-        assert result["score"] == 100
+        # EMA crossover 35 + volume 15 + pivot 15 + S/R 20 = 85
+        assert result["score"] == 85
         assert result["confirmations"]["volume"] is True
         assert result["confirmations"]["pivot_trend"] is True
         assert result["confirmations"]["sr_aligned"] is True
     
-    def test_sma_only_score(self):
-        """Test minimum score with SMA only"""
+    def test_ema_only_score(self):
+        """Test minimum score with the EMA crossover only"""
         result = calculate_signal_score(
             signal_direction="LONG",
             volume_confirmed=False,
@@ -231,8 +312,8 @@ class TestSignalScorer:
             sr_alignment="NEUTRAL"
         )
         
-        # 30 only
-        assert result["score"] == 30
+        # 35 only
+        assert result["score"] == 35
     
     def test_misaligned_penalty(self):
         """Test score with S/R misalignment penalty"""
@@ -243,8 +324,8 @@ class TestSignalScorer:
             sr_alignment="MISALIGNED"
         )
         
-        # 30 + 25 + 20 - 15 = 60
-        assert result["score"] == 60
+        # 35 + 15 + 15 - 20 = 45
+        assert result["score"] == 45
     
     def test_rating_levels(self):
         """Test score rating levels"""
@@ -255,5 +336,115 @@ class TestSignalScorer:
         assert get_score_rating(30) == "WEAK"
 
 
+class TestNumpyBackend:
+    """The vectorized backend must reproduce the Python reference exactly"""
+
+    def _run(self, backend, closes, candles):
+        previous = indicator_calculator.get_indicator_backend()
+        indicator_calculator.set_indicator_backend(backend)
+        try:
+            return [
+                indicator_calculator.calculate_sma(closes, 20),
+                indicator_calculator.calculate_sma(closes, 1),
+                indicator_calculator.calculate_ema(closes, 9),
+                indicator_calculator.calculate_macd(closes),
+                indicator_calculator.calculate_bollinger_bands(closes),
+                indicator_calculator.calculate_rsi(closes),
+                indicator_calculator.calculate_atr(candles),
+            ]
+        finally:
+            indicator_calculator.set_indicator_backend(previous)
+
+    def test_matches_reference(self):
+        """Random walks of every length, including shorter than the warm-up"""
+        rng = random.Random(7)
+        for n in list(range(0, 40)) + [100, 250]:
+            closes, price = [], 100.0
+            for _ in range(n):
+                price *= 1 + rng.uniform(-0.02, 0.02)
+                closes.append(price)
+            candles = [{"high": c + rng.random(), "low": c - rng.random(), "close": c} for c in closes]
+
+            assert self._run("numpy", closes, candles) == self._run("python", closes, candles)
+
+    def test_flat_prices(self):
+        """No losses -> RSI pinned at 100, zero-width bands"""
+        closes = [50.0] * 40
+        candles = [{"high": 50.0, "low": 50.0, "close": 50.0}] * 40
+
+        result = self._run("numpy", closes, candles)
+        assert result == self._run("python", closes, candles)
+        assert result[5][-1] == 100
+        assert result[4]["upper"][-1] == result[4]["lower"][-1] == 50.0
+
+    def test_unknown_backend(self):
+        """Typos in INDICATOR_BACKEND fail loudly"""
+        with pytest.raises(ValueError):
+            indicator_calculator.set_indicator_backend("fortran")
+
+
+class TestFeatureContext:
+    """analyze_candles evaluates each shared feature once per pair"""
+
+    def test_each_feature_computed_once(self, monkeypatch):
+        rng = random.Random(11)
+        candles, price = [], 100.0
+        for i in range(100):
+            close = price * (1 + rng.uniform(-0.02, 0.02))
+            candles.append({"timestamp": i, "open": price, "high": max(price, close) + 0.3,
+                            "low": min(price, close) - 0.3, "close": close, "volume": 1.0 + i % 5})
+            price = close
+        btc = [dict(c, close=c["close"] * 2) for c in candles]
+        expected = indicator_calculator.analyze_candles(candles, btc_candles=btc)
+
+        calls = {}
+        for name in ("calculate_rsi", "calculate_atr", "calculate_macd", "detect_sfp", "find_ranges_30m"):
+            original = getattr(indicator_calculator, name)
+
+            def counted(*args, _name=name, _original=original, **kwargs):
+                calls[_name] = calls.get(_name, 0) + 1
+                return _original(*args, **kwargs)
+            monkeypatch.setattr(indicator_calculator, name, counted)
+
+        btc_ctx = indicator_calculator.FeatureContext(btc)
+        assert indicator_calculator.analyze_candles(candles, btc_candles=btc, btc_ctx=btc_ctx) == expected
+        assert calls == {"calculate_rsi": 2, "calculate_atr": 1, "calculate_macd": 1,
+                         "detect_sfp": 1, "find_ranges_30m": 1}
+
+        # A shared BTC context is reused by the next pair
+        indicator_calculator.analyze_candles(candles, btc_candles=btc, btc_ctx=btc_ctx)
+        assert calls["calculate_rsi"] == 3
+
+
+class TestBTCReference:
+    """BTC-relative features reuse one BTC context per scan"""
+
+    def test_shared_reference_matches_per_pair(self):
+        from services.btc_regime_tracker import BTCRegimeTracker
+        rng = random.Random(21)
+
+        def series(n):
+            price, out = 100.0, []
+            for i in range(n):
+                price *= 1 + rng.uniform(-0.02, 0.02)
+                out.append({"timestamp": i, "open": price, "high": price, "low": price, "close": price})
+            return out
+
+        btc = series(60)
+        reference = indicator_calculator.FeatureContext(btc)
+        tracker = BTCRegimeTracker()
+
+        for _ in range(10):
+            alt = series(60)
+            assert indicator_calculator.calculate_relative_strength(alt, btc, 14, btc_ctx=reference) == \
+                indicator_calculator.calculate_relative_strength(alt, btc, 14)
+            assert tracker.calculate_decoupling_score(alt, btc, btc_ref=reference) == \
+                tracker.calculate_decoupling_score(alt, btc)
+
+        # BTC returns, drop mask and stats were computed once for all ten pairs
+        keys = [k for k in reference._memo if k[0] in ("returns", "drops", "return_stats")]
+        assert sorted(keys) == [("drops", 14), ("return_stats", 20), ("returns", 14), ("returns", 20)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,66 @@
+"""
+10D - Institutional Data Tests
+Lazy trades/OI/LSR fetches and the split order-flow analysis
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.datasets import synthetic_universe
+from services.indicator_calculator import analyze_candles, analyze_order_flow
+from services.institutional_data import InstitutionalData, InstitutionalStats
+
+UNIVERSE = synthetic_universe(100, 4, seed=3)
+
+
+class CountingClient:
+    """Serves the synthetic universe and records every order-flow request"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_recent_trades(self, symbol, limit):
+        self.calls.append(("trades", symbol, limit))
+        return UNIVERSE["trades"][symbol]
+
+    def get_open_interest(self, symbol, period, limit):
+        self.calls.append(("oi", symbol, period, limit))
+        return UNIVERSE["oi"][symbol]
+
+    def get_long_short_ratio(self, symbol, period, limit):
+        self.calls.append(("lsr", symbol, period, limit))
+        return UNIVERSE["lsr"][symbol]
+
+
+class TestInstitutionalData:
+    """services/institutional_data.py"""
+
+    def test_fetches_on_first_access_only(self):
+        client, stats = CountingClient(), InstitutionalStats()
+        symbol = UNIVERSE["symbols"][0]
+        data = InstitutionalData(client, symbol, stats)
+        untouched = InstitutionalData(client, UNIVERSE["symbols"][1], stats)
+
+        assert client.calls == [] and data.fetched == []
+        assert data.oi_data is data.oi_data
+        assert data.lsr_data == UNIVERSE["lsr"][symbol]
+        assert client.calls == [("oi", symbol, "30min", 10), ("lsr", symbol, "30min", 10)]
+        assert untouched.fetched == []
+
+        assert stats.get_stats() == {"pairs": 2, "requests": 2, "trades": 0, "oi_data": 1,
+                                     "lsr_data": 1, "deferred_ratio": round(1 - 2 / 6, 3)}
+
+    def test_order_flow_merge_matches_full_analysis(self):
+        for symbol in UNIVERSE["symbols"]:
+            candles = UNIVERSE["candles"][symbol]
+            flow_inputs = (UNIVERSE["trades"][symbol], UNIVERSE["oi"][symbol], UNIVERSE["lsr"][symbol])
+            common = dict(candles_4h=UNIVERSE["candles_4h"][symbol], btc_candles=UNIVERSE["btc"])
+
+            full = analyze_candles(candles, recent_trades=flow_inputs[0], oi_data=flow_inputs[1],
+                                   lsr_data=flow_inputs[2], **common)
+            lazy = analyze_candles(candles, **common)
+            assert lazy["institutional"]["oi_latest"] is None and lazy["institutional"]["cvd"] == 0.0
+            lazy["institutional"].update(analyze_order_flow(candles, *flow_inputs))
+
+            assert lazy == full
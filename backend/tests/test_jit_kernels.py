@@ -0,0 +1,84 @@
+"""
+10D - JIT Kernel Tests
+Every test runs twice: through the kernels (compiled when Numba is installed,
+plain Python otherwise) and through the pure-Python paths. Both must match the
+reference implementations exactly.
+"""
+
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tests.helpers import make_candles
+from services import indicator_calculator as ic
+from services import indicator_numpy, jit_kernels
+from services.candle_frame import CandleFrame
+
+
+@pytest.fixture(params=[True, False], ids=["kernels", "python"])
+def kernels(request, monkeypatch):
+    monkeypatch.setattr(jit_kernels, "ENABLED", request.param)
+    return request.param
+
+
+def reference(fn, *args):
+    """Result of fn with the kernels switched off"""
+    enabled, jit_kernels.ENABLED = jit_kernels.ENABLED, False
+    try:
+        return fn(*args)
+    finally:
+        jit_kernels.ENABLED = enabled
+
+
+class TestJITKernels:
+    """Kernel and pure-Python paths agree bit for bit"""
+
+    def test_wilder_rsi(self, kernels):
+        rng = random.Random(4)
+        for n in (10, 15, 16, 100, 1000):
+            closes = [100 + rng.uniform(-5, 5) for _ in range(n)]
+            closes[n // 2:n // 2 + 20] = [closes[n // 2]] * len(closes[n // 2:n // 2 + 20])  # flat run
+            ic.set_indicator_backend("python")
+            try:
+                expected = ic.calculate_rsi(closes)
+            finally:
+                ic.set_indicator_backend("numpy")
+            assert indicator_numpy.calculate_rsi(closes) == expected
+
+    def test_judas_swing(self, kernels):
+        hits = 0
+        for seed in range(300):
+            candles = make_candles(60, seed=seed, vol=0.003)
+            ranges = ic.find_ranges_30m(candles)
+            for atr in (ic.calculate_atr(candles), [0.25], [0.0001]):
+                result = ic.detect_judas_swing(candles, ranges, atr)
+                assert result == reference(ic.detect_judas_swing, candles, ranges, atr)
+                assert ic.detect_judas_swing(CandleFrame.from_dicts(candles), ranges, atr) == result
+                hits += result[1].get("type") == "JUDAS_SWING"
+        assert hits
+
+    def test_candlestick_patterns(self, kernels):
+        rng = random.Random(8)
+        seen = set()
+        for _ in range(2000):
+            bars = []
+            for _ in range(2):
+                o, c = (round(100 + rng.uniform(-2, 2), 1) for _ in range(2))
+                bars.append({"open": o, "close": c, "high": max(o, c) + round(rng.uniform(0, 2), 1) * rng.randint(0, 1),
+                             "low": min(o, c) - round(rng.uniform(0, 2), 1) * rng.randint(0, 1)})
+            patterns = ic.detect_candlestick_patterns(bars)
+            assert patterns == reference(ic.detect_candlestick_patterns, bars)
+            seen.update(k for k, v in patterns.items() if v)
+        assert seen == set(jit_kernels.PATTERN_FLAGS[:-1])
+
+    def test_fibonacci_levels(self, kernels):
+        for seed in range(20):
+            candles = make_candles(200, seed=seed)
+            for period in (144, 500):
+                assert ic.calculate_fibonacci_levels(candles, period) == \
+                    reference(ic.calculate_fibonacci_levels, candles, period)
+        flat = [{"high": 1.0, "low": 1.0}] * 5
+        assert ic.calculate_fibonacci_levels(flat) == {}
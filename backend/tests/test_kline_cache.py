@@ -0,0 +1,229 @@
+"""
+10D - Kline Cache Tests
+Warm refreshes must download only new candles and match a full fetch
+"""
+
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services import kline_cache as kc
+from services.kline_cache import KlineCache
+from services.candle_store import CandleStore
+from services.candle_frame import CandleFrame
+
+STEP = 30 * 60_000
+T0 = 1_700_000_000_000 - (1_700_000_000_000 % STEP)
+
+
+class FakeExchange:
+    """Serves the latest n 30m candles; the last bar is still forming"""
+
+    def __init__(self, bars=200):
+        self.bars = bars
+        self.tick = 0
+        self.requested = []
+
+    def candle(self, i):
+        close = 100.0 + i + (self.tick * 0.1 if i == self.bars - 1 else 0)
+        return {"timestamp": T0 + i * STEP, "open": 100.0 + i, "high": close + 1,
+                "low": 99.0 + i, "close": close, "volume": 10.0, "turnover": 1000.0}
+
+    def fetch(self, n):
+        self.requested.append(n)
+        return [self.candle(i) for i in range(max(0, self.bars - n), self.bars)]
+
+    def now(self):
+        return (T0 + (self.bars - 1) * STEP + STEP // 2) / 1000
+
+
+class TestKlineCache:
+    """Incremental refresh behaviour"""
+
+    def test_incremental_refresh_matches_full_fetch(self, monkeypatch):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        cache = KlineCache()
+
+        assert cache.get("ETHUSDT", "30", 100, exchange.fetch) == exchange.fetch(100)[-100:]
+
+        # Forming bar moves, then two new bars open
+        exchange.tick = 5
+        exchange.bars += 2
+        exchange.requested.clear()
+        candles = cache.get("ETHUSDT", "30", 100, exchange.fetch)
+
+        assert exchange.requested == [4]  # 2 new bars + patched bar + skew margin
+        assert candles == exchange.fetch(100)
+        assert len(candles) == 100
+
+    def test_forming_bar_is_patched(self, monkeypatch):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        cache = KlineCache()
+
+        first = cache.get("ETHUSDT", "30", 50, exchange.fetch)
+        exchange.tick = 3
+        second = cache.get("ETHUSDT", "30", 50, exchange.fetch)
+
+        assert second[-1]["close"] == exchange.candle(exchange.bars - 1)["close"]
+        assert first[-1]["close"] != second[-1]["close"]  # earlier result not mutated
+        assert cache.get_stats()["full_fetches"] == 1
+
+    def test_gap_and_larger_limit_trigger_full_fetch(self, monkeypatch):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        cache = KlineCache()
+
+        cache.get("ETHUSDT", "30", 50, exchange.fetch)
+        assert len(cache.get("ETHUSDT", "30", 120, exchange.fetch)) == 120
+
+        # Offline longer than the requested window
+        exchange.bars += 150
+        exchange.requested.clear()
+        candles = cache.get("ETHUSDT", "30", 120, exchange.fetch)
+        assert exchange.requested == [120]
+        assert candles == exchange.fetch(120)
+        assert cache.get_stats()["full_fetches"] == 3
+
+    def test_warm_restart_fetches_only_gap(self, monkeypatch, tmp_path):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        store = CandleStore(str(tmp_path))
+
+        KlineCache(store=store).get("ETHUSDT", "30", 100, exchange.fetch)
+        assert store.last_timestamp("ETHUSDT", "30") == exchange.candle(exchange.bars - 2)["timestamp"]
+
+        # Restart three bars later: new process, same files
+        exchange.bars += 3
+        exchange.requested.clear()
+        cache = KlineCache(store=CandleStore(str(tmp_path)))
+        candles = cache.get("ETHUSDT", "30", 100, exchange.fetch)
+
+        assert exchange.requested == [6]  # 4 bars since the last closed one + patch + skew margin
+        assert candles == exchange.fetch(100)
+        assert cache.get_stats()["store_loads"] == 1
+        assert len(store.load("ETHUSDT", "30")) == 102  # closed bars only
+
+
+    def test_stats_and_invalidate_during_concurrent_fetches(self, monkeypatch):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        cache = KlineCache()
+        errors, done = [], threading.Event()
+
+        def scan(worker):
+            try:
+                for i in range(200):
+                    cache.get(f"P{worker}_{i % 40}USDT", "30", 20, exchange.fetch)
+            except Exception as e:
+                errors.append(e)
+
+        def observe():
+            try:
+                while not done.is_set():
+                    cache.get_stats()
+                    cache.invalidate("P0_1USDT")
+            except Exception as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=scan, args=(w,)) for w in range(8)]
+        observer = threading.Thread(target=observe)
+        observer.start()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        done.set()
+        observer.join()
+
+        assert errors == []
+        assert cache.get_stats()["series"] <= 8 * 40
+
+
+    def test_store_writes_only_newly_closed_bars(self, monkeypatch, tmp_path):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        store = CandleStore(str(tmp_path))
+        cache = KlineCache(store=store)
+
+        cache.get("ETHUSDT", "30", 100, exchange.fetch)
+        seeded = store.get_stats()["rows_written"]
+        assert seeded == 99  # closed bars of the first window
+
+        # Same bar still forming: nothing to write
+        for tick in range(1, 4):
+            exchange.tick = tick
+            cache.get("ETHUSDT", "30", 100, exchange.fetch)
+        assert store.get_stats()["rows_written"] == seeded
+
+        # One bar closes -> exactly one row appended
+        exchange.bars += 1
+        cache.get("ETHUSDT", "30", 100, exchange.fetch)
+        assert store.get_stats()["rows_written"] == seeded + 1
+        assert store.last_timestamp("ETHUSDT", "30") == exchange.candle(exchange.bars - 2)["timestamp"]
+
+
+    def test_columnar_path_builds_no_dicts(self, monkeypatch):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        cache = KlineCache()
+        # Raw-parsed frames carry no row dicts (like parse_klines_columnar)
+        fetch_columns = lambda n: CandleFrame(CandleFrame.from_dicts(exchange.fetch(n)).values.copy())
+
+        def no_dicts(self):
+            raise AssertionError("row dicts built on the columnar path")
+
+        monkeypatch.setattr(CandleFrame, "to_dicts", no_dicts)
+        first = cache.get("ETHUSDT", "30", 50, fetch_columns)
+        first_closes = first.close.tolist()
+        exchange.tick = 2
+        exchange.bars += 1
+        second = cache.get("ETHUSDT", "30", 50, fetch_columns)
+        monkeypatch.undo()
+
+        assert isinstance(second, CandleFrame)
+        assert second == exchange.fetch(50)
+        assert first.close.tolist() == first_closes  # frames already handed out never change
+        assert first.timestamp[-1] == second.timestamp[-2]
+
+    def test_dict_readers_share_rows_across_updates(self, monkeypatch):
+        exchange = FakeExchange()
+        monkeypatch.setattr(kc.time, "time", exchange.now)
+        cache = KlineCache()
+        fetch_columns = lambda n: CandleFrame(CandleFrame.from_dicts(exchange.fetch(n)).values.copy())
+
+        first = cache.get("ETHUSDT", "30", 50, fetch_columns, as_dicts=True)
+        exchange.tick = 4
+        second = cache.get("ETHUSDT", "30", 50, fetch_columns, as_dicts=True)
+
+        assert second == exchange.fetch(50)
+        assert all(a is b for a, b in zip(first[:-2], second[:-2]))  # closed bars: same dicts
+        assert second[-1] is not first[-1] and first[-1]["close"] != second[-1]["close"]
+
+
+class TestCandleStore:
+    """On-disk append-only candle files"""
+
+    def test_append_is_idempotent_and_torn_rows_ignored(self, tmp_path):
+        store = CandleStore(str(tmp_path))
+        exchange = FakeExchange(bars=10)
+        candles = exchange.fetch(10)
+
+        assert store.append("ETHUSDT", "30", candles[:6]) == 6
+        assert store.append("ETHUSDT", "30", candles[:8]) == 2
+        with open(store.path_for("ETHUSDT", "30"), "ab") as fh:
+            fh.write(b"\x00" * 13)
+
+        reopened = CandleStore(str(tmp_path))
+        assert reopened.load("ETHUSDT", "30") == candles[:8]
+        assert reopened.append("ETHUSDT", "30", candles) == 2
+        assert reopened.load("ETHUSDT", "30") == candles
+
+    def test_compaction(self, tmp_path):
+        store = CandleStore(str(tmp_path), max_rows=20, keep_rows=10)
+        candles = FakeExchange(bars=25).fetch(25)
+        store.append("ETHUSDT", "30", candles)
+
+        assert store.load("ETHUSDT", "30") == candles[-10:]
@@ -0,0 +1,290 @@
+"""
+10D - Parallel Scan Tests
+Parallel pair analysis must merge into active_signals exactly like the sequential scan
+"""
+
+import random
+import threading
+import time
+import sys
+import os
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.signal_generator import SignalGenerator
+from services.llm_trading_brain import LLMTradingBrain
+from services.rate_limiter import bybit_rate_limiter, PRIORITY_LOW
+
+PAIRS = ["AAAUSDT", "BBBUSDT", "CCCUSDT", "DDDUSDT", "EEEUSDT"]
+
+
+@pytest.fixture
+def generator():
+    with patch('services.signal_generator.DatabaseManager'), \
+         patch('services.signal_generator.BybitClient'), \
+         patch('services.signal_generator.MLPredictor'), \
+         patch('services.signal_generator.BTCRegimeTracker') as MockTracker:
+        gen = SignalGenerator()
+    MockTracker.return_value.detect_regime.return_value = ("TRENDING", {})
+    gen.btc_tracker = MockTracker.return_value
+    gen.system_ready = True
+    gen.monitored_pairs = list(PAIRS)
+    gen.ml_predictor = None
+    gen.ml_supervisor_agent = None
+    gen.bankroll_manager = None
+    gen._ticker_prefilter = lambda: list(gen.monitored_pairs)
+    gen._batch_prefilter = lambda symbols=None, candles=None: None
+    gen.cleanup_history = lambda: None
+    return gen
+
+
+def run_scan(gen, mode, workers=4):
+    """Scan with analyze_pair finishing in random order; returns (analysis threads, merge order)"""
+    threads, merged = {}, []
+    rng = random.Random(7)
+    delays = {s: rng.uniform(0, 0.03) for s in PAIRS}
+
+    def analyze_pair(symbol, candles=None):
+        time.sleep(delays[symbol])
+        threads[symbol] = (threading.current_thread().name, bybit_rate_limiter.current_priority())
+        if symbol == "CCCUSDT":
+            raise RuntimeError("boom")
+        if symbol == "DDDUSDT":
+            return None
+        return {"symbol": symbol}
+
+    def admit(symbol, signal, new_signals, persist=None):
+        merged.append(symbol)
+        if signal:
+            with gen._lock:
+                gen.active_signals[symbol] = signal
+            new_signals.append(signal)
+        return True
+
+    gen.analyze_pair = analyze_pair
+    gen._admit_signal = admit
+    gen.set_scan_mode(mode, workers)
+    with patch('services.signal_generator.ticker_snapshots'), \
+         patch('services.signal_generator.LLM_ENABLED', False):
+        new_signals = gen.scan_all_pairs()
+    return threads, merged, new_signals
+
+
+class TestParallelScan:
+    """SignalGenerator scan modes"""
+
+    def test_parallel_matches_sequential(self, generator):
+        seq_threads, seq_merged, seq_new = run_scan(generator, "sequential")
+        seq_active = list(generator.active_signals)
+        generator.active_signals.clear()
+
+        par_threads, par_merged, par_new = run_scan(generator, "parallel")
+
+        assert par_merged == seq_merged == ["AAAUSDT", "BBBUSDT", "DDDUSDT", "EEEUSDT"]
+        assert list(generator.active_signals) == seq_active == ["AAAUSDT", "BBBUSDT", "EEEUSDT"]
+        assert par_new == seq_new
+        assert generator.scan_stats["mode"] == "parallel"
+        assert generator.scan_stats["workers"] == 4
+
+        # Analysis ran on the pool, still at scan (low) priority
+        assert all(name.startswith("scan") for name, _ in par_threads.values())
+        assert {p for _, p in par_threads.values()} == {PRIORITY_LOW}
+        assert all(not name.startswith("scan") for name, _ in seq_threads.values())
+
+    def test_parallel_fetches_prefilter_klines_on_the_pool(self, generator):
+        spans, lock = {}, threading.Lock()
+
+        def get_klines(symbol, interval, limit, columnar=False):
+            if symbol == "BTCUSDT":
+                return None
+            start = time.perf_counter()
+            time.sleep(0.05)
+            with lock:
+                spans[symbol] = (start, time.perf_counter(), threading.current_thread().name,
+                                 bybit_rate_limiter.current_priority())
+            return [{"symbol": symbol}]
+
+        prefiltered = {}
+
+        def batch_prefilter(symbols=None, candles=None):
+            prefiltered.update(symbols=symbols, candles=candles)
+            return {}
+
+        generator.client.get_klines = get_klines
+        generator._batch_prefilter = batch_prefilter
+        generator.set_scan_mode("parallel", 5)
+        with patch('services.signal_generator.ticker_snapshots'), \
+             patch('services.signal_generator.SCAN_BATCH_INDICATORS', True), \
+             patch('services.signal_generator.STREAMING_INDICATORS_ENABLED', False):
+            generator.scan_all_pairs()
+
+        assert prefiltered["symbols"] == PAIRS
+        assert prefiltered["candles"] == {s: [{"symbol": s}] for s in PAIRS}
+        assert all(name.startswith("scan") and p == PRIORITY_LOW for _, _, name, p in spans.values())
+        # Every fetch started before the first one finished
+        assert max(start for start, _, _, _ in spans.values()) < min(end for _, end, _, _ in spans.values())
+
+    def test_llm_cache_under_concurrent_gates(self):
+        brain = LLMTradingBrain({})
+        errors = []
+
+        def gate(worker):
+            try:
+                for i in range(300):
+                    key = f"validate_{worker}_{i % 150}"
+                    if brain._get_from_cache(key) is None:
+                        brain._save_to_cache(key, {"approved": True})
+                    brain._check_rate_limit()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=gate, args=(w,)) for w in range(8)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads often enough to hit the eviction race
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        status = brain.get_status()
+        assert status["cache"]["entries"] == 100
+        assert status["rate_limit"]["requests_this_minute"] == brain.max_requests_per_minute
+
+    def test_set_scan_mode(self, generator):
+        generator.set_scan_mode("PARALLEL", 3)
+        assert (generator.scan_mode, generator.scan_workers) == ("parallel", 3)
+        with pytest.raises(ValueError):
+            generator.set_scan_mode("threads")
+        with pytest.raises(ValueError):
+            generator.set_scan_mode("parallel", 0)
+        assert generator.get_stats()["scan"]["configured_workers"] == 3
+
+    def test_staged_matches_sequential(self, generator):
+        _, seq_merged, seq_new = run_scan(generator, "sequential")
+        seq_active = list(generator.active_signals)
+        generator.active_signals.clear()
+
+        # Staged mode runs the analyze_pair stages, not analyze_pair itself
+        stage_threads = {}
+        persisted = []
+
+        def stage(name, fn):
+            def run(*args):
+                stage_threads.setdefault(name, set()).add(threading.current_thread().name)
+                return fn(*args)
+            return run
+
+        generator._fetch_pair_data = stage("fetch", lambda symbol, candles=None: {"symbol": symbol})
+        generator._analyze_pair_data = stage("analyze", lambda pair: None if pair["symbol"] == "DDDUSDT" else pair)
+        generator._score_pair = stage("score", lambda pair: 1 / 0 if pair["symbol"] == "CCCUSDT" else pair)
+        generator._gate_signal = stage("gate", lambda pair: {"symbol": pair["symbol"]})
+        generator.save_signal_to_db = persisted.append
+
+        merged = []
+
+        def admit(symbol, signal, new_signals, persist=None):
+            merged.append(symbol)
+            if signal:
+                with generator._lock:
+                    generator.active_signals[symbol] = signal
+                new_signals.append(signal)
+                persist(signal)
+            return True
+
+        generator.set_scan_mode("staged")
+        generator._admit_signal = admit
+        with patch('services.signal_generator.ticker_snapshots'), \
+             patch('services.signal_generator.LLM_ENABLED', False):
+            par_new = generator.scan_all_pairs()
+
+        assert merged == seq_merged
+        assert list(generator.active_signals) == seq_active
+        assert par_new == seq_new
+        assert generator.scan_stats["mode"] == "staged"
+        for name, threads in stage_threads.items():
+            assert all(t.startswith(f"{name}-") for t in threads)
+
+        generator.persist_pipeline.stop()
+        # One persist worker: DB writes land in merge order
+        assert [s["symbol"] for s in persisted] == seq_active
+        stats = generator.get_pipeline_stats()
+        assert stats["fetch"]["processed"] == 5
+        assert stats["analyze"]["dropped"] == 1
+        assert stats["score"]["errors"] == 1
+        assert stats["persist"]["processed"] == 3
+        generator.scan_pipeline.stop()
+        generator.kline_pipeline.stop()
+
+    def test_persist_failures_are_logged(self, generator, capsys):
+        saved = []
+
+        def save(signal):
+            if signal["symbol"] == "CCCUSDT":
+                raise RuntimeError("db down")
+            saved.append(signal["symbol"])
+
+        generator.save_signal_to_db = save
+        generator._get_scan_pipeline()
+        for symbol in PAIRS:
+            generator._persist_signal({"symbol": symbol})
+        generator.persist_pipeline.stop()
+
+        assert saved == [s for s in PAIRS if s != "CCCUSDT"]
+        assert "[DB ERROR] Persist stage failed for CCCUSDT: db down" in capsys.readouterr().out
+        generator.scan_pipeline.stop()
+        generator.kline_pipeline.stop()
+
+    def test_staged_prefilter_is_a_barrier_after_the_klines_stage(self, generator):
+        events, lock = [], threading.Lock()
+
+        def get_klines(symbol, interval, limit, columnar=False):
+            if symbol == "BTCUSDT":
+                return None
+            time.sleep(0.02)
+            with lock:
+                events.append(("klines", symbol, threading.current_thread().name))
+            return [{"symbol": symbol}]
+
+        def batch_prefilter(symbols=None, candles=None):
+            events.append(("prefilter", sorted(candles), threading.current_thread().name))
+            return {s: candles[s] for s in ("AAAUSDT", "EEEUSDT")}
+
+        fetched = {}
+
+        def fetch(symbol, candles=None):
+            fetched[symbol] = candles
+            return {"symbol": symbol}
+
+        generator.client.get_klines = get_klines
+        generator._batch_prefilter = batch_prefilter
+        generator._fetch_pair_data = fetch
+        generator._analyze_pair_data = lambda pair: pair
+        generator._score_pair = lambda pair: pair
+        generator._gate_signal = lambda pair: {"symbol": pair["symbol"]}
+        generator._admit_signal = lambda symbol, signal, new_signals, persist=None: new_signals.append(signal)
+        generator.set_scan_mode("staged")
+        with patch('services.signal_generator.ticker_snapshots'), \
+             patch('services.signal_generator.SCAN_BATCH_INDICATORS', True), \
+             patch('services.signal_generator.STREAMING_INDICATORS_ENABLED', False), \
+             patch('services.signal_generator.LLM_ENABLED', False):
+            new_signals = generator.scan_all_pairs()
+
+        # Every pair's candles came through the klines stage before the prefilter ran
+        assert [e[0] for e in events] == ["klines"] * 5 + ["prefilter"]
+        assert all(name.startswith("klines-") for _, _, name in events[:5])
+        assert events[-1][1] == sorted(PAIRS)
+        # Only the candidates entered the fetch stage, with the candles already fetched
+        assert fetched == {"AAAUSDT": [{"symbol": "AAAUSDT"}], "EEEUSDT": [{"symbol": "EEEUSDT"}]}
+        assert new_signals == [{"symbol": "AAAUSDT"}, {"symbol": "EEEUSDT"}]
+
+        stats = generator.get_pipeline_stats()
+        assert stats["klines"]["processed"] == 5
+        assert stats["fetch"]["processed"] == 2
+        for pipeline in (generator.kline_pipeline, generator.scan_pipeline, generator.persist_pipeline):
+            pipeline.stop()
@@ -0,0 +1,86 @@
+"""
+10D - Price Panel Tests
+Cross-asset metrics pair bars by open time, not by list position
+"""
+
+import random
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services import indicator_calculator as ic
+from services.btc_regime_tracker import BTCRegimeTracker
+from services.candle_frame import CandleFrame
+from services.price_panel import PricePanel
+
+STEP = 30 * 60_000
+
+
+def make_bars(n, seed, start=0):
+    rng = random.Random(seed)
+    bars, price = [], 100.0
+    for i in range(n):
+        c = price * (1 + rng.gauss(0, 0.01))
+        bars.append({"timestamp": (start + i) * STEP, "open": price, "high": max(price, c) + 0.1,
+                     "low": min(price, c) - 0.1, "close": c, "volume": 1.0, "turnover": 1.0})
+        price = c
+    return bars
+
+
+class TestPricePanel:
+    """Dense timestamp grid with forward-fill masks"""
+
+    def test_forward_fill_and_mask(self):
+        bars = make_bars(10, seed=1)
+        gappy = bars[:4] + bars[5:]
+        late = bars[6:]
+        panel = PricePanel.build({"A": gappy, "B": late}, bars=10)
+
+        a, b = panel.window("A"), panel.window("B")
+        assert a[4] == bars[3]["close"]  # forward-filled
+        assert not panel.observed[0, 4] and panel.observed[0, 5]
+        assert np.isnan(b[:6]).all() and b[-1] == bars[-1]["close"]
+
+        _, valid = panel.returns(9)
+        assert not valid[0, 3] and not valid[0, 4]  # both returns touching the missing bar
+        assert valid[0, 5]
+
+    def test_metrics_match_per_pair_when_aligned(self):
+        btc = make_bars(100, seed=0)
+        universe = {f"P{i}USDT": make_bars(100, seed=i) for i in range(1, 30)}
+        panel = PricePanel.build({**{s: CandleFrame.from_dicts(c) for s, c in universe.items()}, "BTCUSDT": btc})
+
+        rs = panel.relative_strength()
+        decoupling = panel.decoupling()
+        tracker = BTCRegimeTracker()
+        for symbol, alt in universe.items():
+            assert rs[symbol] == pytest.approx(ic.calculate_relative_strength(alt, btc, 14), abs=1e-12)
+            assert decoupling[symbol] == tracker.calculate_decoupling_score(alt, btc)
+            assert panel.metrics(symbol) == {"rs_score": rs[symbol], "decoupling_score": decoupling[symbol]}
+        assert panel.metrics("MISSINGUSDT") is None
+
+    def test_missing_bar_does_not_shift_pairing(self):
+        btc = make_bars(60, seed=0)
+        alt = [dict(b, close=b["close"] * 2) for b in btc]  # moves exactly with BTC
+        gappy = alt[:50] + alt[51:]
+
+        # Positional pairing would compare bar t+1 of the alt with bar t of BTC
+        assert BTCRegimeTracker().calculate_decoupling_score(gappy, btc) == 0.0
+        assert ic.calculate_relative_strength(gappy, btc, 14) == pytest.approx(0.0, abs=1e-12)
+
+        panel = PricePanel.build({"ALT": gappy, "BTCUSDT": btc})
+        assert panel.correlation()["ALT"] == pytest.approx(1.0)
+
+    def test_rsi_crossover_compares_same_bar_times(self):
+        btc = make_bars(60, seed=0)
+        alt = make_bars(61, seed=3)[1:]  # one bar ahead of BTC
+
+        shifted = ic.detect_rsi_crossover_vs_btc(alt, btc)
+        rsi_alt = ic.calculate_rsi([b["close"] for b in alt])
+        rsi_btc = ic.calculate_rsi([b["close"] for b in btc])
+        assert shifted[1]["rsi_alt"] == round(rsi_alt[-2], 2)
+        assert shifted[1]["rsi_alt_prev"] == round(rsi_alt[-3], 2)
+        assert shifted[1]["rsi_btc"] == round(rsi_btc[-1], 2)
@@ -0,0 +1,82 @@
+"""
+10D - Rate Limiter Tests
+Token buckets, exchange header feedback and priority classes
+"""
+
+import time
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.rate_limiter import RateLimiter, PRIORITY_HIGH, PRIORITY_LOW
+
+
+class TestRateLimiter:
+    """Tests for the shared token-bucket limiter"""
+
+    def test_bucket_limits_rate(self):
+        limiter = RateLimiter({"kline": (20, 5)})
+
+        start = time.monotonic()
+        for _ in range(15):
+            limiter.acquire("/v5/market/kline", PRIORITY_HIGH)
+
+        # 5 burst tokens, then 10 more at 20/s
+        assert time.monotonic() - start >= 0.45
+
+    def test_groups_are_independent(self):
+        limiter = RateLimiter({"kline": (1, 1), "tickers": (100, 10)})
+        limiter.acquire("/v5/market/kline", PRIORITY_HIGH)
+
+        start = time.monotonic()
+        limiter.acquire("/v5/market/tickers")
+        assert time.monotonic() - start < 0.05
+
+    def test_exchange_headers_block_until_reset(self):
+        limiter = RateLimiter({"tickers": (100, 10)})
+        reset_ms = int((time.time() + 0.3) * 1000)
+        limiter.observe("/v5/market/tickers", {
+            "X-Bapi-Limit-Status": "0",
+            "X-Bapi-Limit": "10",
+            "X-Bapi-Limit-Reset-Timestamp": str(reset_ms)
+        })
+
+        start = time.monotonic()
+        limiter.acquire("/v5/market/tickers", PRIORITY_HIGH)
+        assert time.monotonic() - start >= 0.2
+        assert limiter.get_stats()["tickers"]["server_limit"] == 10
+
+    def test_high_priority_beats_scanning(self):
+        limiter = RateLimiter({"kline": (10, 4)})
+        order = []
+
+        # Drain the bucket so both classes have to wait
+        for _ in range(4):
+            limiter.acquire("/v5/market/kline", PRIORITY_HIGH)
+
+        def worker(name, priority):
+            limiter.acquire("/v5/market/kline", priority)
+            order.append(name)
+
+        low = [threading.Thread(target=worker, args=(f"low{i}", PRIORITY_LOW)) for i in range(3)]
+        for t in low:
+            t.start()
+        time.sleep(0.02)
+        high = threading.Thread(target=worker, args=("high", PRIORITY_HIGH))
+        high.start()
+
+        for t in low + [high]:
+            t.join()
+
+        assert order[0] == "high"
+
+    def test_thread_priority_context(self):
+        limiter = RateLimiter({"kline": (100, 10)})
+        with limiter.priority(PRIORITY_HIGH):
+            limiter.acquire("/v5/market/kline")
+        limiter.acquire("/v5/market/kline")
+
+        stats = limiter.get_stats()["kline"]
+        assert stats["granted_high"] == 1
+        assert stats["granted_normal"] == 1
@@ -0,0 +1,68 @@
+"""
+10D - Scan Pipeline Tests
+Stage chaining, early drops, errors, backpressure and per-stage stats
+"""
+
+import threading
+import time
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.scan_pipeline import ScanPipeline
+
+
+class TestScanPipeline:
+    """services/scan_pipeline.py"""
+
+    def test_items_flow_through_every_stage(self):
+        pipeline = ScanPipeline([
+            ("double", lambda x: x * 2, 2),
+            ("drop_odd_input", lambda x: None if x % 4 else x, 1),
+            ("fail", lambda x: 1 / (x - 8), 3)
+        ], queue_size=4)
+        futures = [pipeline.submit(i) for i in range(6)]
+
+        assert futures[0].result(timeout=5) == -0.125
+        assert futures[1].result(timeout=5) is None
+        assert futures[2].result(timeout=5) == 1 / (4 - 8)
+        with pytest.raises(ZeroDivisionError):
+            futures[4].result(timeout=5)
+        pipeline.stop()
+
+        stats = pipeline.get_stats()
+        assert list(stats) == ["double", "drop_odd_input", "fail"]
+        assert stats["double"]["processed"] == 6 and stats["double"]["workers"] == 2
+        assert stats["drop_odd_input"]["dropped"] == 3
+        assert stats["fail"]["processed"] == 3 and stats["fail"]["errors"] == 1
+        assert all(s["queue_depth"] == 0 for s in stats.values())
+
+    def test_slow_stage_does_not_stall_earlier_stages(self):
+        release = threading.Event()
+        fetched = []
+
+        def fetch(x):
+            fetched.append(x)
+            return x
+
+        def gate(x):
+            release.wait(5)
+            return x
+
+        pipeline = ScanPipeline([("fetch", fetch, 1), ("gate", gate, 1)], queue_size=3).start()
+        futures = [pipeline.submit(i) for i in range(4)]
+
+        # One item held by the gate worker, three queued in front of it
+        deadline = time.time() + 5
+        while len(fetched) < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        assert fetched == [0, 1, 2, 3]
+        assert pipeline.get_stats()["gate"]["queue_depth"] == 3
+        assert not any(f.done() for f in futures)
+
+        release.set()
+        assert [f.result(timeout=5) for f in futures] == [0, 1, 2, 3]
+        assert pipeline.get_stats()["gate"]["max_depth"] == 3
+        pipeline.stop()
@@ -0,0 +1,76 @@
+"""
+10D - Single Flight Tests
+Duplicate requests must share one round trip
+"""
+
+import time
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.single_flight import SingleFlight, request_key
+from services.bybit_client import BybitClient
+
+
+class TestSingleFlight:
+    """Tests for request coalescing"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"list": [1, 2, 3]}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", fetch))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+        assert flight.get_stats()["shared_in_flight"] == 7
+
+    def test_freshness_window(self):
+        flight = SingleFlight()
+        calls = []
+        fetch = lambda: calls.append(1) or len(calls)
+
+        assert flight.do("k", fetch, ttl=0.2) == 1
+        assert flight.do("k", fetch, ttl=0.2) == 1
+        time.sleep(0.25)
+        assert flight.do("k", fetch, ttl=0.2) == 2
+
+        # No window -> only in-flight calls are shared
+        assert flight.do("other", fetch) == 3
+        assert flight.do("other", fetch) == 4
+
+    def test_failures_are_not_cached(self):
+        flight = SingleFlight()
+        assert flight.do("k", lambda: None, ttl=10) is None
+        assert flight.do("k", lambda: {"ok": True}, ttl=10) == {"ok": True}
+
+    def test_key_ignores_param_order(self):
+        assert request_key("/v5/market/kline", {"symbol": "BTCUSDT", "limit": 100}) == \
+            request_key("/v5/market/kline", {"limit": "100", "symbol": "BTCUSDT"})
+
+    def test_client_coalesces_duplicate_fetches(self):
+        client = BybitClient(single_flight=SingleFlight())
+        sent = []
+
+        def send(endpoint, params=None):
+            sent.append(endpoint)
+            return {"list": [{"openInterest": "10", "timestamp": "2"}, {"openInterest": "9", "timestamp": "1"}]}
+
+        client._send_request = send
+        first = client.get_open_interest("ETHUSDT", "30min", 10)
+        second = client.get_open_interest("ETHUSDT", "30min", 10)
+
+        assert sent == ["/v5/market/open-interest"]
+        assert first == second
@@ -0,0 +1,95 @@
+"""
+10D - Streaming Indicator Tests
+Incremental state must reproduce a full recomputation over the same bars
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services import indicator_calculator as ic
+from services.btc_regime_tracker import BTCRegimeTracker
+from services.candle_frame import CandleFrame
+from services.streaming_indicators import StreamingIndicatorRegistry
+
+STEP = 30 * 60_000
+
+
+def make_bars(n, seed=5):
+    rng = random.Random(seed)
+    bars, price = [], 100.0
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.uniform(-0.02, 0.02))
+        bars.append({"timestamp": i * STEP, "open": o, "high": max(o, c) + rng.random(),
+                     "low": min(o, c) - rng.random(), "close": c, "volume": rng.uniform(1, 10), "turnover": 1.0})
+        price = c
+    return bars
+
+
+def reference(window):
+    closes = [b["close"] for b in window]
+    ema_fast = ic.calculate_ema(closes, ic.EMA_FAST_PERIOD)
+    bb = ic.calculate_bollinger_bands(closes)
+    return {
+        "ema_fast": ema_fast[-1],
+        "ema_fast_prev": ema_fast[-2],
+        "ema_slow": ic.calculate_ema(closes, ic.EMA_SLOW_PERIOD)[-1],
+        "macd_hist": ic.calculate_macd(closes)["histogram"][-1],
+        "rsi": ic.calculate_rsi(closes)[-1],
+        "atr": ic.calculate_atr(window)[-1],
+        "bb_upper": bb["upper"][-1],
+        "bb_lower": bb["lower"][-1],
+    }
+
+
+class TestStreamingIndicators:
+    """O(1) per-bar updates"""
+
+    def test_matches_full_recompute(self):
+        bars = make_bars(160)
+        registry = StreamingIndicatorRegistry()
+
+        for n in range(2, len(bars) + 1):
+            snapshot = registry.update("ETHUSDT", "30", CandleFrame.from_dicts(bars[:n]))
+            for key, value in reference(bars[:n]).items():
+                assert snapshot[key] == value, (n, key)
+
+        assert registry.get_stats()["bars_committed"] == len(bars) - 1
+
+    def test_forming_bar_is_not_committed(self):
+        bars = make_bars(80)
+        registry = StreamingIndicatorRegistry()
+        registry.update("ETHUSDT", "30", bars)
+
+        # Same forming bar, new price: only peeked, never folded into the state
+        for close in (90.0, 110.0, bars[-1]["close"]):
+            moved = bars[:-1] + [dict(bars[-1], close=close, high=max(close, bars[-1]["high"]))]
+            snapshot = registry.update("ETHUSDT", "30", moved)
+            assert snapshot["rsi"] == reference(moved)["rsi"]
+            assert snapshot["ema_slow"] == reference(moved)["ema_slow"]
+
+        assert registry.get_stats()["bars_committed"] == len(bars) - 1
+
+    def test_gap_rebuilds_from_window(self):
+        bars = make_bars(300)
+        registry = StreamingIndicatorRegistry()
+        registry.update("ETHUSDT", "30", bars[:100])
+
+        window = bars[200:300]
+        snapshot = registry.update("ETHUSDT", "30", window)
+
+        assert registry.get_stats()["rebuilds"] == 1
+        assert snapshot["atr"] == reference(window)["atr"]
+
+    def test_analyze_candles_and_regime_consume_snapshot(self):
+        bars = make_bars(100)
+        snapshot = StreamingIndicatorRegistry().update("BTCUSDT", "30", bars)
+
+        plain = ic.analyze_candles(bars)
+        streamed = ic.analyze_candles(bars, indicators=snapshot)
+        for key in ("ema", "pullback", "rsi_bb", "pivot_trend", "macd"):
+            assert streamed[key] == plain[key]
+
+        assert BTCRegimeTracker().detect_regime(bars, indicators=snapshot) == BTCRegimeTracker().detect_regime(bars)
@@ -0,0 +1,50 @@
+"""
+10D - Structure Detector Tests
+Sorted-mean clustering and masked false-break checks must reproduce the loops
+they replaced
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tests.helpers import first_fit_levels, loop_false_break, make_candles
+from services import indicator_calculator as ic
+from services.candle_frame import CandleFrame
+from services.structure_detector import cluster_levels, find_false_break
+
+
+class TestStructureDetector:
+    """Levels and Judas Swing signals"""
+
+    def test_cluster_levels_match_first_fit(self):
+        rng = random.Random(3)
+        for lookback in (50, 500, 3000):
+            lows = [c["low"] for c in make_candles(lookback, seed=lookback)]
+            assert cluster_levels(lows) == first_fit_levels(lows)
+
+            # Quantized prices: exact ties and values on the tolerance boundary
+            ticks = [round(100 + rng.gauss(0, 0.3), 1) for _ in range(lookback)]
+            assert cluster_levels(ticks) == first_fit_levels(ticks)
+
+    def test_false_break_matches_loop(self):
+        hits = 0
+        for seed in range(300):
+            candles = make_candles(60, seed=seed, vol=0.003)
+            levels = ic.find_ranges_30m(candles)["supports"]
+            atr = ic.calculate_atr(candles)[-1]
+            found = find_false_break(candles, levels, atr, long=True)
+            expected = loop_false_break(candles, levels, atr)
+            assert (found["level"] if found else None) == (round(expected, 6) if expected is not None else None)
+            hits += found is not None
+        assert hits
+
+    def test_judas_swing_on_frames(self):
+        for seed in range(100):
+            candles = make_candles(80, seed=seed, vol=0.003)
+            ranges = ic.find_ranges_30m(candles)
+            atr = ic.calculate_atr(candles)
+            frame = CandleFrame.from_dicts(candles)
+            assert ic.find_ranges_30m(frame) == ranges
+            assert ic.detect_judas_swing(frame, ranges, atr) == ic.detect_judas_swing(candles, ranges, atr)
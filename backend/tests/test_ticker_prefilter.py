@@ -0,0 +1,145 @@
+"""
+10D - Ticker Prefilter Tests
+Skip/survive verdicts from the ticker snapshot and the last batch pass state
+"""
+
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.datasets import synthetic_universe
+from services.batch_indicators import compute_batch
+from services.indicator_calculator import analyze_candles
+from services.ticker_prefilter import TickerPrefilter, BAR_MS
+from services.ticker_snapshot import TickerSnapshot
+
+BAR_TS = 1_700_000_000_000
+NOW = BAR_TS + BAR_MS // 2  # Same forming bar as the recorded pass
+
+
+def batch_result(candidate=False):
+    return {"batched": True, "candidate": candidate}
+
+
+def snapshot(**prices):
+    tickers = {
+        symbol: {"symbol": symbol, "lastPrice": str(price), "turnover24h": str(turnover), "price24hPcnt": str(change)}
+        for symbol, (price, turnover, change) in prices.items()
+    }
+    return TickerSnapshot(1, 1.0, tickers, {s: float(t["lastPrice"]) for s, t in tickers.items()})
+
+
+def recorded(results, close=115.0):
+    prefilter = TickerPrefilter(min_turnover=1_000_000, force_change=0.10)
+    candles = {s: [{"timestamp": BAR_TS, "open": close, "high": close, "low": close, "close": close, "volume": 1.0,
+                   "turnover": close}]
+               for s in results}
+    prefilter.record(results, candles)
+    return prefilter
+
+
+class TestTickerPrefilter:
+    """services/ticker_prefilter.py"""
+
+    def test_verdicts(self):
+        prefilter = recorded({"QUIET": batch_result(), "CAND": batch_result(candidate=True)})
+        rich = 5_000_000
+        snap = snapshot(
+            QUIET=(115.1, rich, 0.01),
+            CAND=(115.0, rich, 0.01),
+            NEW=(115.0, rich, 0.01),
+            THIN=(115.0, 10_000, 0.01),
+            PUMP=(115.0, rich, 0.25),
+        )
+        # NEW has no recorded state yet
+        assert prefilter._verdict(snap.get("QUIET"), prefilter._state["QUIET"], NOW) == "recheck"
+        assert prefilter._verdict(snap.get("CAND"), prefilter._state["CAND"], NOW) == "candidate"
+        assert prefilter._verdict(snap.get("NEW"), None, NOW) == "no_state"
+        assert prefilter._illiquid(snap.get("THIN")) and not prefilter._illiquid(snap.get("NEW"))
+        assert prefilter._verdict(snap.get("PUMP"), prefilter._state["QUIET"], NOW) == "momentum"
+        assert prefilter._verdict(None, prefilter._state["QUIET"], NOW) == "no_ticker"
+        assert prefilter._verdict(snap.get("QUIET"), prefilter._state["QUIET"], BAR_TS + BAR_MS) == "new_bar"
+
+    def test_recheck_tracks_the_forming_bar_range(self):
+        prefilter = recorded({"QUIET": batch_result()})
+        for price in (116.0, 113.5, 115.0):
+            prefilter.select(["QUIET"], snapshot(QUIET=(price, 5_000_000, 0.0)), now_ms=NOW)
+        state = prefilter._state["QUIET"]
+        assert (state["high"], state["low"]) == (116.0, 113.5)
+
+    def test_new_bar_forces_a_fetch(self):
+        prefilter = recorded({"QUIET": batch_result()})
+        snap = snapshot(QUIET=(115.0, 5_000_000, 0.01))
+        assert prefilter.select(["QUIET"], snap, now_ms=NOW) == []
+        assert prefilter.select(["QUIET"], snap, now_ms=BAR_TS + BAR_MS) == ["QUIET"]
+        assert prefilter.get_stats()["reasons"] == {"new_bar": 1}
+
+    def test_select_keeps_order_and_reports_skip_ratio(self):
+        prefilter = recorded({"A": batch_result(), "C": batch_result(candidate=True)})
+        snap = snapshot(A=(115.0, 5_000_000, 0.0), B=(1.0, 100, 0.0), C=(115.0, 5_000_000, 0.0))
+
+        assert prefilter.select(["D", "C", "B", "A"], snap, now_ms=NOW) == ["D", "C"]
+        stats = prefilter.get_stats()
+        assert stats["pairs"] == 4 and stats["skipped"] == 1 and stats["skip_ratio"] == 0.25
+        assert stats["illiquid"] == 1
+        assert stats["reasons"] == {"no_ticker": 1, "candidate": 1, "settled": 1}
+        assert stats["tracked"] == 2
+
+        # The turnover floor is opt-in: off, a thin pair is judged like any other
+        assert TickerPrefilter(min_turnover=0).select(["B"], snap, now_ms=NOW) == ["B"]
+
+        # No ticker table: nothing is skipped
+        assert prefilter.select(["A", "B"], TickerSnapshot(0, 0.0, {}, {})) == ["A", "B"]
+
+    def test_unbatched_pairs_lose_their_state(self):
+        prefilter = recorded({"A": batch_result()})
+        prefilter.record({"A": {"batched": False, "candidate": True}}, {"A": []})
+        assert prefilter.get_stats()["tracked"] == 0
+
+
+def flagged(analysis):
+    """Entry detectors analyze_pair turns into signals"""
+    return any((analysis["ema"]["signal"], analysis["pullback"]["signal"],
+                analysis["rsi_bb"]["signal"], analysis["institutional"]["judas_signal"]))
+
+
+class TestTickerPrefilterParity:
+    """select() never drops a pair analyze_candles flags on the data it saw"""
+
+    def test_forming_bar_walks(self):
+        universe = synthetic_universe(100, 50, seed=11)
+        rng = random.Random(5)
+        skipped = flagged_pairs = 0
+        for trial in range(20):
+            prefilter = TickerPrefilter(min_turnover=0, force_change=1.0)
+            opened, paths = {}, {}
+            for symbol in universe["symbols"]:
+                candles = [dict(c) for c in universe["candles"][symbol]]
+                bar = candles[-1]
+                atr = sum(c["high"] - c["low"] for c in candles[-15:-1]) / 14
+                # Last prices seen during the forming bar, the batch pass after the first three
+                path = [bar["open"]]
+                for _ in range(8):
+                    path.append(path[-1] + rng.gauss(0, 0.3) * atr)
+                bar.update(close=path[2], high=max(path[:3]), low=min(path[:3]))
+                opened[symbol], paths[symbol] = candles, path
+
+            prefilter.record(compute_batch(opened), opened)
+            now = opened[universe["symbols"][0]][-1]["timestamp"] + BAR_MS // 2
+            for step in range(3, 9):
+                snap = snapshot(**{s: (paths[s][step], 5_000_000, 0.0) for s in universe["symbols"]})
+                survivors = set(prefilter.select(universe["symbols"], snap, now_ms=now))
+
+            for symbol in universe["symbols"]:
+                candles = [dict(c) for c in opened[symbol]]
+                path = paths[symbol]
+                candles[-1].update(close=path[-1], high=max(path), low=min(path))
+                if flagged(analyze_candles(candles)):
+                    flagged_pairs += 1
+                    assert symbol in survivors, (trial, symbol)
+                elif symbol not in survivors:
+                    skipped += 1
+
+        # The check is not vacuous: pairs fire and quiet ones are still skipped
+        assert flagged_pairs > 0 and skipped > 0
@@ -0,0 +1,61 @@
+"""
+10D - Ticker Snapshot Tests
+One network call per tick, versioned map, age-based refresh
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.ticker_snapshot import TickerSnapshotService
+
+
+class FakeClient:
+    def __init__(self, tickers):
+        self.tickers = tickers
+        self.calls = 0
+
+    def get_all_tickers(self):
+        self.calls += 1
+        return self.tickers
+
+
+class TestTickerSnapshot:
+    """Tests for the shared ticker table"""
+
+    def test_indexed_and_versioned(self):
+        client = FakeClient([
+            {"symbol": "BTCUSDT", "lastPrice": "65000", "price24hPcnt": "-0.01"},
+            {"symbol": "ETHUSDT", "lastPrice": "3000"}
+        ])
+        service = TickerSnapshotService(client)
+
+        snapshot = service.refresh()
+        assert snapshot.version == 1
+        assert snapshot.price("BTCUSDT") == 65000.0
+        assert snapshot.get("ETHUSDT")["lastPrice"] == "3000"
+        assert snapshot.age < 1
+        assert service.refresh().version == 2
+
+    def test_readers_share_fresh_snapshot(self):
+        client = FakeClient([{"symbol": "BTCUSDT", "lastPrice": "1"}])
+        service = TickerSnapshotService(client, max_age=60)
+
+        for _ in range(5):
+            service.get_price("BTCUSDT")
+        assert client.calls == 1
+
+        # Stale for this reader -> refresh
+        service.get_snapshot(max_age=0)
+        assert client.calls == 2
+
+    def test_failed_refresh_keeps_previous(self):
+        client = FakeClient([{"symbol": "BTCUSDT", "lastPrice": "1"}])
+        service = TickerSnapshotService(client)
+        service.refresh()
+
+        client.tickers = []
+        snapshot = service.refresh()
+        assert snapshot.version == 1
+        assert snapshot.price("BTCUSDT") == 1.0
+        assert service.get_stats()["failures"] == 1